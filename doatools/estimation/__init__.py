@@ -1,10 +1,13 @@
 from .music import MUSIC, RootMUSIC1D
 from .min_norm import MinNorm
-from .esprit import Esprit1D
+from .esprit import Esprit1D, Esprit2D
 from .beamforming import BartlettBeamformer, MVDRBeamformer
-from .sparse import SparseCovarianceMatching, GroupSparseEstimator
-from .ml import AMLEstimator, CMLEstimator, WSFEstimator
+from .sparse import SparseCovarianceMatching, GroupSparseEstimator, SBLEstimator
+from .ml import AMLEstimator, CMLEstimator, WSFEstimator, MLStartResult
+from .core import TopKPeakFinder
 from .grid import FarField1DSearchGrid, FarField2DSearchGrid, NearField2DSearchGrid
 from .coarray import CoarrayACMBuilder1D
 from .preprocessing import spatial_smooth, l1_svd
 from .source_number import aic, mdl, sorte
+from .streaming import StreamingCovariance, StreamingEstimator
+from .subspace_tracking import PASTTracker, PASTdTracker
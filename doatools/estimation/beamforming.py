@@ -1,5 +1,17 @@
 import numpy as np
-from .core import SpectrumBasedEstimatorBase, ensure_covariance_size
+from .core import SpectrumBasedEstimatorBase, ensure_covariance_size, \
+                  ensure_covariance_batch_size
+
+def _left_multiply(R, A):
+    """Computes R @ A, where R can be a stack of matrices.
+
+    Because A is shared, the stacked matrices are concatenated vertically so
+    that only one large matrix multiplication is required.
+    """
+    if R.ndim == 2:
+        return R @ A
+    n, m, _ = R.shape
+    return (R.reshape((n * m, m)) @ A).reshape((n, m, -1))
 
 def f_bartlett(A, R):
     r"""Computes the spectrum output of the Bartlett beamformer.
@@ -12,24 +24,38 @@ def f_bartlett(A, R):
         A: m x k steering matrix of candidate direction-of-arrivals, where
             m is the number of sensors and k is the number of candidate
             direction-of-arrivals.
-        R: m x m covariance matrix.
+        R: m x m covariance matrix. Can also be a T x m x m stack of
+            covariance matrices, in which case a T x k matrix is returned.
     """
-    return np.sum(A.conj() * (R @ A), axis=0).real
+    return np.sum(A.conj() * _left_multiply(R, A), axis=-2).real
 
 def f_mvdr(A, R):
-    r"""Compute the spectrum output of the Bartlett beamformer.
+    r"""Compute the spectrum output of the MVDR beamformer.
 
     .. math::
         P_{\mathrm{MVDR}}(\theta)
         = \frac{1}{\mathbf{a}(\theta)^H \mathbf{R}^{-1} \mathbf{a}(\theta)}
 
+    :math:`\mathbf{R}^{-1} \mathbf{a}(\theta)` is obtained with
+    :func:`numpy.linalg.solve`. If :math:`\mathbf{R}` (or any matrix in the
+    stack) is singular, the pseudo-inverse of :math:`\mathbf{R}` is used
+    instead. The same solver is used for a single covariance matrix and for
+    a stack of covariance matrices.
+
     Args:
         A: m x k steering matrix of candidate direction-of-arrivals, where
             m is the number of sensors and k is the number of candidate
             direction-of-arrivals.
-        R: m x m covariance matrix.
+        R: m x m covariance matrix. Can also be a T x m x m stack of
+            covariance matrices, in which case a T x k matrix is returned.
     """
-    return 1.0 / np.sum(A.conj() * np.linalg.lstsq(R, A, None)[0], axis=0).real
+    try:
+        # Broadcasts A explicitly so that it is not treated as a stack of
+        # vectors.
+        X = np.linalg.solve(R, np.broadcast_to(A, R.shape[:-2] + A.shape))
+    except np.linalg.LinAlgError:
+        X = _left_multiply(np.linalg.pinv(R), A)
+    return 1.0 / np.sum(A.conj() * X, axis=-2).real
 
 class BartlettBeamformer(SpectrumBasedEstimatorBase):
     """Creates a Barlett-beamformer based estimator.
@@ -40,6 +66,10 @@ class BartlettBeamformer(SpectrumBasedEstimatorBase):
     :meth:`~doatools.estimation.beamforming.f_bartlett`, and the source
     locations are estimated by identifying the peaks.
 
+    For uniform linear arrays, the spectrum can be computed with FFTs. See the
+    ``fft_spectrum`` option of
+    :class:`~doatools.estimation.core.SpectrumBasedEstimatorBase`.
+
     Args:
         array (~doatools.model.arrays.ArrayDesign): Array design.
         wavelength (float): Wavelength of the carrier wave.
@@ -94,7 +124,22 @@ class BartlettBeamformer(SpectrumBasedEstimatorBase):
               ``True``.
         """
         ensure_covariance_size(R, self._array)
-        return self._estimate(lambda A: f_bartlett(A, R), k, **kwargs)
+        return self._estimate(
+            lambda A: f_bartlett(A, R), k,
+            f_sp_fft=lambda ev: ev.evaluate_quadratic(R), **kwargs
+        )
+
+    def estimate_batch(self, Rs, k, **kwargs):
+        """Estimates the source locations from a stack of covariance matrices.
+
+        See :meth:`~doatools.estimation.core.SpectrumBasedEstimatorBase.estimate_batch`
+        for more details.
+        """
+        ensure_covariance_batch_size(Rs, self._array)
+        return self._estimate_batch(
+            lambda A: f_bartlett(A, Rs), k,
+            f_sp_fft=lambda ev: ev.evaluate_quadratic(Rs), **kwargs
+        )
 
 class MVDRBeamformer(SpectrumBasedEstimatorBase):
     """Creates a MVDR-beamformer based estimator.
@@ -159,3 +204,12 @@ class MVDRBeamformer(SpectrumBasedEstimatorBase):
         """
         ensure_covariance_size(R, self._array)
         return self._estimate(lambda A: f_mvdr(A, R), k, **kwargs)
+
+    def estimate_batch(self, Rs, k, **kwargs):
+        """Estimates the source locations from a stack of covariance matrices.
+
+        See :meth:`~doatools.estimation.core.SpectrumBasedEstimatorBase.estimate_batch`
+        for more details.
+        """
+        ensure_covariance_batch_size(Rs, self._array)
+        return self._estimate_batch(lambda A: f_mvdr(A, Rs), k, **kwargs)
@@ -1,8 +1,13 @@
 from collections import namedtuple
+from functools import lru_cache
 from abc import ABC, abstractmethod
 import numpy as np
 from scipy.signal import find_peaks
-from scipy.ndimage import maximum_filter
+from scipy.ndimage import maximum_filter, binary_erosion
+from ..model.arrays import UniformLinearArray
+from ..model.steering_cache import get_default_steering_cache
+from ..utils.math import abs_squared
+from .grid import FarField1DSearchGrid
 
 # Helper functions for validating inputs.
 def ensure_covariance_size(R, array):
@@ -17,6 +22,19 @@ def ensure_covariance_size(R, array):
             .format((m, m), R.shape)
         )
 
+def ensure_covariance_batch_size(Rs, array):
+    """Ensures that Rs is a stack of covariance matrices matching the given
+    array design."""
+    m = array.size
+    if Rs.ndim != 3:
+        raise ValueError('Expecting a stack of matrices.')
+    if Rs.shape[1] != m or Rs.shape[2] != m:
+        raise ValueError(
+            'The shape of the covariance matrices does not match the array '
+            'size. Expected shape is {0}. Got {1}'
+            .format((Rs.shape[0], m, m), Rs.shape)
+        )
+
 def ensure_n_resolvable_sources(k, max_k):
     """Checks if the number of expected sources exceeds the maximum resolvable sources."""
     if k > max_k:
@@ -34,22 +52,512 @@ def find_peaks_simple(x):
         y = maximum_filter(x, 3)
         return np.where(x == y)
 
+class TopKPeakFinder:
+    """Creates a vectorized peak finder that directly locates the k largest
+    peaks.
+
+    Unlike :meth:`find_peaks_simple`, which delegates to
+    :func:`scipy.signal.find_peaks` or :func:`scipy.ndimage.maximum_filter`,
+    this peak finder identifies peaks with NumPy comparisons between
+    neighboring points, and selects the k largest peaks with
+    :func:`numpy.argpartition` instead of a full sort. It can also process a
+    batch of spectra at once.
+
+    Following :meth:`find_peaks_simple`, the two end points of 1D spectra are
+    never reported as peaks, while the boundary points of N-D spectra are
+    compared only with their existing neighbors.
+
+    An instance of this class can be passed to the ``peak_finder`` argument of
+    :class:`SpectrumBasedEstimatorBase`, in which case the top-k selection
+    is used directly by the estimator.
+
+    Args:
+        plateau (str): Specifies how plateaus (neighboring points sharing the
+            same value) are handled:
+
+            * ``'first'`` - Only the first point of a plateau is reported. For
+              1D spectra, a plateau is a peak only if the values on both sides
+              of the plateau are smaller. For N-D spectra, ties are broken in
+              the row-major order of the grid points. This is the default
+              value.
+            * ``'all'`` - All points of a plateau are reported. For N-D spectra,
+              this is equivalent to the behavior of :meth:`find_peaks_simple`.
+            * ``'none'`` - Plateaus are ignored and only strict local maxima are
+              reported.
+    """
+
+    def __init__(self, plateau='first'):
+        if plateau not in ['first', 'all', 'none']:
+            raise ValueError("Plateau mode must be 'first', 'all', or 'none'.")
+        self._plateau = plateau
+
+    @property
+    def plateau(self):
+        """Retrieves the plateau handling mode."""
+        return self._plateau
+
+    def __call__(self, x):
+        """Finds all the peaks in the given spectrum.
+
+        Args:
+            x (~numpy.ndarray): A spectrum. Can be multi-dimensional.
+
+        Returns:
+            tuple: A tuple of index arrays, one for each dimension of ``x``,
+            representing the peak locations. This is compatible with the output
+            of :meth:`find_peaks_simple`.
+        """
+        return np.nonzero(self.find_peaks_batch(x[np.newaxis])[0])
+
+    def find_peaks_batch(self, X):
+        """Finds the peaks in a batch of spectra.
+
+        Args:
+            X (~numpy.ndarray): A T x d_1 x ... x d_n array storing T spectra.
+
+        Returns:
+            ~numpy.ndarray: A boolean array of the same shape of ``X``, where
+            ``True`` marks the peak locations.
+        """
+        if X.ndim == 2:
+            return self._find_peaks_batch_1d(X)
+        else:
+            return self._find_peaks_batch_nd(X)
+
+    def _find_peaks_batch_1d(self, X):
+        n, k = X.shape
+        mask = np.zeros(X.shape, dtype=np.bool_)
+        if k < 3:
+            return mask
+        d = np.diff(X, axis=1)
+        nz = d != 0
+        if self._plateau == 'none' or nz.all():
+            # Fast path: only strict local maxima need to be considered.
+            mask[:, 1:-1] = (d[:, :-1] > 0) & (d[:, 1:] < 0)
+            return mask
+        rows = np.arange(n)[:, np.newaxis]
+        cols = np.arange(k - 1)
+        # Slope to the left of a plateau: forward fill the non-zero
+        # differences.
+        i_left = np.maximum.accumulate(np.where(nz, cols, 0), axis=1)
+        d_left = d[rows, i_left]
+        # Slope to the right of a plateau: backward fill the non-zero
+        # differences.
+        i_right = np.where(nz, cols, k - 2)[:, ::-1]
+        i_right = np.minimum.accumulate(i_right, axis=1)[:, ::-1]
+        d_right = d[rows, i_right]
+        # The i-th point (0 < i < k - 1) uses d[i - 1] on the left and d[i] on
+        # the right.
+        peaks = (d_left[:, :-1] > 0) & (d_right[:, 1:] < 0)
+        if self._plateau == 'first':
+            peaks &= nz[:, :-1]
+        mask[:, 1:-1] = peaks
+        return mask
+
+    def _find_peaks_batch_nd(self, X):
+        ndim = X.ndim - 1
+        # Pad the grid dimensions with -inf so that boundary points are only
+        # compared with their existing neighbors.
+        Xp = np.pad(X, [(0, 0)] + [(1, 1)] * ndim, 'constant',
+                    constant_values=-np.inf)
+        # Instead of comparing each point with all its 3^n - 1 neighbors, we
+        # compute the maximum over the neighbors preceding (and following)
+        # each point in the row-major order with separable reductions,
+        # starting from the last dimension.
+        box, prev, succ = Xp, None, None
+        for d in range(ndim, 0, -1):
+            lower, center, upper = [
+                box[(slice(None),) * d + (slice(o, o + X.shape[d]),)]
+                for o in range(3)
+            ]
+            if prev is None:
+                prev, succ = lower, upper
+            else:
+                prev = np.maximum(lower, prev[(slice(None),) * d + (slice(1, -1),)])
+                succ = np.maximum(upper, succ[(slice(None),) * d + (slice(1, -1),)])
+            if d > 1:
+                box = np.maximum(np.maximum(lower, center), upper)
+        if self._plateau == 'first':
+            return (X > prev) & (X >= succ)
+        elif self._plateau == 'all':
+            return X >= np.maximum(prev, succ)
+        else:
+            return X > np.maximum(prev, succ)
+
+    def find_top_k(self, x, k):
+        """Locates the k largest peaks in the given spectrum.
+
+        Args:
+            x (~numpy.ndarray): A spectrum. Can be multi-dimensional.
+            k (int): Number of peaks to locate.
+
+        Returns:
+            tuple: A tuple with the following elements.
+
+            * resolved (:class:`bool`): ``True`` if at least ``k`` peaks are
+              found.
+            * indices (:class:`~numpy.ndarray`): A vector of the flattened
+              indices of the k largest peaks, sorted in ascending order. Should
+              be ignored if ``resolved`` is ``False``.
+        """
+        peaks = np.flatnonzero(self.find_peaks_batch(x[np.newaxis]))
+        if len(peaks) < k:
+            return False, np.zeros((k,), dtype=np.int_)
+        if k < len(peaks):
+            peaks = peaks[np.argpartition(-x.ravel()[peaks], k - 1)[:k]]
+        peaks.sort()
+        return True, peaks
+
+    def find_top_k_batch(self, X, k):
+        """Locates the k largest peaks in each of the given spectra.
+
+        Args:
+            X (~numpy.ndarray): A T x d_1 x ... x d_n array storing T spectra.
+            k (int): Number of peaks to locate.
+
+        Returns:
+            tuple: A tuple with the following elements.
+
+            * resolved (:class:`~numpy.ndarray`): A boolean vector of length T
+              indicating whether at least ``k`` peaks are found in each
+              spectrum.
+            * indices (:class:`~numpy.ndarray`): A T x k integer matrix of the
+              flattened indices of the k largest peaks of each spectrum, where
+              each row is sorted in ascending order. Rows corresponding to
+              unresolved spectra should be ignored.
+        """
+        n = X.shape[0]
+        rows, cols = np.nonzero(self.find_peaks_batch(X).reshape((n, -1)))
+        counts = np.bincount(rows, minlength=n)
+        resolved = counts >= k
+        # Pack the peak values of each spectrum into a row of a T x P matrix,
+        # where P is the maximum number of peaks, so that the top-k selection
+        # only involves the peaks instead of all the grid points.
+        n_cols = max(k, counts.max() if n > 0 else 0)
+        offsets = np.cumsum(counts) - counts
+        ranks = np.arange(len(rows)) - offsets[rows]
+        values = np.full((n, n_cols), -np.inf)
+        values[rows, ranks] = X.reshape((n, -1))[rows, cols]
+        packed = np.zeros((n, n_cols), dtype=np.int_)
+        packed[rows, ranks] = cols
+        if k < n_cols:
+            top = np.argpartition(-values, k - 1, axis=1)[:, :k]
+        else:
+            top = np.tile(np.arange(k), (n, 1))
+        indices = np.take_along_axis(packed, top, axis=1)
+        indices.sort(axis=1)
+        return resolved, indices
+
 def get_noise_subspace(R, k):
     """
     Gets the noise eigenvectors.
 
     Args:
-        R: Covariance matrix.
+        R: Covariance matrix. Can also be a stack of covariance matrices, in
+            which case the eigendecompositions are computed in a batch.
         k: Number of sources.
     """
     _, E = np.linalg.eigh(R)
     # Note: eigenvalues are sorted in ascending order.
-    return E[:,:-k]
+    return E[..., :-k]
+
+@lru_cache(maxsize=32)
+def get_unitary_matrix(m):
+    r"""Gets the m x m left :math:`\mathbf{\Pi}`-real unitary matrix used in
+    real-valued (unitary) subspace processing.
+
+    For even m = 2n and odd m = 2n + 1, the unitary matrices are given by
+
+    .. math::
+        \mathbf{Q}_{2n} = \frac{1}{\sqrt{2}}
+        \begin{bmatrix}
+            \mathbf{I}_n & j\mathbf{I}_n \\
+            \mathbf{\Pi}_n & -j\mathbf{\Pi}_n
+        \end{bmatrix},
+        \mathbf{Q}_{2n+1} = \frac{1}{\sqrt{2}}
+        \begin{bmatrix}
+            \mathbf{I}_n & \mathbf{0} & j\mathbf{I}_n \\
+            \mathbf{0}^T & \sqrt{2} & \mathbf{0}^T \\
+            \mathbf{\Pi}_n & \mathbf{0} & -j\mathbf{\Pi}_n
+        \end{bmatrix},
+
+    where :math:`\mathbf{\Pi}_n` is the n x n exchange matrix. The returned
+    matrix is read-only.
+
+    References:
+        [1] M. Haardt and J. A. Nossek, "Unitary ESPRIT: how to obtain
+        increased estimation accuracy with a reduced computational burden,"
+        IEEE Transactions on Signal Processing, vol. 43, no. 5,
+        pp. 1232-1242, May 1995.
+    """
+    Q = unitary_transform(np.eye(m, dtype=np.complex_)).conj().T
+    Q.setflags(write=False)
+    return Q
+
+def unitary_transform(X):
+    r"""Computes :math:`\mathbf{Q}^H\mathbf{X}` with O(mn) operations by
+    exploiting the sparsity of the unitary matrix, where :math:`\mathbf{Q}`
+    is given by :meth:`get_unitary_matrix`.
+
+    Args:
+        X (~numpy.ndarray): An m x n matrix, or a stack of m x n matrices.
+
+    Returns:
+        ~numpy.ndarray: The transformed matrix (or stack of matrices).
+    """
+    m = X.shape[-2]
+    n = m // 2
+    X1 = X[..., :n, :]
+    X2 = X[..., :m - n - 1:-1, :]
+    blocks = [(X1 + X2) * np.sqrt(0.5)]
+    if m % 2 == 1:
+        blocks.append(X[..., n:n+1, :])
+    blocks.append((X1 - X2) * -1j * np.sqrt(0.5))
+    return np.concatenate(blocks, axis=-2)
+
+def to_real_covariance(R):
+    r"""Transforms a covariance matrix of a centro-symmetric array into a real
+    symmetric matrix.
+
+    The result, :math:`\Re\{\mathbf{Q}^H\mathbf{R}\mathbf{Q}\}`, equals
+    the unitary transform of the forward-backward averaged covariance matrix,
+    :math:`\mathbf{Q}^H \mathbf{R}_\mathrm{fb} \mathbf{Q}`, where
+    :math:`\mathbf{R}_\mathrm{fb} = (\mathbf{R}
+    + \mathbf{\Pi}\mathbf{R}^*\mathbf{\Pi}) / 2`. Its eigenvectors
+    :math:`\mathbf{E}_\mathrm{r}` are real, and :math:`\mathbf{Q}
+    \mathbf{E}_\mathrm{r}` are the eigenvectors of
+    :math:`\mathbf{R}_\mathrm{fb}`.
+
+    Args:
+        R (~numpy.ndarray): A covariance matrix or a stack of covariance
+            matrices.
+
+    Returns:
+        ~numpy.ndarray: A real symmetric matrix (or a stack of real symmetric
+        matrices).
+    """
+    # Q^H R Q = Q^H (Q^H R^H)^H, where R^H = R.
+    X = np.swapaxes(unitary_transform(R), -1, -2).conj()
+    return unitary_transform(X).real
+
+def supports_unitary_processing(array):
+    """Checks if real-valued (unitary) subspace processing is applicable to
+    the given array design, which requires a centro-symmetric array with
+    isotropic scalar elements and no known perturbations."""
+    if not array.element.is_isotropic or not array.element.is_scalar:
+        return False
+    if any(p.is_known for p in array.perturbations):
+        return False
+    return array.is_centro_symmetric
+
+def _fold(x, n, shift=0):
+    """Folds the last axis of x into n bins such that the i-th element is
+    added to the ((i - shift) mod n)-th bin."""
+    q = -(-x.shape[-1] // n) * n
+    if q > x.shape[-1]:
+        x = np.pad(x, [(0, 0)] * (x.ndim - 1) + [(0, q - x.shape[-1])], 'constant')
+    y = x.reshape(x.shape[:-1] + (q // n, n)).sum(axis=-2)
+    return np.roll(y, -shift, axis=-1) if shift != 0 else y
+
+class FFTSpectrumEvaluator:
+    r"""Evaluates spectra of a uniform linear array (ULA) over a 1D far-field
+    search grid with FFTs.
+
+    Let :math:`x = \sin\theta`. The steering vector of an M-element ULA with an
+    inter-element spacing :math:`d_0` is given by
+    :math:`a_m(x) = e^{j \omega m x}`, where :math:`\omega = 2\pi d_0/\lambda`.
+    Therefore, for a vector :math:`\mathbf{v}`, :math:`\mathbf{a}^H(x)\mathbf{v}`
+    is a discrete-time Fourier transform of the elements of
+    :math:`\mathbf{v}`, and for a Hermitian matrix :math:`\mathbf{C}`
+
+    .. math::
+
+        \mathbf{a}^H(x) \mathbf{C} \mathbf{a}(x)
+        = \sum_{l=-M+1}^{M-1} c_l e^{j \omega l x},
+
+    where :math:`c_l` is the sum of the l-th diagonal of :math:`\mathbf{C}`.
+    On a uniform grid :math:`x_k = x_0 + k \Delta`, both can be evaluated with
+    a single FFT of length :math:`N = 2\pi/(\omega\Delta)`, which costs
+    :math:`O(K \log K)` instead of :math:`O(MK)` when :math:`N` is an integer.
+    Otherwise (e.g., when the grid is not uniform in :math:`\sin\theta`), the
+    spectrum can be evaluated with an oversampled FFT followed by linear
+    interpolation onto the grid points.
+
+    Args:
+        array (~doatools.model.arrays.UniformLinearArray): A ULA without known
+            perturbations whose elements are isotropic scalar sensors.
+        wavelength (float): Wavelength of the carrier wave.
+        search_grid (~doatools.estimation.grid.FarField1DSearchGrid): A 1D
+            far-field search grid. Unless ``interpolate`` is True, the grid
+            must be uniform with the unit ``'sin'`` and
+            :math:`2\pi/(\omega\Delta)` must be an integer.
+        interpolate (bool): If set to True, allows interpolation when the exact
+            evaluation is not possible. Default value is False.
+    """
+
+    def __init__(self, array, wavelength, search_grid, interpolate=False):
+        if not FFTSpectrumEvaluator.is_applicable(array, wavelength,
+                                                  search_grid, interpolate):
+            raise ValueError(
+                'The array design or the search grid is not compatible with '
+                'FFT based spectrum evaluation.'
+            )
+        self._m = array.size
+        self._omega = 2 * np.pi * array.d0[0] / wavelength
+        x = _get_sin_values(search_grid)
+        self._x0 = x[0]
+        n = _get_exact_fft_size(self._omega, x)
+        if n is not None:
+            self._n = n
+            self._indices = np.arange(x.size) % n
+            self._weights = None
+        else:
+            # Oversample the full period of the spectrum.
+            n = 64 * self._m
+            n = 1 << int(max(n, 2 * x.size) - 1).bit_length()
+            self._n = n
+            t = (x - self._x0) * self._omega * n / (2 * np.pi)
+            i = np.floor(t)
+            self._weights = t - i
+            self._indices = i.astype(np.int_) % n
+        # Phase shifts due to the starting point of the grid.
+        self._shifts = np.exp(1j * self._omega * self._x0 * np.arange(self._m))
+
+    @staticmethod
+    def is_applicable(array, wavelength, search_grid, interpolate=False):
+        """Checks whether the given array design and search grid are compatible
+        with FFT based spectrum evaluation."""
+        if not isinstance(array, UniformLinearArray):
+            return False
+        if not array.element.is_isotropic or not array.element.is_scalar:
+            return False
+        if any(p.is_known for p in array.perturbations):
+            return False
+        if not isinstance(search_grid, FarField1DSearchGrid):
+            return False
+        if search_grid.axes[0].ndim != 1 or search_grid.size < 2:
+            return False
+        if interpolate:
+            return True
+        if search_grid.units[0] != 'sin':
+            return False
+        omega = 2 * np.pi * array.d0[0] / wavelength
+        return _get_exact_fft_size(omega, search_grid.axes[0]) is not None
+
+    @property
+    def is_exact(self):
+        """Retrieves whether the spectrum is evaluated exactly (without
+        interpolation)."""
+        return self._weights is None
+
+    def _to_grid(self, y):
+        if self._weights is None:
+            return y[..., self._indices]
+        y1 = y[..., (self._indices + 1) % self._n]
+        y0 = y[..., self._indices]
+        return y0 + self._weights * (y1 - y0)
+
+    def evaluate_power(self, V):
+        r"""Evaluates :math:`\sum_i |\mathbf{a}^H(x) \mathbf{v}_i|^2` over the
+        search grid.
+
+        Args:
+            V (~numpy.ndarray): An M x d matrix whose columns are the vectors
+                :math:`\mathbf{v}_i`. Can also be a T x M x d stack of
+                matrices, in which case a T x K matrix is returned.
+
+        Returns:
+            ~numpy.ndarray: A vector of length K, where K is the size of the
+            search grid.
+
+        Notes:
+            When V has more than one column, the result is first computed as
+            the quadratic form of :math:`\mathbf{V}\mathbf{V}^H`, which only
+            requires one FFT. Because the quadratic form suffers from
+            cancellation errors where the result is close to zero (e.g., the
+            peaks of the MUSIC spectrum), the result is recomputed with one FFT
+            per column if any value is not sufficiently larger than the round-off
+            error.
+        """
+        Vt = np.swapaxes(V, -1, -2)
+        if V.shape[-1] > 1:
+            q, bound = self._evaluate_quadratic(V @ Vt.conj())
+            inaccurate = np.any(q <= 1e6 * bound, axis=-1)
+            if not np.any(inaccurate):
+                return q
+            if q.ndim > 1:
+                q[inaccurate] = self._evaluate_power_direct(Vt[inaccurate])
+                return q
+        return self._evaluate_power_direct(Vt)
+
+    def _evaluate_power_direct(self, Vt):
+        # a^H v = sum_m v_m exp(-j omega m x)
+        y = np.fft.fft(_fold(Vt * self._shifts.conj(), self._n), axis=-1)
+        return self._to_grid(np.sum(abs_squared(y), axis=-2))
+
+    def evaluate_quadratic(self, C):
+        r"""Evaluates :math:`\mathbf{a}^H(x) \mathbf{C} \mathbf{a}(x)` over
+        the search grid.
+
+        Args:
+            C (~numpy.ndarray): An M x M Hermitian matrix. Can also be a
+                T x M x M stack of Hermitian matrices, in which case a T x K
+                matrix is returned.
+
+        Returns:
+            ~numpy.ndarray: A real vector of length K, where K is the size of
+            the search grid.
+        """
+        return self._evaluate_quadratic(C)[0]
+
+    def _evaluate_quadratic(self, C):
+        """Evaluates the quadratic form and an estimate of the absolute
+        round-off error."""
+        m = self._m
+        # c[..., i] is the sum of the (i - m + 1)-th diagonal, such that
+        # c_l = sum_p C[p, p + l].
+        c = np.stack([
+            np.trace(C, offset=l, axis1=-2, axis2=-1) for l in range(1 - m, m)
+        ], axis=-1)
+        bound = np.finfo(np.float_).eps * np.sum(np.abs(c), axis=-1, keepdims=True)
+        c = c * np.exp(1j * self._omega * self._x0 * np.arange(1 - m, m))
+        y = np.fft.ifft(_fold(c, self._n, m - 1), axis=-1).real * self._n
+        return self._to_grid(y), bound
+
+def _get_sin_values(search_grid):
+    """Converts the grid points of a 1D far-field search grid to sine
+    values."""
+    x = search_grid.axes[0]
+    unit = search_grid.units[0]
+    if unit == 'deg':
+        return np.sin(np.deg2rad(x))
+    elif unit == 'rad':
+        return np.sin(x)
+    return x
+
+def _get_exact_fft_size(omega, x, max_ratio=16):
+    """Checks if the given sine values form a uniform grid whose spacing,
+    delta, makes 2 * pi / (omega * delta) an integer. Returns this integer or
+    None."""
+    k = x.size
+    delta = (x[-1] - x[0]) / (k - 1)
+    if delta <= 0:
+        return None
+    if np.max(np.abs(x - (x[0] + delta * np.arange(k)))) > 1e-10 * delta:
+        return None
+    n = 2 * np.pi / (omega * delta)
+    n_int = int(round(n))
+    if n_int < 1 or abs(n - n_int) > 1e-10 * n or n_int > max_ratio * k:
+        return None
+    return n_int
 
 class SpectrumBasedEstimatorBase(ABC):
 
     def __init__(self, array, wavelength, search_grid,
-                 peak_finder=find_peaks_simple, enable_caching=True):
+                 peak_finder=find_peaks_simple, enable_caching=True,
+                 search_strategy='exhaustive', search_decimation=4,
+                 chunk_size=None, chunk_cache_bytes=0, shared_cache=False,
+                 fft_spectrum='auto'):
         """Base class for a spectrum-based estimator.
 
         Args:
@@ -59,20 +567,105 @@ class SpectrumBasedEstimatorBase(ABC):
             peak_finder: A callable object that accepts an ndarray and returns
                 a tuple containing the indices representing the peak locations,
                 where the length of this tuple should be the number of
-                dimensions of the input ndarray.
+                dimensions of the input ndarray. If an instance of
+                `TopKPeakFinder` is given, its top-k selection will be used
+                directly.
             enable_caching: If set to True, the steering matrix for the given
                 search grid will be cached. Otherwise the steering matrix will
                 be computed everything `estimate()` is called. Because the array
                 and the search grid are supposed to remain unchanged, caching
                 the steering matrix will save a lot of computations for dense
                 grids in Monte Carlo simulations. Default value is True.
+            search_strategy: Specifies how the spectrum is evaluated over the
+                search grid. Can be one of the following:
+
+                * ``'exhaustive'`` - The spectrum is evaluated at every point
+                  of the search grid. This is the default value.
+                * ``'hierarchical'`` - The spectrum is first evaluated on a
+                  decimated search grid. Regions around the largest peaks of
+                  this coarse spectrum are then evaluated at full resolution.
+                  This reduces the computational cost for dense grids
+                  (especially 2D grids), such that the cost grows with the
+                  number of sources instead of the grid size. The coarse grid
+                  must be dense enough to sample every peak of the spectrum.
+                  Points that are not evaluated will be NaN in the returned
+                  spectrum. If less than the expected number of peaks are
+                  found, the spectrum is evaluated exhaustively instead.
+
+            search_decimation (int): Decimation factor used to create the
+                coarse grid when ``search_strategy`` is ``'hierarchical'``.
+                Default value is 4.
+            chunk_size (int): If specified, the atom matrix for the search grid
+                will never be formed as a whole. Instead, the spectrum will be
+                evaluated over blocks of ``chunk_size`` grid points, such that
+                the peak memory usage is bounded regardless of the grid size.
+                This requires the spectrum at each grid point to depend only on
+                the corresponding column of the atom matrix. Default value is
+                ``None`` (no chunking).
+            chunk_cache_bytes (int): Memory budget (in bytes) for caching the
+                atom matrix blocks when ``chunk_size`` is specified. Blocks are
+                cached in order until the budget is reached, and the remaining
+                blocks are recomputed every time the spectrum is evaluated.
+                Ignored if ``enable_caching`` is False. Default value is 0
+                (no blocks are cached).
+            shared_cache: If set to True, the steering matrix (or its blocks
+                when ``chunk_size`` is specified) for the given search grid will
+                be retrieved from the process-wide
+                :class:`~doatools.model.steering_cache.SteeringMatrixCache`
+                instead of being cached by this estimator, such that estimators
+                working on the same array design, search grid, and wavelength
+                share one copy of the steering matrix. An instance of
+                :class:`~doatools.model.steering_cache.SteeringMatrixCache` can
+                also be specified to use a custom cache. Default value is
+                False.
+            fft_spectrum (str): Specifies when the spectrum over the search
+                grid is evaluated with FFTs by :class:`FFTSpectrumEvaluator`
+                for estimators supporting it. Can be one of the following:
+
+                * ``'auto'`` - FFTs are used when the array is a ULA and the
+                  search grid is a compatible uniform 1D far-field search grid
+                  with the unit ``'sin'``, such that the results are exact.
+                  This is the default value.
+                * ``'interp'`` - Also uses FFTs for other 1D far-field search
+                  grids, where the spectrum is interpolated onto the grid
+                  points.
+                * ``'off'`` - FFTs are never used.
+
+                When FFTs are used, the search strategy, chunking, and caching
+                options do not apply to the search grid.
         """
+        if search_strategy not in ['exhaustive', 'hierarchical']:
+            raise ValueError(
+                "Search strategy must be either 'exhaustive' or 'hierarchical'."
+            )
+        if search_decimation < 1:
+            raise ValueError('Decimation factor must be greater than or equal to 1.')
+        if fft_spectrum not in ['auto', 'interp', 'off']:
+            raise ValueError("FFT spectrum mode must be 'auto', 'interp', or 'off'.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Chunk size must be greater than or equal to 1.')
         self._array = array
         self._wavelength = wavelength
         self._search_grid = search_grid
         self._peak_finder = peak_finder
         self._enable_caching = enable_caching
+        self._search_strategy = search_strategy
+        self._search_decimation = search_decimation
+        self._chunk_size = chunk_size
+        self._chunk_cache_bytes = chunk_cache_bytes
         self._atom_matrix = None
+        self._atom_blocks = {}
+        self._atom_blocks_nbytes = 0
+        self._fft_spectrum = fft_spectrum
+        self._fft_evaluator = None
+        if shared_cache is True:
+            self._shared_cache = get_default_steering_cache()
+        elif shared_cache is False:
+            self._shared_cache = None
+        else:
+            self._shared_cache = shared_cache
+        self._coarse_grid = None
+        self._coarse_atom_matrix = None
     
     def _compute_atom_matrix(self, grid):
         """Computes the atom matrix for spectrum computation.
@@ -109,6 +702,11 @@ class SpectrumBasedEstimatorBase(ABC):
         """
         if alt_grid is not None:
             return self._compute_atom_matrix(alt_grid)
+        if self._shared_cache is not None:
+            return self._shared_cache.get(
+                self._array, self._search_grid.source_placement,
+                self._wavelength
+            )
         # Check cached version of the default search grid if possible.
         if self._atom_matrix is not None:
             return self._atom_matrix
@@ -117,8 +715,197 @@ class SpectrumBasedEstimatorBase(ABC):
             self._atom_matrix = A
         return A
 
+    def _get_fft_evaluator(self):
+        """Retrieves the FFT spectrum evaluator for the search grid, or None if
+        FFTs cannot be used."""
+        if self._fft_spectrum == 'off':
+            return None
+        if self._fft_evaluator is None:
+            interpolate = self._fft_spectrum == 'interp'
+            if not FFTSpectrumEvaluator.is_applicable(
+                self._array, self._wavelength, self._search_grid, interpolate):
+                return None
+            self._fft_evaluator = FFTSpectrumEvaluator(
+                self._array, self._wavelength, self._search_grid, interpolate
+            )
+        return self._fft_evaluator
+
+    def _get_atom_block(self, start, stop):
+        """Retrieves the block of the atom matrix consisting of the columns
+        ``start:stop`` for the default search grid.
+
+        See `_compute_atom_matrix` for more details on the atom matrix.
+
+        Notes:
+            The default implementation creates the steering matrix. Subclasses
+            overriding `_compute_atom_matrix` should also override this method
+            to support chunked evaluation.
+        """
+        if self._shared_cache is not None:
+            return self._shared_cache.get(
+                self._array, self._search_grid.source_placement[start:stop],
+                self._wavelength
+            )
+        if start in self._atom_blocks:
+            return self._atom_blocks[start]
+        A = self._array.steering_matrix(
+            self._search_grid.source_placement[start:stop], self._wavelength,
+            perturbations='known'
+        )
+        if self._enable_caching and \
+            self._atom_blocks_nbytes + A.nbytes <= self._chunk_cache_bytes:
+            self._atom_blocks[start] = A
+            self._atom_blocks_nbytes += A.nbytes
+        return A
+
+    def _compute_spectrum(self, f_sp, f_sp_fft=None):
+        """Evaluates the spectrum over the default search grid.
+
+        If chunking is enabled, `f_sp` is applied to the blocks of the atom
+        matrix and the results are concatenated along the last axis.
+
+        Args:
+            f_sp: A callable object that accepts the atom matrix as the
+                parameter and return a numpy array whose last dimension
+                corresponds to the columns of the atom matrix.
+            f_sp_fft: A callable object that accepts an `FFTSpectrumEvaluator`
+                as the parameter and return the spectrum over the search grid.
+                If specified, it will be used instead of `f_sp` when FFTs can
+                be used.
+        """
+        if f_sp_fft is not None:
+            evaluator = self._get_fft_evaluator()
+            if evaluator is not None:
+                return f_sp_fft(evaluator)
+        if self._chunk_size is None:
+            return f_sp(self._get_atom_matrix())
+        n = self._search_grid.size
+        sp = None
+        for start in range(0, n, self._chunk_size):
+            stop = min(start + self._chunk_size, n)
+            sp_block = f_sp(self._get_atom_block(start, stop))
+            if sp is None:
+                sp = np.empty(sp_block.shape[:-1] + (n,), dtype=sp_block.dtype)
+            sp[..., start:stop] = sp_block
+        return sp
+
+    def _find_peaks(self, sp, mask=None):
+        """Locates all the peaks of the given spectrum with the peak finder.
+
+        Args:
+            sp: The spectrum, whose shape should match the search grid.
+            mask: If specified, only peaks located where ``mask`` is True will
+                be kept.
+
+        Returns:
+            A vector of the flattened indices of the peaks.
+        """
+        if isinstance(self._peak_finder, TopKPeakFinder):
+            peaks = self._peak_finder.find_peaks_batch(sp[np.newaxis])[0]
+            if mask is not None:
+                peaks &= mask
+            return np.flatnonzero(peaks)
+        # The peak finder returns a tuple of 1D numpy arrays. We need to
+        # convert n-d indices to flattened indices.
+        peaks = np.ravel_multi_index(self._peak_finder(sp), sp.shape)
+        if mask is not None:
+            peaks = peaks[mask.ravel()[peaks]]
+        return peaks
+
+    def _find_top_peaks(self, sp, k, mask=None):
+        """Locates the k largest peaks of the given spectrum with the peak
+        finder.
+
+        Args:
+            sp: The spectrum, whose shape should match the search grid.
+            k (int): Number of peaks to locate.
+            mask: If specified, only peaks located where ``mask`` is True will
+                be considered.
+
+        Returns:
+            A sorted vector of the flattened indices of the k largest peaks,
+            or None if less than k peaks are found.
+        """
+        peaks = self._find_peaks(sp, mask)
+        if len(peaks) < k:
+            return None
+        # Obtain the peak values for sorting.
+        peak_values = sp.ravel()[peaks]
+        # Identify the k largest peaks.
+        if isinstance(self._peak_finder, TopKPeakFinder) and k < len(peaks):
+            top_indices = np.argpartition(-peak_values, k - 1)[:k]
+        else:
+            top_indices = np.argsort(peak_values)[-k:]
+        # We sorted the flattened indices here to respect the ordering of
+        # source locations in the search grid.
+        flattened_indices = np.sort(peaks[top_indices])
+        return flattened_indices
+
+    def _get_coarse_grid(self):
+        """Retrieves the decimated search grid and its atom matrix used in the
+        hierarchical search."""
+        if self._coarse_atom_matrix is not None:
+            return self._coarse_grid, self._coarse_atom_matrix
+        grid = self._search_grid.create_decimated_grid(self._search_decimation)
+        A = self._compute_atom_matrix(grid)
+        if self._enable_caching:
+            self._coarse_grid = grid
+            self._coarse_atom_matrix = A
+        return grid, A
+
+    def _compute_spectrum_hierarchical(self, f_sp, k):
+        """Computes the spectrum with the hierarchical search strategy.
+
+        Args:
+            f_sp: A callable object that accepts the atom matrix as the
+                parameter and return a 1D numpy array representing the computed
+                spectrum.
+            k (int): Expected number of sources.
+
+        Returns:
+            sp: A numpy array of the same shape of the search grid. Points that
+                are not evaluated are set to NaN. Will be None if the coarse
+                spectrum contains less than k peaks.
+            valid: A boolean array of the same shape of the search grid
+                marking the points whose neighbors are all evaluated. Only
+                peaks located within these points are reliable.
+        """
+        factor = self._search_decimation
+        coarse_grid, A = self._get_coarse_grid()
+        sp_coarse = f_sp(A).reshape(coarse_grid.shape)
+        peaks = self._find_peaks(sp_coarse)
+        if len(peaks) < k:
+            return None, None
+        # Keep some extra candidates in case that some of the largest coarse
+        # peaks are not the largest peaks at full resolution.
+        n_candidates = min(len(peaks), 2 * k)
+        peaks = peaks[np.argsort(sp_coarse.ravel()[peaks])[-n_candidates:]]
+        coords = np.unravel_index(peaks, coarse_grid.shape)
+        coords = [c * factor for c in coords]
+        # Each region spans between the neighbors of the coarse peak, where
+        # the true peak is expected to be located.
+        subgrids = self._search_grid.create_refined_grids_at(
+            *coords, density=1, span=factor
+        )
+        values = f_sp(np.hstack([self._get_atom_matrix(g) for g in subgrids]))
+        shape = self._search_grid.shape
+        sp = np.full(shape, np.nan)
+        evaluated = np.zeros(shape, dtype=np.bool_)
+        offset = 0
+        for coord, g in zip(zip(*coords), subgrids):
+            region = tuple(
+                slice(max(0, c - factor), max(0, c - factor) + n)
+                for c, n in zip(coord, g.shape)
+            )
+            sp[region] = values[offset:offset+g.size].reshape(g.shape)
+            evaluated[region] = True
+            offset += g.size
+        valid = binary_erosion(evaluated, np.ones((3,) * len(shape)),
+                               border_value=1)
+        return sp, valid
+
     def _estimate(self, f_sp, k, return_spectrum=False, refine_estimates=False,
-                  refinement_density=10, refinement_iters=3):
+                  refinement_density=10, refinement_iters=3, f_sp_fft=None):
         """
         A generic implementation of the estimation process: compute the spectrum
         -> identify the peaks -> locate the largest peaks as estimates.
@@ -141,6 +928,12 @@ class SpectrumBasedEstimatorBase(ABC):
             refinement_iters: Number of refinement iterations. More iterations
                 generally lead to better results, at the cost of increased
                 computational complexity. Default value is 3.
+            f_sp_fft: A callable object that accepts an `FFTSpectrumEvaluator`
+                as the parameter and return a 1D numpy array representing the
+                spectrum computed over the search grid. If specified, it will
+                be used instead of `f_sp` to compute the spectrum over the
+                search grid when FFTs can be used. `f_sp` is still used for
+                grid refinement.
         
         Returns:
             resolved (bool): A boolean indicating if the desired number of
@@ -156,35 +949,33 @@ class SpectrumBasedEstimatorBase(ABC):
                 specified search grid, consisting of values evaluated at the
                 grid points. Only present if `return_spectrum` is True.
         """
-        sp = f_sp(self._get_atom_matrix())
-        # Restores the shape of the spectrum.
-        sp = sp.reshape(self._search_grid.shape)
-        # Find peak locations.
-        peak_indices = self._peak_finder(sp)
-        # The peak finder returns a tuple whose length is at least one. Hence
-        # we can get the number of peaks by checking the length of the first
-        # element in the tuple.
-        n_peaks = len(peak_indices[0])
-        if n_peaks < k:
+        sp = None
+        use_fft = f_sp_fft is not None and self._get_fft_evaluator() is not None
+        if self._search_strategy == 'hierarchical' and not use_fft:
+            sp, valid = self._compute_spectrum_hierarchical(f_sp, k)
+            if sp is not None:
+                # Exclude the points that are not evaluated from peak finding.
+                with np.errstate(invalid='ignore'):
+                    flattened_indices = self._find_top_peaks(
+                        np.where(np.isnan(sp), -np.inf, sp), k, valid
+                    )
+                if flattened_indices is None:
+                    # Some peaks lie on the borders of the evaluated regions
+                    # (e.g., the coarse grid is not dense enough). Fall back to
+                    # the exhaustive search.
+                    sp = None
+        if sp is None:
+            sp = self._compute_spectrum(f_sp, f_sp_fft)
+            # Restores the shape of the spectrum.
+            sp = sp.reshape(self._search_grid.shape)
+            flattened_indices = self._find_top_peaks(sp, k)
+        if flattened_indices is None:
             # Not enough peaks.
             if return_spectrum:
                 return False, None, sp
             else:
                 return False, None
         else:
-            # Obtain the peak values for sorting. Remember that `peak_indices`
-            # is a tuple of 1D numpy arrays, and `sp` has been reshaped.
-            peak_values = sp[peak_indices]
-            # Identify the k largest peaks.
-            top_indices = np.argsort(peak_values)[-k:]
-            # Filter out the peak indices of the k largest peaks.
-            peak_indices = [axis[top_indices] for axis in peak_indices]
-            # Obtain the estimates.
-            # Note that we need to convert n-d indices to flattened indices.
-            # We sorted the flattened indices here to respect the ordering of
-            # source locations in the search grid.
-            flattened_indices = np.ravel_multi_index(peak_indices, self._search_grid.shape)
-            flattened_indices.sort()
             estimates = self._search_grid.source_placement[flattened_indices]
             if refine_estimates:
                 # Convert sorted flattened indices back to a tuple of coordinate
@@ -197,6 +988,103 @@ class SpectrumBasedEstimatorBase(ABC):
             else:
                 return True, estimates
         
+    def estimate_batch(self, Rs, k, **kwargs):
+        """Estimates the source locations from a stack of covariance matrices.
+
+        The spectra and the peak finding are vectorized over the covariance
+        matrices, which is much faster than calling ``estimate`` repeatedly in
+        Monte Carlo simulations. The peaks are always located with a
+        :class:`TopKPeakFinder` (a default one is used if the peak finder of
+        this estimator is not a :class:`TopKPeakFinder`), and the spectra are
+        always evaluated over the whole search grid regardless of the search
+        strategy. Grid refinement is not supported.
+
+        Subclasses supporting batch estimation override this method. The
+        default implementation raises :class:`NotImplementedError`.
+
+        Args:
+            Rs (~numpy.ndarray): A T x M x M stack of covariance matrices,
+                where M must match the size of the array design used when
+                creating this estimator.
+            k (int): Expected number of sources.
+            return_spectrum (bool): Set to ``True`` to also output the spectra.
+                Default value if ``False``.
+
+        Returns:
+            A tuple with the following elements.
+
+            * resolved (:class:`~numpy.ndarray`): A boolean vector of length T
+              indicating whether the desired number of sources are found for
+              each covariance matrix.
+            * estimates (:class:`~numpy.ndarray`): A T x k (1D sources) or
+              T x k x d (d-dimensional sources) array of the estimated source
+              locations, measured in the same unit as the search grid. Rows
+              corresponding to unresolved inputs are filled with NaNs.
+            * spectra (:class:`~numpy.ndarray`): A T x d_1 x ... x d_n array of
+              the spectra evaluated on the search grid. Only present if
+              ``return_spectrum`` is ``True``.
+        """
+        raise NotImplementedError(
+            '{0} does not support batch estimation.'.format(type(self).__name__)
+        )
+
+    def _estimate_batch(self, f_sp, k, return_spectrum=False, f_sp_fft=None):
+        """
+        A vectorized implementation of the estimation process for a batch of
+        inputs.
+
+        Subclasses can implement a batched `f_sp` and call this method to
+        obtain the estimates for many trials (e.g., in Monte Carlo simulations)
+        at once.
+
+        Args:
+            f_sp: A callable object that accepts the atom matrix as the
+                parameter and return a T x K numpy array, where T is the number
+                of inputs in the batch and K is the size of the search grid.
+                The t-th row represents the spectrum of the t-th input.
+            k (int): Expected number of sources.
+            return_spectrum: Set to True to also output the spectra.
+            f_sp_fft: A callable object that accepts an `FFTSpectrumEvaluator`
+                as the parameter and return a T x K numpy array of the spectra.
+                If specified, it will be used instead of `f_sp` when FFTs can
+                be used.
+
+        Notes:
+            The peaks are always located with a `TopKPeakFinder`. If the peak
+            finder of this estimator is not a `TopKPeakFinder`, a default one
+            is used. The spectra are always evaluated over the whole search
+            grid regardless of the search strategy.
+
+        Returns:
+            resolved (ndarray): A boolean vector of length T. The t-th element
+                indicates if the desired number of sources are found for the
+                t-th input.
+            estimates (ndarray): A T x k array (for 1D source locations) or a
+                T x k x d array (for d-dimensional source locations) storing
+                the estimated source locations, where each row is sorted in the
+                same way as the source locations in the search grid. Rows
+                corresponding to unresolved inputs are filled with NaNs.
+            spectra (ndarray): A T x d_1 x ... x d_n array consisting of
+                the spectra evaluated on the search grid. Only present if
+                `return_spectrum` is True.
+        """
+        sp = self._compute_spectrum(f_sp, f_sp_fft)
+        n = sp.shape[0]
+        # Restores the shape of the spectra.
+        sp = sp.reshape((n,) + self._search_grid.shape)
+        if isinstance(self._peak_finder, TopKPeakFinder):
+            peak_finder = self._peak_finder
+        else:
+            peak_finder = TopKPeakFinder()
+        resolved, flattened_indices = peak_finder.find_top_k_batch(sp, k)
+        locations = self._search_grid.source_placement.locations
+        estimates = np.full((n, k) + locations.shape[1:], np.nan)
+        estimates[resolved] = locations[flattened_indices[resolved]]
+        if return_spectrum:
+            return resolved, estimates, sp
+        else:
+            return resolved, estimates
+
     def _refine_estimates(self, f_sp, est0, peak_indices, density=10, n_iters=3):
         """Refines the estimates.
         
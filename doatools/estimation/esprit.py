@@ -1,6 +1,10 @@
+from functools import lru_cache
 import numpy as np
-from ..model.sources import FarField1DSourcePlacement
-from .core import ensure_n_resolvable_sources
+from ..model.arrays import UniformRectangularArray
+from ..model.sources import FarField1DSourcePlacement, FarField2DSourcePlacement
+from .core import ensure_n_resolvable_sources, ensure_covariance_size, \
+                  ensure_covariance_batch_size, get_unitary_matrix, \
+                  unitary_transform, to_real_covariance
 
 def get_default_row_weights(m):
     """Gets the default row weights for the ESPRIT estimator.
@@ -11,13 +15,104 @@ def get_default_row_weights(m):
     Returns:
         A ndarray vector of weights.
     """
-    w = np.zeros((m,))
-    for i in range(m // 2):
-        w[i] = i + 1
-        w[m - i - 1] = i + 1
-    if m % 2 == 1:
-        w[m // 2] = (m + 1) / 2
-    return np.sqrt(w)
+    return np.sqrt(np.minimum(np.arange(1, m + 1), np.arange(m, 0, -1)).astype(np.float_))
+
+@lru_cache(maxsize=32)
+def _get_cached_default_row_weights(m):
+    """Retrieves a read-only copy of the default row weights, which is only
+    computed once for each m."""
+    w = get_default_row_weights(m)
+    w.setflags(write=False)
+    return w
+
+def _get_row_weights(row_weights, m_reduced, unitary=False):
+    """Validates the row weights and converts them into a vector (or None if
+    row weighting is disabled). Unitary ESPRIT requires centro-symmetric row
+    weights."""
+    if isinstance(row_weights, str):
+        if row_weights == 'none':
+            return None
+        elif row_weights == 'default':
+            return _get_cached_default_row_weights(m_reduced)
+        else:
+            raise ValueError("When specified using a string, row weights must be either 'none' or 'default'.")
+    elif isinstance(row_weights, np.ndarray):
+        if row_weights.ndim != 1 or row_weights.size != m_reduced:
+            raise ValueError('Row weights must be a vector of length {0}.'.format(m_reduced))
+        if unitary and not np.allclose(row_weights, row_weights[::-1]):
+            raise ValueError('Row weights must be centro-symmetric for Unitary ESPRIT.')
+        return row_weights
+    else:
+        raise ValueError("Row weights must be 'default', 'none', or a compatible numpy vector.")
+
+def _solve_invariance_equation(Es1, Es2, formulation):
+    """Solves Es1 Phi = Es2 for the rotation matrix Phi using either least
+    squares or total least squares. Also supports stacks of matrices."""
+    k = Es1.shape[-1]
+    if formulation == 'tls':
+        # Total least-squares
+        C = np.concatenate((Es1, Es2), axis=-1)
+        C = np.swapaxes(C, -1, -2).conj() @ C
+        _, V = np.linalg.eigh(C)
+        V = V[..., ::-1] # Now in descending order
+        V12 = V[..., :k, k:]
+        V22 = V[..., k:, k:]
+        # Phi = -V12 V22^{-1}
+        return -np.swapaxes(np.linalg.solve(np.swapaxes(V22, -1, -2),
+                                            np.swapaxes(V12, -1, -2)), -1, -2)
+    elif formulation == 'ls':
+        # Least-squares
+        Es1_H = np.swapaxes(Es1, -1, -2).conj()
+        return np.linalg.solve(Es1_H @ Es1, Es1_H @ Es2)
+    else:
+        raise ValueError("Formulation must be either 'ls' or 'tls'.")
+
+def _esprit(Es, displacement, formulation, row_weights, unitary=False):
+    """Computes the roots from the signal subspace with ESPRIT.
+
+    Args:
+        Es: An m x k signal subspace or a T x m x k stack of signal subspaces.
+            Must be the real signal subspace of the transformed covariance
+            matrix if ``unitary`` is ``True``.
+        displacement (int): Displacement between the two subarrays.
+        formulation (str): ``'ls'`` or ``'tls'``.
+        row_weights: A vector of row weights or ``None``.
+        unitary (bool): Whether Unitary ESPRIT is used.
+
+    Returns:
+        A vector of length k or a T x k matrix of roots.
+    """
+    if unitary:
+        # Let Q be the unitary matrix. The real matrices
+        #   K1 = Q_r^H W (J1 + J2) Q and K2 = Q_r^H W j(J1 - J2) Q,
+        # where J1 and J2 are the selection matrices and W is the
+        # centro-symmetric row weighting matrix, lead to the real invariance
+        # equation tan(mu/2) K1 Es = K2 Es.
+        Y = get_unitary_matrix(Es.shape[-2]) @ Es
+        Y1 = Y[..., :-displacement, :]
+        Y2 = Y[..., displacement:, :]
+        Es1 = Y1 + Y2
+        Es2 = 1j * (Y1 - Y2)
+        if row_weights is not None:
+            Es1 *= row_weights[:, np.newaxis]
+            Es2 *= row_weights[:, np.newaxis]
+        Es1 = unitary_transform(Es1).real
+        Es2 = unitary_transform(Es2).real
+    else:
+        # Separation
+        Es1 = Es[..., :-displacement, :]
+        Es2 = Es[..., displacement:, :]
+        # Apply row weights. Es1 and Es2 are views of Es, which must not be
+        # modified in place.
+        if row_weights is not None:
+            Es1 = Es1 * row_weights[:, np.newaxis]
+            Es2 = Es2 * row_weights[:, np.newaxis]
+    Phi = _solve_invariance_equation(Es1, Es2, formulation)
+    if unitary:
+        # The eigenvalues are tan(mu/2). Complex eigenvalues may appear when
+        # the sources are not resolved, and only their real parts are used.
+        return np.exp(2j * np.arctan(np.linalg.eigvals(Phi).real))
+    return np.linalg.eigvals(Phi)
 
 class Esprit1D:
     """Creates an ESPRIT estimator for 1D uniform linear arrays.
@@ -32,13 +127,18 @@ class Esprit1D:
         Jul. 1989.
         
         [2] H. L. Van Trees, Optimum array processing. New York: Wiley, 2002.
+
+        [3] M. Haardt and J. A. Nossek, "Unitary ESPRIT: how to obtain
+        increased estimation accuracy with a reduced computational burden,"
+        IEEE Transactions on Signal Processing, vol. 43, no. 5,
+        pp. 1232-1242, May 1995.
     """
 
     def __init__(self, wavelength):
         self._wavelength = wavelength
 
     def estimate(self, R, k, d0=None, displacement=1, formulation='ls',
-                 row_weights='default', unit='rad'):
+                 row_weights='default', unit='rad', unitary=False):
         r"""Estimate the direction-of-arrivals (DOAs) using ESPRIT.
 
         Args:
@@ -81,6 +181,14 @@ class Esprit1D:
                 :class:`~doatools.model.sources.FarField1DSourcePlacement` for
                 more details on valid units.
 
+            unitary (bool): Set to ``True`` to use Unitary ESPRIT, where the
+                covariance matrix is transformed into a real symmetric matrix
+                (see :meth:`~doatools.estimation.core.to_real_covariance`), and
+                the signal subspace and the rotation matrix are estimated in
+                real arithmetic. This also incorporates forward-backward
+                averaging. Custom row weights must be centro-symmetric.
+                Default value is ``False``.
+
         Returns:
             A tuple with the following elements.
 
@@ -94,52 +202,239 @@ class Esprit1D:
               recording the estimated source locations. Will be ``None`` if
               resolved is ``False``.
         """
-        m = R.shape[0]
+        if R.ndim != 2 or R.shape[0] != R.shape[1]:
+            raise ValueError('R should be a square matrix.')
+        # Extract the signal subspace.
+        _, E = np.linalg.eigh(to_real_covariance(R) if unitary else R)
+        return self._estimate_from_subspace(E[:, -k:], d0, displacement,
+                                            formulation, row_weights, unit,
+                                            unitary)
+
+    def estimate_from_subspace(self, Es, d0=None, displacement=1,
+                               formulation='ls', row_weights='default',
+                               unit='rad'):
+        """Estimate the direction-of-arrivals (DOAs) from a given signal
+        subspace using ESPRIT.
+
+        This is useful when the signal subspace is obtained without the
+        eigendecomposition of a covariance matrix, e.g., by a
+        :class:`~doatools.estimation.subspace_tracking.SubspaceTracker`.
+        The least squares formulation is invariant to the choice of the basis,
+        so the columns of ``Es`` are not required to be orthonormal in this
+        case.
+
+        Args:
+            Es (~numpy.ndarray): An M x k matrix whose columns span the signal
+                subspace, where k is the expected number of sources.
+            d0 (float): Inter-element spacing of the uniform linear array.
+                Default value is ``None``.
+            displacement (int): See :meth:`estimate`. Default value is 1.
+            formulation (str): See :meth:`estimate`. Default value is
+                ``'ls'``.
+            row_weights (str or ~numpy.ndarray): See :meth:`estimate`. Default
+                value is ``'default'``.
+            unit (str): Unit of the estimates. Default value is ``'rad'``.
+
+        Returns:
+            Same as :meth:`estimate`.
+        """
+        return self._estimate_from_subspace(Es, d0, displacement, formulation,
+                                            row_weights, unit, False)
+
+    def _estimate_from_subspace(self, Es, d0, displacement, formulation,
+                                row_weights, unit, unitary):
+        if Es.ndim != 2:
+            raise ValueError('Es should be a matrix.')
+        m, k = Es.shape
         if displacement < 1:
             raise ValueError('Displacement must be a non-negative integer.')
         m_reduced = m - displacement
         ensure_n_resolvable_sources(k, m_reduced)
         if d0 is None:
             d0 = self._wavelength / 2.0
-        if isinstance(row_weights, str):
-            if row_weights == 'none':
-                row_weights = None
-            elif row_weights == 'default':
-                row_weights = get_default_row_weights(m_reduced)
-            else:
-                raise ValueError("When specified using a string, row weights must be either 'none' or 'default'.")
-        elif isinstance(row_weights, np.ndarray):
-            if row_weights.ndim != 1 or row_weights.size != m_reduced:
-                raise ValueError('Row weights must be a vector of length {0}.'.format(m_reduced))
-        else:
-            raise ValueError("Row weights must be 'default', 'none', or a compatible numpy vector.")
-        # Extract the signal subspace.
-        _, E = np.linalg.eigh(R)
-        Es = E[:, -k:]
-        # Separation
-        Es1 = Es[:-displacement, :]
-        Es2 = Es[displacement:, :]
-        # Apply row weights.
-        if row_weights is not None:
-            Es1 *= row_weights[:, np.newaxis]
-            Es2 *= row_weights[:, np.newaxis]
-        # Estimate the rotation matrix.
-        if formulation == 'tls':
-            # Total least-squares
-            C = np.hstack((Es1, Es2))
-            C = C.conj().T @ C
-            _, V = np.linalg.eigh(C)
-            V = np.fliplr(V) # Now in descending order
-            V12 = V[:k, k:]
-            V22 = V[k:, k:]
-            # Phi = -V12 V22^{-1}
-            Phi = -np.linalg.solve(V22.T, V12.T).T
-        elif formulation == 'ls':
-            # Least-squares
-            Es1_H = Es1.conj().T
-            Phi = np.linalg.solve(Es1_H @ Es1, Es1_H @ Es2)
-        else:
-            raise ValueError("Formulation must be either 'ls' or 'tls'.")
-        # Recover the DOAs.
-        z = np.linalg.eigvals(Phi)
+        row_weights = _get_row_weights(row_weights, m_reduced, unitary)
+        z = _esprit(Es, displacement, formulation, row_weights, unitary)
         return True, FarField1DSourcePlacement.from_z(z, self._wavelength, d0 * displacement, unit)
+
+    def estimate_batch(self, Rs, k, d0=None, displacement=1, formulation='ls',
+                       row_weights='default', unit='rad', unitary=False):
+        """Estimates the direction-of-arrivals (DOAs) from a stack of
+        covariance matrices using ESPRIT.
+
+        The eigendecompositions, the rotation matrix estimation, and the
+        rooting are all vectorized over the covariance matrices.
+
+        Args:
+            Rs (~numpy.ndarray): A T x M x M stack of covariance matrices
+                obtained using a uniform linear array.
+            k (int): Expected number of sources.
+            d0 (float): Inter-element spacing of the uniform linear array.
+                Default value is ``None``.
+            displacement (int): See :meth:`estimate`. Default value is 1.
+            formulation (str): See :meth:`estimate`. Default value is
+                ``'ls'``.
+            row_weights (str or ~numpy.ndarray): See :meth:`estimate`. Default
+                value is ``'default'``.
+            unit (str): Unit of the estimates. Default value is ``'rad'``.
+            unitary (bool): Set to ``True`` to use Unitary ESPRIT. Default
+                value is ``False``.
+
+        Returns:
+            A tuple with the following elements.
+
+            * resolved (:class:`~numpy.ndarray`): A boolean vector of length T
+              indicating whether valid estimates are obtained for each
+              covariance matrix.
+            * estimates (:class:`~numpy.ndarray`): A T x k array of the
+              estimated source locations, measured in the specified unit.
+              Each row is sorted in ascending order. Rows corresponding to
+              unresolved inputs are filled with NaNs.
+        """
+        if Rs.ndim != 3 or Rs.shape[1] != Rs.shape[2]:
+            raise ValueError('Rs should be a stack of square matrices.')
+        if displacement < 1:
+            raise ValueError('Displacement must be a non-negative integer.')
+        m_reduced = Rs.shape[1] - displacement
+        ensure_n_resolvable_sources(k, m_reduced)
+        if d0 is None:
+            d0 = self._wavelength / 2.0
+        row_weights = _get_row_weights(row_weights, m_reduced, unitary)
+        _, E = np.linalg.eigh(to_real_covariance(Rs) if unitary else Rs)
+        z = _esprit(E[..., -k:], displacement, formulation, row_weights,
+                    unitary)
+        estimates = FarField1DSourcePlacement.locations_from_z(
+            z, self._wavelength, d0 * displacement, unit)
+        resolved = np.all(np.isfinite(estimates), axis=1)
+        estimates[~resolved, :] = np.nan
+        return resolved, estimates
+
+class Esprit2D:
+    r"""Creates a 2D Unitary ESPRIT estimator for uniform rectangular arrays.
+
+    Let :math:`u = \cos\theta_\mathrm{el}\cos\theta_\mathrm{az}` and
+    :math:`v = \cos\theta_\mathrm{el}\sin\theta_\mathrm{az}` be the direction
+    cosines along the x-axis and the y-axis. The spatial frequencies
+    :math:`\mu = 2\pi d_x u / \lambda` and :math:`\nu = 2\pi d_y v / \lambda`
+    are estimated from the shift invariances along the two axes of the
+    uniform rectangular array using real-valued computations only. The two
+    sets of spatial frequencies are automatically paired through a joint
+    eigendecomposition, after which the closed-form azimuth and elevation
+    estimates are recovered.
+
+    Because the array lies on the xy-plane, a source at elevation
+    :math:`\theta_\mathrm{el}` cannot be distinguished from one at
+    :math:`-\theta_\mathrm{el}`. The estimated elevation angles are always
+    nonnegative.
+
+    Args:
+        array (~doatools.model.arrays.UniformRectangularArray): The uniform
+            rectangular array used to obtain the covariance matrices.
+        wavelength (float): Wavelength of the carrier wave.
+
+    References:
+        [1] M. D. Zoltowski, M. Haardt and C. P. Mathews, "Closed-form 2-D
+        angle estimation with rectangular arrays in element space or beamspace
+        via unitary ESPRIT," IEEE Transactions on Signal Processing, vol. 44,
+        no. 2, pp. 316-328, Feb. 1996.
+    """
+
+    def __init__(self, array, wavelength):
+        if not isinstance(array, UniformRectangularArray):
+            raise ValueError('Expecting a uniform rectangular array.')
+        if array.shape[0] < 2 or array.shape[1] < 2:
+            raise ValueError('The uniform rectangular array must have at least two elements along each axis.')
+        if not np.allclose(array.bases, np.diag(array.d0[:2])):
+            raise ValueError('The uniform rectangular array must be aligned with the x-axis and the y-axis.')
+        self._array = array
+        self._wavelength = wavelength
+
+    def estimate(self, R, k, formulation='ls', unit='rad'):
+        """Estimates the azimuth and elevation angles of 2D far-field sources.
+
+        Args:
+            R (~numpy.ndarray): Covariance matrix input. The size of R must
+                match that of the array used when creating this estimator.
+            k (int): Expected number of sources.
+            formulation (str): Method used to estimate the rotation matrices.
+                Either ``'tls'`` (Total Least Squares) or ``'ls'`` (Least
+                Squares). Default value is ``'ls'``.
+            unit (str): Unit of the estimates. Can be ``'rad'`` or ``'deg'``.
+                Default value is ``'rad'``.
+
+        Returns:
+            A tuple with the following elements.
+
+            * resolved (:class:`bool`): ``True`` if finite estimates are
+              obtained. This flag does **not** guarantee that the estimated
+              source locations are correct. If resolved is False,
+              ``estimates`` will be ``None``.
+            * estimates (:class:`~doatools.model.sources.FarField2DSourcePlacement`):
+              A :class:`~doatools.model.sources.FarField2DSourcePlacement`
+              recording the estimated source locations sorted by the azimuth
+              angles. Will be ``None`` if resolved is ``False``.
+        """
+        ensure_covariance_size(R, self._array)
+        resolved, estimates = self.estimate_batch(R[np.newaxis], k,
+                                                  formulation, unit)
+        if not resolved[0]:
+            return False, None
+        return True, FarField2DSourcePlacement(estimates[0], unit)
+
+    def estimate_batch(self, Rs, k, formulation='ls', unit='rad'):
+        """Estimates the azimuth and elevation angles of 2D far-field sources
+        from a stack of covariance matrices.
+
+        Args:
+            Rs (~numpy.ndarray): A T x M x M stack of covariance matrices,
+                where M must match the size of the array used when creating
+                this estimator.
+            k (int): Expected number of sources.
+            formulation (str): ``'ls'`` or ``'tls'``. Default value is
+                ``'ls'``.
+            unit (str): Unit of the estimates. Default value is ``'rad'``.
+
+        Returns:
+            A tuple with the following elements.
+
+            * resolved (:class:`~numpy.ndarray`): A boolean vector of length T
+              indicating whether finite estimates are obtained for each
+              covariance matrix.
+            * estimates (:class:`~numpy.ndarray`): A T x k x 2 array of the
+              estimated azimuth and elevation angles, measured in the
+              specified unit and sorted by the azimuth angles. Rows
+              corresponding to unresolved inputs are filled with NaNs.
+        """
+        ensure_covariance_batch_size(Rs, self._array)
+        if unit not in ['rad', 'deg']:
+            raise ValueError("Unit must be either 'rad' or 'deg'.")
+        m, n = self._array.shape
+        ensure_n_resolvable_sources(k, min((m - 1) * n, m * (n - 1)))
+        # Real signal subspace.
+        _, E = np.linalg.eigh(to_real_covariance(Rs))
+        Es = E[..., -k:]
+        Y = (get_unitary_matrix(m * n) @ Es).reshape((-1, m, n, k))
+        # Real invariance equations along the x-axis and the y-axis.
+        Phis = []
+        for Y1, Y2 in [(Y[:, :-1], Y[:, 1:]), (Y[:, :, :-1], Y[:, :, 1:])]:
+            Y1 = Y1.reshape((Y.shape[0], -1, k))
+            Y2 = Y2.reshape((Y.shape[0], -1, k))
+            K1 = unitary_transform(Y1 + Y2).real
+            K2 = unitary_transform(1j * (Y1 - Y2)).real
+            Phis.append(_solve_invariance_equation(K1, K2, formulation))
+        # Automatic pairing: Phi_x and Phi_y share the same eigenvectors, so
+        # the eigenvalues of Phi_x + j Phi_y are tan(mu/2) + j tan(nu/2).
+        w = np.linalg.eigvals(Phis[0] + 1j * Phis[1])
+        d0 = self._array.d0
+        u = 2 * np.arctan(w.real) * self._wavelength / (2 * np.pi * d0[0])
+        v = 2 * np.arctan(w.imag) * self._wavelength / (2 * np.pi * d0[1])
+        az = np.arctan2(v, u)
+        el = np.arccos(np.minimum(np.sqrt(u**2 + v**2), 1.0))
+        estimates = np.stack((az, el), axis=-1)
+        # Sort by azimuth angles.
+        order = np.argsort(az, axis=1)
+        estimates = np.take_along_axis(estimates, order[:, :, np.newaxis], axis=1)
+        if unit == 'deg':
+            estimates = np.rad2deg(estimates)
+        resolved = np.all(np.isfinite(estimates), axis=(1, 2))
+        estimates[~resolved] = np.nan
+        return resolved, estimates
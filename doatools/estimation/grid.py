@@ -161,12 +161,45 @@ class SearchGrid(ABC):
             # Lower bound and upper bound indices.
             i_lb = max(0, coord[j] - span)
             i_ub = min(self._shape[j] - 1, coord[j] + span)
+            if density == 1:
+                # No subdivision. Reuse the original grid points.
+                axes.append(self._axes[j][i_lb:i_ub+1].copy())
+                continue
             # Convert to actual values.
             lb = self._axes[j][i_lb]
             ub = self._axes[j][i_ub]
             axes.append(np.linspace(lb, ub, (i_ub - i_lb) * density + 1))
         return tuple(axes)
 
+    def create_decimated_grid(self, factor):
+        """Creates a coarser search grid by keeping every ``factor``-th point
+        along each axis.
+
+        For instance, decimating a grid with the axis [0, 1, 2, 3, 4, 5, 6]
+        by a factor of 3 leads to a new grid with the axis [0, 3, 6]. The
+        i-th point along each axis of the decimated grid corresponds to the
+        ``(i * factor)``-th point of the original grid.
+
+        Args:
+            factor (int): Decimation factor.
+
+        Returns:
+            A decimated search grid of the same type.
+        """
+        if factor < 1:
+            raise ValueError('Decimation factor must be greater than or equal to 1.')
+        axes = tuple(ax[::factor].copy() for ax in self._axes)
+        return self._create_grid_from_axes(axes)
+
+    def _create_grid_from_axes(self, axes):
+        """Creates a new search grid of the same type from the given axes.
+
+        Notes:
+            Implement this method in a subclass to support
+            :meth:`create_decimated_grid`.
+        """
+        raise NotImplementedError()
+
     def create_refined_grids_at(self, *coords, **kwargs):
         """Creates multiple new search grids around the given coordinates.
 
@@ -273,6 +306,9 @@ class FarField1DSearchGrid(SearchGrid):
     def _create_source_placement(self):
         return FarField1DSourcePlacement(self._axes[0], self._units[0])
 
+    def _create_grid_from_axes(self, axes):
+        return FarField1DSearchGrid(unit=self._units[0], axes=axes)
+
     def create_refined_grid_at(self, coord, density=10, span=1):
         """Creates a finer search grid for 1D far-field sources.
         
@@ -353,6 +389,9 @@ class FarField2DSearchGrid(SearchGrid):
     def _create_source_placement(self):
         return FarField2DSourcePlacement(cartesian(*self._axes), self._units[0])
 
+    def _create_grid_from_axes(self, axes):
+        return FarField2DSearchGrid(unit=self._units[0], axes=axes)
+
     def create_refined_grid_at(self, coord, density=10, span=1):
         """Creates a finer search grid for 2D far-field sources.
         
@@ -414,7 +453,10 @@ class NearField2DSearchGrid(SearchGrid):
     def _create_source_placement(self):
         return NearField2DSourcePlacement(cartesian(*self._axes))
 
-    def create_refined_grids_at(self, coord, density=10, span=1):
+    def _create_grid_from_axes(self, axes):
+        return NearField2DSearchGrid(axes=axes)
+
+    def create_refined_grid_at(self, coord, density=10, span=1):
         """Creates a finer search grid for 2D near-field sources.
         
         Args:
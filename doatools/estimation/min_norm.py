@@ -1,8 +1,31 @@
 import numpy as np
 from .core import SpectrumBasedEstimatorBase, get_noise_subspace, \
-                  ensure_covariance_size, ensure_n_resolvable_sources
+                  ensure_covariance_size, ensure_covariance_batch_size, \
+                  ensure_n_resolvable_sources
 from ..utils.math import abs_squared
 
+def _get_min_norm_vector(En):
+    """Computes the Min-Norm vector d = En c^* / |c|^2, where c is the first
+    row of En.
+
+    Also supports a stack of noise subspaces, in which case a stack of
+    Min-Norm vectors is returned.
+    """
+    c = En[..., 0, :]
+    w = c.conj() / (np.linalg.norm(c, 2, axis=-1, keepdims=True)**2)
+    return (En @ w[..., np.newaxis])[..., 0].conj()
+
+def _get_min_norm_vector_from_signal_subspace(Es):
+    """Computes the Min-Norm vector from the signal subspace.
+
+    Because En En^H = I - Es Es^H, the Min-Norm vector is given by
+    (e_1 - Es s^H)^* / (1 - |s|^2), where s is the first row of Es.
+    """
+    s = Es[0, :]
+    d = -(Es @ s.conj())
+    d[0] += 1.0
+    return d.conj() / (1.0 - np.linalg.norm(s, 2)**2)
+
 class MinNorm(SpectrumBasedEstimatorBase):
     """Creates a spectrum-based Min-Norm estimator.
     
@@ -73,9 +96,43 @@ class MinNorm(SpectrumBasedEstimatorBase):
         # We compute the d vector from the noise subspace.
         # d = En c^* / |c|^2
         En = get_noise_subspace(R, k)
-        c = En[0, :]
-        w = c.conj() / (np.linalg.norm(c, 2)**2)
-        d = (En @ w).conj()
+        d = _get_min_norm_vector(En)
         # Spectrum = 1/|d^H a(\theta)|^2
         f_sp = lambda A: np.reciprocal(abs_squared(d @ A))
         return self._estimate(f_sp, k, **kwargs)
+
+    def estimate_from_subspace(self, Es, **kwargs):
+        """Estimates the source locations from a given signal subspace.
+
+        Args:
+            Es (~numpy.ndarray): An M x k matrix with orthonormal columns
+                spanning the signal subspace, where M must match the size of
+                the array design used when creating this estimator, and k is
+                the expected number of sources.
+            **kwargs: Other keyword arguments supported by :meth:`estimate`.
+
+        Returns:
+            Same as :meth:`estimate`.
+        """
+        if Es.ndim != 2 or Es.shape[0] != self._array.size:
+            raise ValueError(
+                'Expecting an {0} x k signal subspace. Got {1}.'
+                .format(self._array.size, Es.shape)
+            )
+        k = Es.shape[1]
+        ensure_n_resolvable_sources(k, self._array.size - 1)
+        d = _get_min_norm_vector_from_signal_subspace(Es)
+        f_sp = lambda A: np.reciprocal(abs_squared(d @ A))
+        return self._estimate(f_sp, k, **kwargs)
+
+    def estimate_batch(self, Rs, k, **kwargs):
+        """Estimates the source locations from a stack of covariance matrices.
+
+        See :meth:`~doatools.estimation.core.SpectrumBasedEstimatorBase.estimate_batch`
+        for more details.
+        """
+        ensure_covariance_batch_size(Rs, self._array)
+        ensure_n_resolvable_sources(k, self._array.size - 1)
+        D = _get_min_norm_vector(get_noise_subspace(Rs, k))
+        f_sp = lambda A: np.reciprocal(abs_squared(D @ A))
+        return self._estimate_batch(f_sp, k, **kwargs)
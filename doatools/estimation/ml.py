@@ -1,9 +1,17 @@
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import copy
+import time
 import numpy as np
-from scipy.optimize import minimize
-from ..model.sources import FarField1DSourcePlacement
-from ..utils.math import projm, vec
+from scipy.linalg import solve_triangular
+from scipy.optimize import minimize, minimize_scalar
+from ..model.arrays import UniformLinearArray
+from ..model.sources import FarField1DSourcePlacement, FarField2DSourcePlacement
+from ..utils.math import projm, vec, get_rng, abs_squared
 from .core import ensure_covariance_size, ensure_n_resolvable_sources
+from .grid import FarField1DSearchGrid, FarField2DSearchGrid
+from .music import MUSIC
 
 def f_nll_stouc(R, array, sources, wavelength, p, sigma):
     # log|S| + tr(S^{-1} R)
@@ -15,6 +23,241 @@ def f_nll_stouc(R, array, sources, wavelength, p, sigma):
         return np.Inf
     return logdet + np.trace(np.linalg.solve(S, R))
 
+def _get_projections(A):
+    """Computes the pseudo inverse of A, and the orthogonal projection matrix
+    onto the null space of A^H."""
+    A_pinv = np.linalg.pinv(A)
+    PPA = -(A @ A_pinv)
+    PPA[np.diag_indices_from(PPA)] += 1.0
+    return A_pinv, PPA
+
+def _qr_full_rank(A):
+    """Computes the reduced QR decomposition of A.
+
+    Returns:
+        tuple: ``(Q, T)`` such that A = Q T, or ``(None, None)`` if A is
+        numerically rank deficient (e.g., when two sources coincide), in which
+        case the callers fall back to the pseudo inverse.
+    """
+    Q, T = np.linalg.qr(A)
+    d = np.abs(np.diag(T))
+    if d.min() <= d.max() * max(A.shape) * np.finfo(np.float_).eps:
+        return None, None
+    return Q, T
+
+def _grad_trace_proj(A_pinv, PPA, B, DA):
+    r"""Evaluates the gradient of :math:`\mathrm{tr}(\mathbf{B}\mathbf{P}_{\mathbf{A}})`
+    with respect to the 1D source locations for a Hermitian :math:`\mathbf{B}`.
+
+    Because :math:`\partial\mathbf{P}_{\mathbf{A}} = \mathbf{X} + \mathbf{X}^H`
+    with :math:`\mathbf{X} = \mathbf{P}^\perp_{\mathbf{A}}
+    \partial\mathbf{A} \mathbf{A}^\dagger`, the i-th element of the gradient
+    is given by :math:`2\Re[\mathbf{A}^\dagger \mathbf{B}
+    \mathbf{P}^\perp_{\mathbf{A}} \dot{\mathbf{A}}]_{ii}`.
+    """
+    Y = A_pinv @ B @ PPA
+    return 2.0 * np.real(np.sum(Y.T * DA, axis=0))
+
+def _solve_ap(array, wavelength, B, sources0, grid_size=None, max_iter=20,
+              tol=1e-8):
+    r"""Minimizes :math:`\mathrm{tr}(\mathbf{P}^\perp_{\mathbf{A}} \mathbf{B})`
+    over 1D far-field source locations using alternating projection.
+
+    Each source location is updated in turn while the others are fixed by
+    maximizing :math:`\mathbf{b}^H \mathbf{B} \mathbf{b} / \mathbf{b}^H
+    \mathbf{b}`, where :math:`\mathbf{b}` is the projection of the steering
+    vector onto the orthogonal complement of the other steering vectors. Each
+    1D search consists of a grid search followed by a bounded refinement
+    within the neighboring grid cells. The initial locations are obtained
+    sequentially, adding one source at a time, such that ``sources0`` only
+    determines the number of sources and the unit.
+
+    Returns:
+        tuple: A tuple containing a flag indicating whether the iterations
+        converged, and the estimated source locations.
+    """
+    k = sources0.size
+    unit = sources0.units[0]
+    if grid_size is None:
+        grid_size = max(180, 8 * array.size)
+    grid = FarField1DSearchGrid(size=grid_size, unit=unit)
+    theta_grid = grid.axes[0]
+    step = theta_grid[1] - theta_grid[0]
+    lb, ub = sources0.valid_ranges[0]
+    A_grid = array.steering_matrix(grid.source_placement, wavelength,
+                                   perturbations='known')
+    BA_grid = B @ A_grid
+
+    def steering_vector(theta):
+        return array.steering_matrix(
+            FarField1DSourcePlacement(np.array([theta]), unit), wavelength,
+            perturbations='known'
+        )[:, 0]
+
+    def fitted_power(a, Ba, Q):
+        # b^H B b / b^H b with b = P^\perp_Q a, evaluated along the last
+        # axis of a (and Ba = B a).
+        if Q is None:
+            return np.real(np.sum(a.conj() * Ba, axis=0)) / \
+                np.real(np.sum(a.conj() * a, axis=0))
+        C = Q.conj().T @ a
+        b = a - Q @ C
+        Bb = Ba - (B @ Q) @ C
+        return np.real(np.sum(b.conj() * Bb, axis=0)) / \
+            np.real(np.sum(b.conj() * b, axis=0))
+
+    def search(others):
+        if len(others) == 0:
+            Q = None
+        else:
+            Q, _ = np.linalg.qr(np.stack([steering_vector(t) for t in others], axis=1))
+        theta = theta_grid[np.argmax(fitted_power(A_grid, BA_grid, Q))]
+        def neg_power(t):
+            a = steering_vector(t)[:, np.newaxis]
+            return -fitted_power(a, B @ a, Q)[0]
+        res = minimize_scalar(
+            neg_power, method='bounded',
+            bounds=(max(lb, theta - step), min(ub, theta + step)),
+            options={'xatol': tol}
+        )
+        return res.x
+
+    locations = []
+    for i in range(k):
+        locations.append(search(locations))
+    locations = np.array(locations)
+    for _ in range(max_iter):
+        delta = 0.0
+        for i in range(k):
+            theta = search(np.delete(locations, i))
+            delta = max(delta, abs(theta - locations[i]))
+            locations[i] = theta
+        if delta <= tol:
+            return True, np.sort(locations)
+    return False, np.sort(locations)
+
+def _solve_mode(array, wavelength, B, sources0, n_iter=2):
+    r"""Minimizes :math:`\mathrm{tr}(\mathbf{P}^\perp_{\mathbf{A}} \mathbf{B})`
+    for a uniform linear array using the polynomial parameterization of the
+    null space of :math:`\mathbf{A}^H`.
+
+    Let :math:`b(z) = \sum_{i=0}^k b_i z^i` be a polynomial whose roots are
+    :math:`e^{j 2\pi d_0 \sin\theta_l / \lambda}`, and :math:`\mathbf{T}` be the
+    :math:`(M-k) \times M` banded Toeplitz matrix such that
+    :math:`\mathbf{T}\mathbf{A} = \mathbf{0}`. Then
+    :math:`\mathbf{P}^\perp_{\mathbf{A}} = \mathbf{T}^H
+    (\mathbf{T}\mathbf{T}^H)^{-1}\mathbf{T}`. With
+    :math:`(\mathbf{T}\mathbf{T}^H)^{-1}` fixed at its previous estimate (the
+    identity in the first iteration), the objective function becomes a
+    quadratic form of the coefficients, which is minimized subject to the
+    conjugate symmetry constraint :math:`b_i = b_{k-i}^*` and a unit norm.
+    Two iterations give the MODE estimator, and further iterations give the
+    IQML estimator.
+
+    Returns:
+        tuple: A tuple containing a flag indicating whether the iterations
+        converged, and the estimated source locations.
+    """
+    k = sources0.size
+    m = array.size
+    # Real parameterization of the conjugate symmetric coefficients:
+    # b = U beta, where beta is real.
+    U = np.zeros((k + 1, k + 1), dtype=np.complex_)
+    for i in range(k // 2 + 1):
+        j = k - i
+        if i == j:
+            U[i, i] = 1.0
+        else:
+            U[i, i] = U[j, i] = 1.0
+            U[i, j] = 1j
+            U[j, j] = -1j
+    W = np.eye(m - k)
+    for _ in range(n_iter):
+        # tr(W T B T^H) = c^H Q c with c = conj(b), where
+        # Q[i,j] = sum_{r,s} W[s,r] B[r+i,s+j].
+        Wt = W.T
+        Q = np.empty((k + 1, k + 1), dtype=np.complex_)
+        for i in range(k + 1):
+            for j in range(k + 1):
+                Q[i, j] = np.sum(Wt * B[i:i+m-k, j:j+m-k])
+        Ur = U.conj()
+        F = np.real(Ur.conj().T @ Q @ Ur)
+        _, E = np.linalg.eigh(0.5 * (F + F.T))
+        b = U @ E[:, 0]
+        # Banded Toeplitz matrix T.
+        T = np.zeros((m - k, m), dtype=np.complex_)
+        for i in range(k + 1):
+            T[np.arange(m - k), np.arange(m - k) + i] = b[i]
+        W = np.linalg.inv(T @ T.conj().T)
+    z = np.roots(b[::-1])
+    if z.size != k:
+        return False, None
+    return True, FarField1DSourcePlacement.locations_from_z(
+        z, wavelength, array.d0, sources0.units[0]
+    )
+
+def _solve_structured(estimator, B, sources0, method, **kwargs):
+    """Solves the ML problem of CML/WSF estimators using alternating
+    projection or MODE, and updates the estimates of the estimator."""
+    if not estimator._supports_gradient(sources0):
+        raise ValueError(
+            "Method '{0}' is not supported for {1}."
+            .format(method, type(sources0).__name__)
+        )
+    if method == 'ap':
+        converged, locations = _solve_ap(
+            estimator._array, estimator._wavelength, B, sources0, **kwargs
+        )
+    else:
+        array = estimator._array
+        if not isinstance(array, UniformLinearArray) or \
+                any(p.is_known for p in array.perturbations):
+            raise ValueError(
+                "Method 'mode' requires a uniform linear array without known "
+                "perturbations."
+            )
+        converged, locations = _solve_mode(
+            array, estimator._wavelength, B, sources0, **kwargs
+        )
+    if not converged or np.any(np.isnan(locations)):
+        return False, None
+    estimator._estimates = FarField1DSourcePlacement(locations, sources0.units[0])
+    return True, estimator.get_last_estimates()
+
+class MLStartResult(namedtuple('MLStartResult', [
+        'start', 'estimates', 'objective', 'success', 'n_iterations',
+        'n_evaluations', 'elapsed'])):
+    """Summarizes the local optimization from one starting point in
+    :meth:`CovarianceBasedMLEstimator.estimate_multistart`.
+
+    Attributes:
+        start (~doatools.model.sources.SourcePlacement): The starting point.
+        estimates (~doatools.model.sources.SourcePlacement): The final source
+            locations.
+        objective (float): The final value of the objective function.
+        success (bool): Whether the solver exited successfully.
+        n_iterations (int): Number of iterations.
+        n_evaluations (int): Number of objective function evaluations.
+        elapsed (float): Wall time in seconds.
+    """
+    __slots__ = ()
+
+def _run_ml_start(estimator, R, sources0, use_gradient, kwargs):
+    """Runs the local solver of the estimator from the given starting point.
+
+    A shallow copy of the estimator is used such that multiple starting points
+    can be solved concurrently.
+    """
+    estimator = copy.copy(estimator)
+    t0 = time.perf_counter()
+    res = estimator._minimize(R, sources0, use_gradient, **kwargs)
+    estimator._update_estimates_from_x(res.x)
+    return MLStartResult(
+        sources0, estimator.get_last_estimates(), float(res.fun),
+        bool(res.success), int(res.nit), int(res.nfev),
+        time.perf_counter() - t0
+    )
+
 class CovarianceBasedMLEstimator(ABC):
     """Abstract base class for covariance based maximum-likelihood estimators.
     
@@ -45,6 +288,42 @@ class CovarianceBasedMLEstimator(ABC):
         """
         return self._array.size - 1
 
+    def _supports_gradient(self, sources0):
+        """Determines if the analytic gradient of the objective function is
+        available for the given type of sources.
+
+        The analytic gradient requires the derivative matrices of the steering
+        matrix, which are currently available for 1D far-field sources and
+        arrays with isotropic scalar elements.
+        """
+        if type(self)._eval_nll_and_grad is \
+                CovarianceBasedMLEstimator._eval_nll_and_grad:
+            return False
+        element = self._array.element
+        return isinstance(sources0, FarField1DSourcePlacement) and \
+            element.is_isotropic and element.is_scalar
+
+    def _eval_nll_and_grad(self, x, R, k):
+        """Evaluates the negative log-likelihood function and its gradient with
+        respect to the source locations.
+
+        Subclasses may override this method to provide analytic gradients,
+        which saves the 2kd extra objective evaluations per iteration required
+        by finite differences. Only called when :meth:`_supports_gradient`
+        returns ``True``.
+
+        Args:
+            x (~numpy.ndarray): A vector consisting of the variables being
+                optimized. See :meth:`_eval_nll` for more details.
+            R (~numpy.ndarray): The sample covariance matrix.
+            k (int): The number of sources.
+
+        Returns:
+            tuple: A tuple containing the value of the negative log-likelihood
+            function and its gradient, a vector of the same size as ``x``.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def _eval_nll(self, x, R, k):
         """Evaluates the negative log-likelihood function for the given input.
@@ -132,20 +411,24 @@ class CovarianceBasedMLEstimator(ABC):
             x[:n].reshape(self._estimates.locations.shape)
         )
 
-    def _eval_steering_matrix_from_x(self, x):
+    def _eval_steering_matrix_from_x(self, x, compute_derivatives=False):
         """Evaluates the steering matrix from ``x``.
         
         The default implementation first calls :meth:`update_estimates_from_x`
         to update ``self._estimates`` and then use it to evaluate the steering
-        matrix.
+        matrix. If ``compute_derivatives`` is ``True``, the derivative matrices
+        are also returned. See
+        :meth:`~doatools.model.arrays.ArrayDesign.steering_matrix` for more
+        details.
         """
         self._update_estimates_from_x(x)
         return self._array.steering_matrix(
             self._estimates, self._wavelength,
+            compute_derivatives=compute_derivatives,
             perturbations='known'
         )
     
-    def estimate(self, R, sources0, **kwargs):
+    def estimate(self, R, sources0, use_gradient=True, **kwargs):
         r"""Solves the ML problem for the given inputs.
 
         Args:
@@ -181,6 +464,16 @@ class CovarianceBasedMLEstimator(ABC):
         """
         ensure_n_resolvable_sources(sources0.size, self.get_max_resolvable_sources())
         ensure_covariance_size(R, self._array)
+        res = self._minimize(R, sources0, use_gradient, **kwargs)
+        if res.success:
+            self._update_estimates_from_x(res.x)
+            return True, self.get_last_estimates()
+        else:
+            return False, None
+
+    def _minimize(self, R, sources0, use_gradient=True, **kwargs):
+        """Runs the local solver from ``sources0`` and returns the
+        :class:`~scipy.optimize.OptimizeResult`."""
         # Make a copy of the initial guess as a working variable for the
         # optimization process.
         # This is reused and modified in-place during the optimization process
@@ -190,17 +483,167 @@ class CovarianceBasedMLEstimator(ABC):
         # Subclasses should override this implementation if there exists faster
         # optimization approaches.
         obj_func, x0, bounds = self._prepare_opt_prob(sources0, R)
-        res = minimize(
+        if use_gradient and self._supports_gradient(sources0):
+            k = sources0.size
+            obj_func = lambda x : self._eval_nll_and_grad(x, R, k)
+            kwargs['jac'] = True
+        return minimize(
             obj_func, x0,
             method='L-BFGS-B',
             bounds=bounds,
             **kwargs
         )
-        if res.success:
-            self._update_estimates_from_x(res.x)
-            return True, self.get_last_estimates()
+
+    def estimate_multistart(self, R, sources0, starts='music', n_starts=8,
+                            n_workers=1, pool='thread', use_gradient=True,
+                            rng=None, **kwargs):
+        r"""Solves the ML problem from multiple starting points and keeps the
+        solution with the smallest objective value.
+
+        Because the log-likelihood function is highly non-convex, a single
+        local optimization is easily trapped in a local minimum. This method
+        runs the local solver of :meth:`estimate` from ``sources0`` as well as
+        from ``n_starts`` generated starting points, optionally in parallel.
+
+        Args:
+            R (~numpy.ndarray): The sample covariance matrix.
+            sources0 (~doatools.model.sources.SourcePlacement): The first
+                starting point. Its type determines the source type, and its
+                size determines the number of sources.
+            starts: Specifies how the remaining starting points are generated.
+                Can be one of the following:
+
+                * ``'music'`` - The first start consists of the peaks of the
+                  MUSIC spectrum over the default search grid of the source
+                  type, and the others are obtained by randomly perturbing
+                  these peaks by about half of the beamwidth. This is the
+                  default value. Only available for far-field sources.
+                * ``'grid'`` - Deterministic starts where the sources are
+                  evenly spread over the valid ranges, shifted by a fraction of
+                  the spacing between the sources for each start.
+                * ``'random'`` - Source locations uniformly drawn from the
+                  valid ranges.
+                * A list of :class:`~doatools.model.sources.SourcePlacement`
+                  instances of the same type and size as ``sources0``.
+                  ``n_starts`` is ignored.
+
+            n_starts (int): Number of generated starting points. Default value
+                is 8.
+            n_workers (int): Number of workers used to run the local
+                optimizations concurrently. Default value is 1.
+            pool (str): ``'thread'`` (default) or ``'process'``. Specifies
+                whether a thread pool or a process pool is used when
+                ``n_workers`` is greater than 1. A process pool requires the
+                estimator to be picklable.
+            use_gradient (bool): Whether the analytic gradient is used when
+                available. Default value is ``True``.
+            rng: A random number generator (or a seed) used to generate the
+                ``'music'`` and ``'random'`` starts. If not specified, the
+                global random state of :mod:`numpy.random` is used.
+            **kwargs: Additional keyword arguments for the solver.
+
+        Returns:
+            tuple: A tuple containing the following elements:
+
+            * resolved (:class:`bool`): ``True`` if at least one local
+              optimization exited successfully.
+            * estimates (:class:`~doatools.model.sources.SourcePlacement`):
+              The estimated source locations with the smallest objective value
+              among the successful local optimizations. Will be ``None`` if
+              resolved is ``False``.
+            * report (:class:`list`): A list of :class:`MLStartResult`, one for
+              each starting point, in the order of the starting points.
+        """
+        ensure_n_resolvable_sources(sources0.size, self.get_max_resolvable_sources())
+        ensure_covariance_size(R, self._array)
+        if pool not in ['thread', 'process']:
+            raise ValueError("Pool must be either 'thread' or 'process'.")
+        if n_workers < 1:
+            raise ValueError('The number of workers must be a positive integer.')
+        if isinstance(starts, str):
+            start_list = [sources0] + self._generate_starts(
+                R, sources0, starts, n_starts, get_rng(rng))
         else:
-            return False, None
+            start_list = [sources0] + list(starts)
+            for s in start_list[1:]:
+                if type(s) != type(sources0) or s.size != sources0.size:
+                    raise ValueError(
+                        'Starting points must be {0} instances of size {1}.'
+                        .format(type(sources0).__name__, sources0.size)
+                    )
+        jobs = [(self, R, s, use_gradient, kwargs) for s in start_list]
+        if n_workers == 1:
+            report = [_run_ml_start(*job) for job in jobs]
+        else:
+            executor_cls = ThreadPoolExecutor if pool == 'thread' \
+                else ProcessPoolExecutor
+            with executor_cls(max_workers=n_workers) as executor:
+                report = list(executor.map(_run_ml_start, *zip(*jobs)))
+        best = None
+        for r in report:
+            if r.success and (best is None or r.objective < best.objective):
+                best = r
+        if best is None:
+            return False, None, report
+        self._estimates = best.estimates[:]
+        return True, self.get_last_estimates(), report
+
+    def _generate_starts(self, R, sources0, starts, n_starts, rng):
+        """Generates starting points for :meth:`estimate_multistart`."""
+        k = sources0.size
+        ranges = np.array(sources0.valid_ranges, dtype=np.float_)
+        if not np.all(np.isfinite(ranges)):
+            raise ValueError(
+                'Cannot generate starting points for {0} with unbounded '
+                'valid ranges.'.format(type(sources0).__name__)
+            )
+        lb, ub = ranges[:, 0], ranges[:, 1]
+        shape = sources0.locations.shape
+        gen = np.random if rng is None else rng
+        if starts == 'grid':
+            # Sources are evenly spread with a different offset for each start.
+            offsets = (np.arange(n_starts) + 0.5) / n_starts
+            locations = [
+                lb + (np.arange(k)[:, np.newaxis] + t) / k * (ub - lb)
+                for t in offsets
+            ]
+        elif starts == 'random':
+            locations = [gen.uniform(lb, ub, (k, lb.size))
+                         for _ in range(n_starts)]
+        elif starts == 'music':
+            if isinstance(sources0, FarField1DSourcePlacement):
+                grid = FarField1DSearchGrid(unit=sources0.units[0])
+            elif isinstance(sources0, FarField2DSourcePlacement):
+                grid = FarField2DSearchGrid(unit=sources0.units[0])
+            else:
+                raise ValueError(
+                    "Starts 'music' is not supported for {0}."
+                    .format(type(sources0).__name__)
+                )
+            resolved, peaks = MUSIC(self._array, self._wavelength, grid) \
+                .estimate(R, k)
+            if resolved:
+                peaks = peaks.locations.reshape((k, -1))
+            else:
+                peaks = sources0.locations.reshape((k, -1))
+            # Perturbations of about half of the beamwidth.
+            scale = (ub - lb) / (2 * self._array.size)
+            locations = [peaks] + [
+                np.clip(peaks + gen.normal(0.0, 1.0, peaks.shape) * scale,
+                        lb, ub)
+                for _ in range(n_starts - 1)
+            ]
+        else:
+            raise ValueError(
+                "Starts must be one of 'music', 'grid', 'random', or a list of "
+                "source placements."
+            )
+        start_list = []
+        for x in locations:
+            s = sources0[:]
+            np.copyto(s.locations, x.reshape(shape))
+            start_list.append(s)
+        return start_list
 
 class AMLEstimator(CovarianceBasedMLEstimator):
     r"""Asymptotic maximum-likelihood (AML) estimator.
@@ -240,8 +683,27 @@ class AMLEstimator(CovarianceBasedMLEstimator):
     def _eval_nll(self, x, R, k):
         # See 8.6.1 of the following:
         # * H. L. Van Trees, Optimum array processing. New York: Wiley, 2002.
-        m = self._array.size
         A = self._eval_steering_matrix_from_x(x)
+        Q, _ = _qr_full_rank(A)
+        if Q is None:
+            return self._eval_nll_pinv(A, R, k)
+        # With A = QT, the eigenvalues of the M x M matrix
+        # P_A R P_A + sigma P^\perp_A are the eigenvalues of Q^H R Q and
+        # sigma = tr(P^\perp_A R) / (m - k) with multiplicity m - k.
+        nll_val, _, _ = self._eval_nll_qr(Q, R @ Q, R, k)
+        return nll_val
+
+    def _eval_nll_qr(self, Q, RQ, R, k):
+        m = self._array.size
+        S = Q.conj().T @ RQ
+        sigma = np.real(np.trace(R) - np.trace(S)) / (m - k)
+        sgn, logdet = np.linalg.slogdet(S)
+        if sigma <= 0 or np.real(sgn) <= 0:
+            return np.Inf, S, sigma
+        return logdet + (m - k) * np.log(sigma), S, sigma
+
+    def _eval_nll_pinv(self, A, R, k):
+        m = self._array.size
         # Projection matrix of A
         PA = projm(A, True)
         # Null projection matrix of A
@@ -257,6 +719,44 @@ class AMLEstimator(CovarianceBasedMLEstimator):
         else:
             return nll_val
 
+    def _eval_nll_and_grad(self, x, R, k):
+        A, DA = self._eval_steering_matrix_from_x(x, True)
+        Q, T = _qr_full_rank(A)
+        if Q is None:
+            return self._eval_nll_and_grad_pinv(A, DA, R, k)
+        RQ = R @ Q
+        nll_val, S, sigma = self._eval_nll_qr(Q, RQ, R, k)
+        if np.isinf(nll_val):
+            return nll_val, np.zeros_like(x)
+        # With Z = P^\perp_A \dot{A}, the derivatives are given by
+        # 2 Re[T^{-1} (S^{-1} - I / sigma) Q^H R Z]_{ii}, S = Q^H R Q.
+        Z = DA - Q @ (Q.conj().T @ DA)
+        W = RQ.conj().T @ Z
+        Y = solve_triangular(T, np.linalg.solve(S, W) - W / sigma,
+                             check_finite=False)
+        return nll_val, 2.0 * np.real(np.diag(Y))
+
+    def _eval_nll_and_grad_pinv(self, A, DA, R, k):
+        m = self._array.size
+        A_pinv, PPA = _get_projections(A)
+        PA = np.eye(m) - PPA
+        sigma = np.real(np.sum(PPA * R.T)) / (m - k)
+        RPA = R @ PA
+        H = PA @ RPA + sigma * PPA
+        H += H.conj().T
+        H *= 0.5
+        sgn, nll_val = np.linalg.slogdet(H)
+        if sgn <= 0:
+            return np.Inf, np.zeros((A.shape[1],))
+        # d log|H| = tr(H^{-1} dH), where
+        # dH = dP R P + P R dP - sigma dP + dsigma P^\perp
+        # and dsigma = -tr(R dP) / (m - k).
+        G = np.linalg.inv(H)
+        C = RPA @ G
+        c = np.real(np.sum(G * PPA.T)) / (m - k)
+        B = C + C.conj().T - sigma * G - c * R
+        return nll_val, _grad_trace_proj(A_pinv, PPA, B, DA)
+
 class CMLEstimator(CovarianceBasedMLEstimator):
     r"""Conditional maximum-likelihood (CML) estimator.
     
@@ -299,10 +799,92 @@ class CMLEstimator(CovarianceBasedMLEstimator):
     def _eval_nll(self, x, R, k):
         # See 8.5.2 of the following:
         # * H. L. Van Trees, Optimum array processing. New York: Wiley, 2002.
-        # tr(P^\perp_A R)
+        # tr(P^\perp_A R) = tr(R) - tr(Q^H R Q), where A = QT.
         A = self._eval_steering_matrix_from_x(x)
-        PPA = np.eye(self._array.size) - projm(A, True)
-        return np.real(np.trace(PPA @ R))
+        Q, _ = _qr_full_rank(A)
+        if Q is None:
+            PPA = np.eye(self._array.size) - projm(A, True)
+            return np.real(np.trace(PPA @ R))
+        return np.real(np.trace(R) - np.sum(Q.conj() * (R @ Q)))
+
+    def _eval_nll_and_grad(self, x, R, k):
+        A, DA = self._eval_steering_matrix_from_x(x, True)
+        Q, T = _qr_full_rank(A)
+        if Q is None:
+            A_pinv, PPA = _get_projections(A)
+            return np.real(np.sum(PPA * R.T)), \
+                -_grad_trace_proj(A_pinv, PPA, R, DA)
+        RQ = R @ Q
+        # -2 Re[A^+ R P^\perp_A \dot{A}]_{ii} with A^+ = T^{-1} Q^H.
+        Z = DA - Q @ (Q.conj().T @ DA)
+        Y = solve_triangular(T, RQ.conj().T @ Z, check_finite=False)
+        return np.real(np.trace(R) - np.sum(Q.conj() * RQ)), \
+            -2.0 * np.real(np.diag(Y))
+
+    def estimate(self, R, sources0, method='lbfgsb', use_gradient=True,
+                 **kwargs):
+        r"""Solves the CML problem for the given inputs.
+
+        Args:
+            R (~numpy.ndarray): The sample covariance matrix.
+            sources0 (~doatools.model.sources.SourcePlacement): The initial
+                guess of source locations.
+            method (str): Specifies the solver. Can be one of the following:
+
+                * ``'lbfgsb'`` - Uses the L-BFGS-B solver from
+                  :meth:`scipy.optimize.minimize`. This is the default value.
+                * ``'ap'`` - Uses alternating projection, where each source
+                  location is updated in turn by a 1D grid search followed by
+                  a bounded refinement. The initial guess is obtained
+                  sequentially, so only the size and the unit of ``sources0``
+                  are used. Accepts the additional keyword arguments
+                  ``grid_size`` (default ``max(180, 8M)``), ``max_iter``
+                  (default 20), and ``tol`` (default 1e-8).
+                * ``'mode'`` - Uses the IQML algorithm with the polynomial
+                  parameterization, which requires a uniform linear array.
+                  The noise variance estimate is subtracted from ``R`` before
+                  the iterations, which does not change the minimizer of the
+                  CML objective but removes the bias of IQML due to the noise.
+                  The locations of ``sources0`` are not used. Accepts the
+                  additional keyword argument ``n_iter`` (default 2).
+
+                ``'ap'`` and ``'mode'`` are available for 1D far-field sources.
+            use_gradient (bool): Whether the analytic gradient is passed to the
+                L-BFGS-B solver when available. Default value is ``True``.
+            **kwargs: Additional keyword arguments for the solver.
+
+        Returns:
+            tuple: A tuple containing the following elements:
+
+            * resolved (:class:`bool`): ``True`` if the solver converged.
+            * estimates (:class:`~doatools.model.sources.SourcePlacement`):
+              The estimated source locations. Will be ``None`` if resolved is
+              ``False``.
+
+        References:
+            [1] I. Ziskind and M. Wax, "Maximum likelihood localization of
+            multiple sources by alternating projection," IEEE Trans. Acoust.,
+            Speech, Signal Process., vol. 36, no. 10, pp. 1553-1560, Oct. 1988.
+
+            [2] Y. Bresler and A. Macovski, "Exact maximum likelihood
+            parameter estimation of superimposed exponential signals in
+            noise," IEEE Trans. Acoust., Speech, Signal Process., vol. 34,
+            no. 5, pp. 1081-1089, Oct. 1986.
+        """
+        if method == 'lbfgsb':
+            return super().estimate(R, sources0, use_gradient, **kwargs)
+        if method not in ['ap', 'mode']:
+            raise ValueError("Method must be one of 'lbfgsb', 'ap', and 'mode'.")
+        ensure_n_resolvable_sources(sources0.size, self.get_max_resolvable_sources())
+        ensure_covariance_size(R, self._array)
+        if method == 'mode':
+            # Subtracting the noise variance estimate only changes the CML
+            # objective by a constant, but removes the bias of the IQML
+            # iterations caused by the noise.
+            m, k = self._array.size, sources0.size
+            sigma = np.mean(np.linalg.eigvalsh(R)[:m-k])
+            R = R - sigma * np.eye(m)
+        return _solve_structured(self, R, sources0, method, **kwargs)
 
 class WSFEstimator(CovarianceBasedMLEstimator):
     r"""Weighted subspace fitting (WSF) estimator.
@@ -321,6 +903,24 @@ class WSFEstimator(CovarianceBasedMLEstimator):
     :math:`\hat{\mathbf{W}}` is a diagonal matrix consists of asymptotically
     optimal weights.
 
+    In addition to the generic quasi-Newton solver, the WSF objective can be
+    minimized with the scoring method (``method='scoring'``), which uses the
+    asymptotic (Gauss-Newton) Hessian
+
+    .. math::
+
+        2\Re\left\lbrace
+            (\dot{\mathbf{A}}^H \mathbf{P}^\perp_{\mathbf{A}}
+             \dot{\mathbf{A}})
+            \odot
+            (\mathbf{A}^\dagger \hat{\mathbf{U}}_\mathrm{s}
+             \hat{\mathbf{W}} \hat{\mathbf{U}}_\mathrm{s}^H
+             \mathbf{A}^{\dagger H})^T
+        \right\rbrace,
+
+    and usually converges within a few iterations from a reasonable initial
+    guess.
+
     References:
         [1] M. Viberg and B. Ottersten, "Sensor array processing based on
         subspace fitting," IEEE Transactions on Signal Processing, vol. 39,
@@ -331,6 +931,14 @@ class WSFEstimator(CovarianceBasedMLEstimator):
         [3] P. Stoica and K. Sharman, "Maximum likelihood methods for
         direction-of-arrival estimation," IEEE Trans. Acoust., Speech, Signal
         Process., vol. 38, pp. 1132-1143, July 1990.
+
+        [4] M. Viberg, B. Ottersten, and T. Kailath, "Detection and estimation
+        in sensor arrays using weighted subspace fitting," IEEE Transactions
+        on Signal Processing, vol. 39, no. 11, pp. 2436-2449, Nov. 1991.
+
+        [5] P. Stoica and K. C. Sharman, "Novel eigenanalysis method for
+        direction estimation," IEE Proceedings F - Radar and Signal
+        Processing, vol. 137, no. 1, pp. 19-26, Feb. 1990.
     """
 
     def _prepare_m(self, sources0, R):
@@ -346,8 +954,10 @@ class WSFEstimator(CovarianceBasedMLEstimator):
         # Asymptotically optimal weights
         vt = vs - sigma_est
         w = vt * vt / vs
-        # M = Es diag(w) Es^H
-        self._M = (Es * w) @ Es.conj().T
+        # M = Es diag(w) Es^H = F F^H
+        self._F = Es * np.sqrt(w)
+        self._trace_m = np.sum(w)
+        self._M = self._F @ self._F.conj().T
 
     def _prepare_opt_prob(self, sources0, R):
         self._prepare_m(sources0, R)
@@ -357,6 +967,141 @@ class WSFEstimator(CovarianceBasedMLEstimator):
         # See 8.5.3 of the following:
         # * H. L. Van Trees, Optimum array processing. New York: Wiley, 2002.
         A = self._eval_steering_matrix_from_x(x)
-        PPA = np.eye(self._array.size) - projm(A, True)
-        # tr(P^\perp_A M)
-        return np.real(np.trace(PPA @ self._M))
+        Q, _ = _qr_full_rank(A)
+        if Q is None:
+            PPA = np.eye(self._array.size) - projm(A, True)
+            return np.real(np.trace(PPA @ self._M))
+        # tr(P^\perp_A M) = tr(M) - ||Q^H F||_F^2, where A = QT.
+        return self._trace_m - np.sum(abs_squared(Q.conj().T @ self._F))
+
+    def _eval_nll_and_grad(self, x, R, k):
+        A, DA = self._eval_steering_matrix_from_x(x, True)
+        Q, T = _qr_full_rank(A)
+        if Q is None:
+            A_pinv, PPA = _get_projections(A)
+            return np.real(np.sum(PPA * self._M.T)), \
+                -_grad_trace_proj(A_pinv, PPA, self._M, DA)
+        QF = Q.conj().T @ self._F
+        Z = DA - Q @ (Q.conj().T @ DA)
+        Y = solve_triangular(T, QF @ (self._F.conj().T @ Z),
+                             check_finite=False)
+        return self._trace_m - np.sum(abs_squared(QF)), \
+            -2.0 * np.real(np.diag(Y))
+
+    def _eval_grad_and_hessian(self, x):
+        """Evaluates the gradient and the asymptotic Hessian of the WSF
+        objective function."""
+        A, DA = self._eval_steering_matrix_from_x(x, True)
+        Q, T = _qr_full_rank(A)
+        if Q is None:
+            A_pinv, PPA = _get_projections(A)
+            grad = -_grad_trace_proj(A_pinv, PPA, self._M, DA)
+            H = (DA.conj().T @ PPA @ DA) * (A_pinv @ self._M @ A_pinv.conj().T).T
+            return grad, 2.0 * np.real(H)
+        # A^+ F = T^{-1} Q^H F and P^\perp_A \dot{A} = Z
+        V = solve_triangular(T, Q.conj().T @ self._F, check_finite=False)
+        Z = DA - Q @ (Q.conj().T @ DA)
+        grad = -2.0 * np.real(np.diag(V @ (self._F.conj().T @ Z)))
+        H = (Z.conj().T @ Z) * (V @ V.conj().T).T
+        return grad, 2.0 * np.real(H)
+
+    def estimate(self, R, sources0, method='lbfgsb', use_gradient=True,
+                 **kwargs):
+        r"""Solves the WSF problem for the given inputs.
+
+        Args:
+            R (~numpy.ndarray): The sample covariance matrix.
+            sources0 (~doatools.model.sources.SourcePlacement): The initial
+                guess of source locations.
+            method (str): Specifies the solver. Can be one of the following:
+
+                * ``'lbfgsb'`` - Uses the L-BFGS-B solver from
+                  :meth:`scipy.optimize.minimize`. This is the default value.
+                * ``'scoring'`` - Uses the scoring method with the asymptotic
+                  Hessian and a backtracking line search. Only available
+                  when the analytic gradient is available (currently for 1D
+                  far-field sources).
+                * ``'ap'`` - Uses alternating projection. See
+                  :meth:`CMLEstimator.estimate` for more details.
+                * ``'mode'`` - Uses the method of direction estimation (MODE),
+                  which requires a uniform linear array. See
+                  :meth:`CMLEstimator.estimate` for more details.
+
+            use_gradient (bool): Whether the analytic gradient is passed to the
+                L-BFGS-B solver when available. Default value is ``True``.
+            **kwargs: Additional keyword arguments for the solver. For the
+                scoring method, ``max_iter`` (default 50) specifies the maximum
+                number of iterations, and ``tol`` (default 1e-10) specifies the
+                tolerance of the step size. See :meth:`CMLEstimator.estimate`
+                for the keyword arguments of ``'ap'`` and ``'mode'``.
+
+        Returns:
+            tuple: A tuple containing the following elements:
+
+            * resolved (:class:`bool`): ``True`` if the solver converged.
+            * estimates (:class:`~doatools.model.sources.SourcePlacement`):
+              The estimated source locations. Will be ``None`` if resolved is
+              ``False``.
+        """
+        if method == 'lbfgsb':
+            return super().estimate(R, sources0, use_gradient, **kwargs)
+        if method in ['ap', 'mode']:
+            ensure_n_resolvable_sources(sources0.size, self.get_max_resolvable_sources())
+            ensure_covariance_size(R, self._array)
+            self._prepare_m(sources0, R)
+            return _solve_structured(self, self._M, sources0, method, **kwargs)
+        if method != 'scoring':
+            raise ValueError(
+                "Method must be one of 'lbfgsb', 'scoring', 'ap', and 'mode'."
+            )
+        if not self._supports_gradient(sources0):
+            raise ValueError(
+                'The scoring method is not supported for {0}.'
+                .format(type(sources0).__name__)
+            )
+        ensure_n_resolvable_sources(sources0.size, self.get_max_resolvable_sources())
+        ensure_covariance_size(R, self._array)
+        self._estimates = sources0[:]
+        obj_func, x, bounds = self._prepare_opt_prob(sources0, R)
+        converged = self._solve_scoring(obj_func, x, bounds, **kwargs)
+        if converged:
+            return True, self.get_last_estimates()
+        else:
+            return False, None
+
+    def _solve_scoring(self, f, x, bounds, max_iter=50, tol=1e-10):
+        """Minimizes the WSF objective function using the scoring method.
+
+        Upon exit, ``self._estimates`` holds the last iterate.
+
+        Returns:
+            bool: ``True`` if the iterations converged.
+        """
+        lb, ub = np.array(bounds).T
+        f_x = f(x)
+        for _ in range(max_iter):
+            grad, H = self._eval_grad_and_hessian(x)
+            try:
+                step = np.linalg.solve(H, grad)
+            except np.linalg.LinAlgError:
+                step = np.linalg.lstsq(H, grad, rcond=None)[0]
+            # Backtracking line search.
+            mu = 1.0
+            for _ in range(30):
+                x_new = np.clip(x - mu * step, lb, ub)
+                f_new = f(x_new)
+                if f_new <= f_x:
+                    break
+                mu *= 0.5
+            else:
+                # No further decrease is possible within the numerical
+                # precision.
+                self._update_estimates_from_x(x)
+                return True
+            delta = np.max(np.abs(x_new - x))
+            x, f_x = x_new, f_new
+            if delta <= tol:
+                self._update_estimates_from_x(x)
+                return True
+        self._update_estimates_from_x(x)
+        return False
@@ -3,8 +3,12 @@ from math import ceil
 from scipy.signal import find_peaks
 import warnings
 from ..model.sources import FarField1DSourcePlacement
+from ..utils.math import abs_squared
 from .core import SpectrumBasedEstimatorBase, get_noise_subspace, \
-                  ensure_covariance_size, ensure_n_resolvable_sources
+                  ensure_covariance_size, ensure_covariance_batch_size, \
+                  ensure_n_resolvable_sources, get_unitary_matrix, \
+                  unitary_transform, to_real_covariance, \
+                  supports_unitary_processing
 
 def f_music(A, En):
     r"""Computes the classical MUSIC spectrum
@@ -21,10 +25,78 @@ def f_music(A, En):
             m is the number of sensors and k is the number of candidate
             direction-of-arrivals.
         En: m x d matrix of noise eigenvectors, where d is the dimension of the
-            noise subspace.
+            noise subspace. Can also be a T x m x d stack of noise
+            eigenvectors, in which case a T x k matrix is returned with the
+            t-th row being the spectrum for the t-th noise subspace.
     """
-    v = En.T.conj() @ A
-    return np.reciprocal(np.sum(v * v.conj(), axis=0).real)
+    if En.ndim == 2:
+        v = En.T.conj() @ A
+        return np.reciprocal(np.sum(v * v.conj(), axis=0).real)
+    # Because A is shared, stacking all noise eigenvectors together leads to a
+    # single large matrix multiplication, which is much faster than a batched
+    # matrix multiplication.
+    n, m, d = En.shape
+    v = np.swapaxes(En, 1, 2).reshape((n * d, m)).conj() @ A
+    return np.reciprocal(np.sum(abs_squared(v).reshape((n, d, -1)), axis=1))
+
+def f_music_real(A, Er):
+    r"""Computes the real-valued MUSIC spectrum of a centro-symmetric array.
+
+    The spectrum is given by
+
+    .. math::
+        P_{\mathrm{MUSIC}}(\theta)
+        = \frac{1}{\|\mathbf{E}_\mathrm{r}^T \mathbf{Q}^H
+                       \mathbf{a}(\theta)\|^2},
+
+    where :math:`\mathbf{E}_\mathrm{r}` consists of the real noise
+    eigenvectors of the transformed covariance matrix (see
+    :meth:`~doatools.estimation.core.to_real_covariance`) and
+    :math:`\mathbf{Q}` is the unitary matrix given by
+    :meth:`~doatools.estimation.core.get_unitary_matrix`. Because
+    :math:`\mathbf{E}_\mathrm{r}` is real, the projection only requires real
+    matrix multiplications, which halves the arithmetic cost.
+
+    Args:
+        A: m x k steering matrix of candidate direction-of-arrivals.
+        Er: m x d matrix of real noise eigenvectors. Can also be a T x m x d
+            stack, in which case a T x k matrix is returned.
+    """
+    B = unitary_transform(A)
+    # Viewing B as a real matrix with interleaved real and imaginary parts
+    # makes the projection a single real matrix multiplication.
+    Bf = B.view(np.float_)
+    if Er.ndim == 2:
+        v = Er.T @ Bf
+        np.square(v, out=v)
+        return np.reciprocal(np.sum(v, axis=0).reshape((-1, 2)).sum(axis=1))
+    n, m, d = Er.shape
+    v = np.swapaxes(Er, 1, 2).reshape((n * d, m)) @ Bf
+    np.square(v, out=v)
+    v = np.sum(v.reshape((n, d, -1)), axis=1)
+    return np.reciprocal(v.reshape((n, -1, 2)).sum(axis=2))
+
+def f_music_signal(A, Es):
+    r"""Computes the classical MUSIC spectrum from the signal subspace.
+
+    Because :math:`\mathbf{E}_\mathrm{n}\mathbf{E}_\mathrm{n}^H
+    = \mathbf{I} - \mathbf{E}_\mathrm{s}\mathbf{E}_\mathrm{s}^H`, the
+    MUSIC spectrum can be computed without the noise subspace:
+
+    .. math::
+        P_{\mathrm{MUSIC}}(\theta)
+        = \frac{1}{\|\mathbf{a}(\theta)\|^2
+                   - \|\mathbf{E}_\mathrm{s}^H \mathbf{a}(\theta)\|^2}
+
+    Args:
+        A: m x k steering matrix of candidate direction-of-arrivals.
+        Es: m x d matrix with orthonormal columns spanning the signal subspace,
+            where d is the number of sources.
+    """
+    v = Es.T.conj() @ A
+    p = np.sum(abs_squared(A), axis=0) - np.sum(abs_squared(v), axis=0)
+    # Guards against negative values caused by round-off errors.
+    return np.reciprocal(np.maximum(p, np.finfo(np.float_).eps))
 
 class MUSIC(SpectrumBasedEstimatorBase):
     """Creates a spectrum-based MUSIC estimator.
@@ -33,11 +105,34 @@ class MUSIC(SpectrumBasedEstimatorBase):
     :meth:`~doatools.estimation.music.f_music`, and the source locations are
     estimated by identifying the peaks.
 
+    For uniform linear arrays, the spectrum can be computed with FFTs of the
+    noise eigenvectors. See the ``fft_spectrum`` option of
+    :class:`~doatools.estimation.core.SpectrumBasedEstimatorBase`.
+
+    For centro-symmetric arrays, the covariance matrix can be transformed into
+    a real symmetric matrix (see
+    :meth:`~doatools.estimation.core.to_real_covariance`), such that the
+    eigendecomposition and the spectrum are computed in real arithmetic
+    (see :meth:`~doatools.estimation.music.f_music_real`). This is equivalent
+    to MUSIC with forward-backward averaging.
+
     Args:
         array (~doatools.model.arrays.ArrayDesign): Array design.
         wavelength (float): Wavelength of the carrier wave.
         search_grid (~doatools.estimation.grid.SearchGrid): The search grid
             used to locate the sources.
+        real_valued (bool or str): Specifies whether real-valued processing is
+            used. If set to ``'auto'``, real-valued processing is enabled when
+            the array is centro-symmetric with isotropic scalar elements and
+            no known perturbations. Default value is ``False``, which gives
+            the classical MUSIC.
+
+            Note that real-valued processing is MUSIC with forward-backward
+            averaging, whose finite-sample behavior differs from that of the
+            classical MUSIC. In particular, the asymptotic error covariance
+            given by :meth:`~doatools.performance.mse.ecov_music_1d` is derived
+            for the classical MUSIC. With ``'auto'``, uniform linear and
+            rectangular arrays use forward-backward averaging.
         **kwargs: Other keyword arguments supported by
             :class:`~doatools.estimation.core.SpectrumBasedEstimatorBase`.
     
@@ -47,9 +142,40 @@ class MUSIC(SpectrumBasedEstimatorBase):
         vol. 34, no. 3, pp. 276-280, Mar. 1986.
     """
 
-    def __init__(self, array, wavelength, search_grid, **kwargs):
+    def __init__(self, array, wavelength, search_grid, real_valued=False,
+                 **kwargs):
         super().__init__(array, wavelength, search_grid, **kwargs)
-        
+        if real_valued == 'auto':
+            real_valued = supports_unitary_processing(array)
+        elif real_valued is True and not supports_unitary_processing(array):
+            raise ValueError(
+                'Real-valued processing requires a centro-symmetric array '
+                'with isotropic scalar elements and no known perturbations.'
+            )
+        elif real_valued not in [True, False]:
+            raise ValueError("real_valued must be True, False, or 'auto'.")
+        self._real_valued = real_valued
+
+    @property
+    def is_real_valued(self):
+        """Retrieves whether real-valued processing is used."""
+        return self._real_valued
+
+    def _estimate_music(self, R, k, estimate_func, **kwargs):
+        """Computes the noise subspace and performs the spectrum search using
+        either complex-valued or real-valued processing."""
+        if self._real_valued:
+            Er = get_noise_subspace(to_real_covariance(R), k)
+            f_sp = lambda A: f_music_real(A, Er)
+            # The FFT evaluator requires the complex noise subspace, Q Er.
+            f_sp_fft = lambda ev: np.reciprocal(
+                ev.evaluate_power(get_unitary_matrix(Er.shape[-2]) @ Er))
+        else:
+            En = get_noise_subspace(R, k)
+            f_sp = lambda A: f_music(A, En)
+            f_sp_fft = lambda ev: np.reciprocal(ev.evaluate_power(En))
+        return estimate_func(f_sp, k, f_sp_fft=f_sp_fft, **kwargs)
+
     def estimate(self, R, k, **kwargs):
         """Estimates the source locations from the given covariance matrix.
 
@@ -90,8 +216,109 @@ class MUSIC(SpectrumBasedEstimatorBase):
         """
         ensure_covariance_size(R, self._array)
         ensure_n_resolvable_sources(k, self._array.size - 1)
+        return self._estimate_music(R, k, self._estimate, **kwargs)
+
+    def estimate_from_subspace(self, Es, **kwargs):
+        """Estimates the source locations from a given signal subspace.
+
+        This is useful when the signal subspace is obtained without the
+        eigendecomposition of a covariance matrix, e.g., by a
+        :class:`~doatools.estimation.subspace_tracking.SubspaceTracker`.
+
+        Args:
+            Es (~numpy.ndarray): An M x k matrix with orthonormal columns
+                spanning the signal subspace, where M must match the size of
+                the array design used when creating this estimator, and k is
+                the expected number of sources.
+            **kwargs: Other keyword arguments supported by :meth:`estimate`.
+
+        Returns:
+            Same as :meth:`estimate`.
+        """
+        if Es.ndim != 2 or Es.shape[0] != self._array.size:
+            raise ValueError(
+                'Expecting an {0} x k signal subspace. Got {1}.'
+                .format(self._array.size, Es.shape)
+            )
+        k = Es.shape[1]
+        ensure_n_resolvable_sources(k, self._array.size - 1)
+        m = self._array.size
+        return self._estimate(
+            lambda A: f_music_signal(A, Es), k,
+            f_sp_fft=lambda ev: np.reciprocal(np.maximum(
+                m - ev.evaluate_power(Es), np.finfo(np.float_).eps
+            )), **kwargs
+        )
+
+    def estimate_batch(self, Rs, k, **kwargs):
+        """Estimates the source locations from a stack of covariance matrices.
+
+        The eigendecompositions, the spectra and the peak finding are all
+        performed in a vectorized manner. See
+        :meth:`~doatools.estimation.core.SpectrumBasedEstimatorBase.estimate_batch`
+        for more details.
+        """
+        ensure_covariance_batch_size(Rs, self._array)
+        ensure_n_resolvable_sources(k, self._array.size - 1)
+        return self._estimate_music(Rs, k, self._estimate_batch, **kwargs)
+
+def _get_diagonal_sums(C):
+    """Computes the sums of all the diagonals of a square matrix (or a stack of
+    square matrices).
+
+    The l-th element (l = 0, 1, ..., 2m-2) of the output is the sum of the
+    (m-1-l)-th diagonal, i.e., the sum of C[i, j] with j - i = m - 1 - l.
+    """
+    m = C.shape[-1]
+    lead = C.shape[:-2]
+    # Pads each row of the column-flipped matrix to length 2m, so that
+    # reading the flattened rows with a stride of 2m - 1 shifts the i-th row
+    # by i elements, aligning the diagonals as columns.
+    Z = np.zeros(lead + (m, 2 * m), dtype=C.dtype)
+    Z[..., :m] = C[..., ::-1]
+    Z = Z.reshape(lead + (2 * m * m,))[..., :m * (2 * m - 1)]
+    return Z.reshape(lead + (m, 2 * m - 1)).sum(axis=-2)
+
+def _root_music(R, k, unitary=False):
+    """Root-MUSIC engine that supports both a single covariance matrix and a
+    stack of covariance matrices. If ``unitary`` is ``True``, the noise
+    subspace is obtained in real arithmetic from the transformed covariance
+    matrix.
+
+    Returns:
+        A tuple (resolved, z), where resolved is a boolean vector of length T
+        and z is a T x k matrix of the selected roots. A single covariance
+        matrix is treated as a stack of size one.
+    """
+    if R.ndim == 2:
+        R = R[np.newaxis]
+    if unitary:
+        En = get_unitary_matrix(R.shape[1]) @ \
+            get_noise_subspace(to_real_covariance(R), k)
+    else:
         En = get_noise_subspace(R, k)
-        return self._estimate(lambda A: f_music(A, En), k, **kwargs)
+    # The coefficients of the polynomial are the diagonal sums of En En^H,
+    # starting from the upper right corner.
+    C = En @ np.swapaxes(En, 1, 2).conj()
+    coeff = _get_diagonal_sums(C)
+    # Roots are the eigenvalues of the companion matrices, which is how
+    # np.roots works.
+    n = coeff.shape[1] - 1
+    companion = np.zeros((coeff.shape[0], n, n), dtype=np.complex_)
+    companion[:, 0, :] = -coeff[:, 1:] / coeff[:, :1]
+    companion[:, np.arange(1, n), np.arange(n - 1)] = 1.0
+    z = np.linalg.eigvals(companion)
+    # The roots appear in conjugate reciprocal pairs (z, 1/z^*). The half
+    # with smaller magnitudes consists of the roots inside the unit circle.
+    # If a pair lies on the unit circle, exactly one of them is kept.
+    # Among them, the k roots closest to the unit circle are selected.
+    absz = np.abs(z)
+    order = np.argsort(absz, axis=1)
+    selected = order[:, n // 2 - k:n // 2]
+    z = np.take_along_axis(z, selected, axis=1)
+    resolved = np.all(np.isfinite(z), axis=1) & \
+        np.all(np.take_along_axis(absz, selected, axis=1) <= 1.0 + 1e-8, axis=1)
+    return resolved, z
 
 class RootMUSIC1D:
     """Creates a root-MUSIC estimator for uniform linear arrays.
@@ -108,12 +335,17 @@ class RootMUSIC1D:
         [2] B. D. Rao and K. V. S. Hari, "Performance analysis of Root-Music,"
         IEEE Transactions on Acoustics, Speech, and Signal Processing, vol. 37,
         no. 12, pp. 1939-1949, Dec. 1989.
+
+        [3] M. Pesavento, A. B. Gershman and M. Haardt, "Unitary root-MUSIC
+        with a real-valued eigendecomposition: a theoretical and experimental
+        performance study," IEEE Transactions on Signal Processing, vol. 48,
+        no. 5, pp. 1306-1314, May 2000.
     """
 
     def __init__(self, wavelength):
         self._wavelength = wavelength
 
-    def estimate(self, R, k, d0=None, unit='rad'):
+    def estimate(self, R, k, d0=None, unit='rad', unitary=False):
         """Estimates the direction-of-arrivals of 1D far-field sources.
 
         Args:
@@ -127,6 +359,12 @@ class RootMUSIC1D:
             unit (str): Unit of the estimates. Default value is ``'rad'``.
                 See :class:`~doatools.model.sources.FarField1DSourcePlacement`
                 for more details on valid units.
+            unitary (bool): Set to ``True`` to use Unitary Root-MUSIC, where
+                the noise subspace is obtained in real arithmetic from the
+                transformed covariance matrix (see
+                :meth:`~doatools.estimation.core.to_real_covariance`). This
+                also incorporates forward-backward averaging. Default value is
+                ``False``.
         
         Returns:
             A tuple with the following elements.
@@ -147,42 +385,46 @@ class RootMUSIC1D:
         ensure_n_resolvable_sources(k, m - 1)
         if d0 is None:
             d0 = self._wavelength / 2.0
-        En = get_noise_subspace(R, k)
-        # Compute the coefficients for the polynomial.
-        C = En @ En.T.conj()
-        coeff = np.zeros((m - 1,), dtype=np.complex_)
-        for i in range(1, m):
-            coeff[i - 1] += np.sum(np.diag(C, i))
-        coeff = np.hstack((coeff[::-1], np.sum(np.diag(C)), coeff.conj()))
-        # Find the roots of the polynomial.
-        z = np.roots(coeff)
-        # Find k points inside the unit circle that are also closest to the unit
-        # circle.
-        nz = len(z)
-        mask = np.ones((nz,), dtype=np.bool_)
-        for i in range(nz):
-            absz = abs(z[i])
-            if absz > 1.0:
-                # Outside the unit circle.
-                mask[i] = False
-            elif absz == 1.0:
-                # On the unit circle. Need to find the closest point and remove
-                # it.
-                idx = -1
-                dist = np.inf
-                for j in range(nz):
-                    if j != i and mask[j]:
-                        cur_dist = abs(z[i] - z[j])
-                        if cur_dist < dist:
-                            dist = cur_dist
-                            idx = j
-                if idx < 0:
-                    raise RuntimeError('Unpaired point found on the unit circle, which is impossible.')
-                mask[idx] = False
-        z = z[mask]
-        sorted_indices = np.argsort(1.0 - np.abs(z))
-        if len(z) < k:
+        resolved, z = _root_music(R, k, unitary)
+        if not resolved[0]:
             return False, None
-        else:
-            z = z[sorted_indices[:k]]
-            return True, FarField1DSourcePlacement.from_z(z, self._wavelength, d0, unit)
+        return True, FarField1DSourcePlacement.from_z(z[0], self._wavelength, d0, unit)
+
+    def estimate_batch(self, Rs, k, d0=None, unit='rad', unitary=False):
+        """Estimates the direction-of-arrivals of 1D far-field sources from a
+        stack of covariance matrices.
+
+        The polynomial construction, the rooting, and the root selection are
+        all vectorized over the covariance matrices.
+
+        Args:
+            Rs (~numpy.ndarray): A T x M x M stack of covariance matrices
+                obtained using a uniform linear array.
+            k (int): Expected number of sources.
+            d0 (float): Inter-element spacing of the uniform linear array.
+                Default value is ``None``.
+            unit (str): Unit of the estimates. Default value is ``'rad'``.
+            unitary (bool): Set to ``True`` to use Unitary Root-MUSIC. Default
+                value is ``False``.
+
+        Returns:
+            A tuple with the following elements.
+
+            * resolved (:class:`~numpy.ndarray`): A boolean vector of length T
+              indicating whether the desired number of sources are found for
+              each covariance matrix.
+            * estimates (:class:`~numpy.ndarray`): A T x k array of the
+              estimated source locations, measured in the specified unit.
+              Each row is sorted in ascending order. Rows corresponding to
+              unresolved inputs are filled with NaNs.
+        """
+        if Rs.ndim != 3 or Rs.shape[1] != Rs.shape[2]:
+            raise ValueError('Rs should be a stack of square matrices.')
+        ensure_n_resolvable_sources(k, Rs.shape[1] - 1)
+        if d0 is None:
+            d0 = self._wavelength / 2.0
+        resolved, z = _root_music(Rs, k, unitary)
+        estimates = FarField1DSourcePlacement.locations_from_z(
+            z, self._wavelength, d0, unit)
+        estimates[~resolved, :] = np.nan
+        return resolved, estimates
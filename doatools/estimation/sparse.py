@@ -1,7 +1,11 @@
 import warnings
 from abc import ABC, abstractmethod
 import numpy as np
-from .core import SpectrumBasedEstimatorBase, ensure_covariance_size
+from .core import SpectrumBasedEstimatorBase, TopKPeakFinder, \
+                  ensure_covariance_size, ensure_covariance_batch_size, \
+                  ensure_n_resolvable_sources
+from ..model.coarray import WeightFunction1D
+from ..model.sources import FarField1DSourcePlacement, FarField2DSourcePlacement
 from ..optim.l1lsq import L1RegularizedLeastSquaresProblem, \
                           L21RegularizedLeastSquaresProblem
 from ..utils.math import khatri_rao, vec
@@ -45,6 +49,31 @@ class SparseCovarianceMatching(SpectrumBasedEstimatorBase):
             used to locate the sources.
         formulation (str): ``'penalizedl1'``, ``'constrainedl1'``, or
             ``'constrainedl2'``.
+        reduction (str): Specifies how the redundant entries of the covariance
+            matrix are removed from the sparse representation:
+
+            * ``'none'`` - All the :math:`2M^2` real and imaginary parts of
+              :math:`\mathrm{vec}(\mathbf{R})` are used. This is the default
+              value.
+            * ``'hermitian'`` - Because :math:`\mathbf{R}` is Hermitian, only
+              the :math:`M(M+1)/2` entries on and above the diagonal are used,
+              and the real and imaginary parts of the off-diagonal entries are
+              scaled by :math:`\sqrt{2}`. This leads to a real dictionary of
+              :math:`M^2` rows (half of the original size) with exactly the
+              same objective function, and hence the same solutions.
+            * ``'coarray'`` - For 1D grid-based arrays and far-field sources,
+              the entries of :math:`\mathbf{R}` associated with the same
+              difference of the sensor locations (lag) share the same row in
+              :math:`\mathbf{\Phi}`. The entries are therefore averaged over
+              each unique nonnegative lag of the difference coarray
+              (redundancy averaging), and the rows are scaled by the square
+              roots of the weight function such that the objective function
+              differs from the original one only by a constant. The number of
+              rows is reduced to :math:`2L - 1`, where :math:`L` is the number
+              of unique nonnegative lags. For the ``'constrainedl2'``
+              formulation, the residual bound is converted accordingly.
+              Known perturbations are not supported.
+
         **kwargs: Other keyword arguments supported by
             :class:`~doatools.estimation.core.SpectrumBasedEstimatorBase`.
 
@@ -64,12 +93,29 @@ class SparseCovarianceMatching(SpectrumBasedEstimatorBase):
     """
 
     def __init__(self, array, wavelength, search_grid, noise_known=False,
-                 formulation='penalizedl1', **kwargs):
+                 formulation='penalizedl1', reduction='none', **kwargs):
         super().__init__(array, wavelength, search_grid, **kwargs)
+        if self._chunk_size is not None:
+            raise ValueError('Chunked evaluation is not supported.')
+        if self._shared_cache is not None:
+            raise ValueError('Shared steering matrix cache is not supported.')
         self._formulation = formulation
         self._noise_known = noise_known
-        # vec(R) -> m*m elements, real + image -> 2*m*m
-        m = 2 * self._array.size**2
+        self._reduction = reduction
+        if reduction == 'none':
+            # vec(R) -> m*m elements, real + image -> 2*m*m
+            m = 2 * self._array.size**2
+        else:
+            if reduction == 'hermitian':
+                self._init_hermitian_reduction()
+            elif reduction == 'coarray':
+                self._init_coarray_reduction()
+            else:
+                raise ValueError(
+                    "Reduction must be one of 'none', 'hermitian', and 'coarray'."
+                )
+            # Imaginary parts are dropped for rows known to be real.
+            m = self._row_weights.size + np.count_nonzero(~self._real_rows)
         k = self._search_grid.size
         # If noise is not known, we need a additional column for vec(I).
         if not self._noise_known:
@@ -77,6 +123,51 @@ class SparseCovarianceMatching(SpectrumBasedEstimatorBase):
         # Initialize the problem.
         self._problem = L1RegularizedLeastSquaresProblem(m, k, formulation, True)
 
+    def _init_hermitian_reduction(self):
+        m = self._array.size
+        # Entries on and above the diagonal in the column-major order of
+        # vec(R).
+        rows, cols = np.triu_indices(m)
+        self._row_indices = rows + cols * m
+        self._row_weights = np.where(rows == cols, 1.0, np.sqrt(2.0))
+        # The diagonal entries are real.
+        self._real_rows = rows == cols
+        self._averaging_matrix = None
+
+    def _init_coarray_reduction(self):
+        if any(p.is_known for p in self._array.perturbations):
+            raise ValueError('Coarray reduction does not support known perturbations.')
+        if not isinstance(self._search_grid.source_placement,
+                          (FarField1DSourcePlacement, FarField2DSourcePlacement)):
+            raise ValueError('Coarray reduction requires far-field sources.')
+        # Raises ValueError if the array is not a 1D grid-based array.
+        wf = WeightFunction1D(self._array)
+        lags = wf.differences()
+        lags = lags[lags >= 0]
+        weights = np.array([wf.weight_of(lag) for lag in lags])
+        # Redundancy averaging over the entries of vec(R) sharing the same lag.
+        F = np.zeros((lags.size, self._array.size**2))
+        for i, lag in enumerate(lags):
+            F[i, wf.indices_of(lag)] = 1.0 / weights[i]
+        self._averaging_matrix = F
+        self._row_indices = None
+        # |r_l - phi_l x|^2 appears w_l times for lag 0, and 2 w_l times for
+        # the positive lags (together with the conjugate entries of -l).
+        self._row_weights = np.sqrt(np.where(lags == 0, 1.0, 2.0) * weights)
+        self._real_rows = lags == 0
+
+    def _reduce(self, V):
+        """Converts the complex rows associated with vec(R) to the real rows
+        used in the sparse recovery problem."""
+        if self._reduction == 'none':
+            return np.vstack((V.real, V.imag))
+        if self._averaging_matrix is None:
+            V = V[self._row_indices]
+        else:
+            V = self._averaging_matrix @ V
+        V = V * self._row_weights[:, np.newaxis]
+        return np.vstack((V.real, V.imag[~self._real_rows]))
+
     def _compute_atom_matrix(self, grid):
         A = self._array.steering_matrix(
             grid.source_placement, self._wavelength,
@@ -85,12 +176,22 @@ class SparseCovarianceMatching(SpectrumBasedEstimatorBase):
         Phi = khatri_rao(A.conj(), A)
         if not self._noise_known:
             Phi = np.hstack((Phi, vec(np.eye(self._array.size))))
-        Phi = np.vstack((Phi.real, Phi.imag))
-        return Phi
+        return self._reduce(Phi)
+
+    def _get_observation(self, R, ls):
+        """Computes the reduced observation vector and converts the residual
+        bounds of the ``'constrainedl2'`` formulation accordingly."""
+        r_full = vec(R)
+        r = self._reduce(r_full)
+        if self._reduction == 'coarray' and self._formulation == 'constrainedl2':
+            # The residual of the reduced problem excludes the deviations of
+            # the entries from their lag averages.
+            c = max(np.sum(np.abs(r_full)**2) - np.sum(r**2), 0.0)
+            ls = np.sqrt(np.maximum(np.asarray(ls, dtype=np.float_)**2 - c, 0.0))
+        return r, ls
 
     def _get_sparse_spectrum(self, Phi, R, l, solver_options):
-        r = vec(R)
-        r = np.vstack((r.real, r.imag))
+        r, l = self._get_observation(R, l)
         sol = self._problem.solve(Phi, r, l, **solver_options).flatten()
         if not self._noise_known:
             # The last element is the noise variance estimate.
@@ -127,7 +228,12 @@ class SparseCovarianceMatching(SpectrumBasedEstimatorBase):
             
             solver_options (dict): A dictionary of additional keyword arguments
                 to be passed to the optimizer. For instance, you can specify the
-                solver or set the verbosity.
+                solver or set the verbosity. Use ``{'backend': 'native'}`` to
+                solve the problem with the native first-order solvers, which
+                do not require cvxpy and accept a warm start ``x0`` (of size
+                :math:`G + 1` if the noise variance is unknown). See
+                :meth:`~doatools.optim.l1lsq.L1RegularizedLeastSquaresProblem.solve`
+                for more details.
             
             return_spectrum (bool): Set to ``True`` to also output the spectrum
                 for visualization. Default value if ``False``.
@@ -163,6 +269,55 @@ class SparseCovarianceMatching(SpectrumBasedEstimatorBase):
         f_sp = lambda Phi: self._get_sparse_spectrum(Phi, R, l, solver_options)
         return self._estimate(f_sp, k, **kwargs)
 
+    def estimate_path(self, R, k, ls, sigma=None, solver_options={}, **kwargs):
+        r"""Estimates the source locations from the given covariance matrix for
+        a sequence of regularization/constraint parameters.
+
+        Compared with calling :meth:`estimate` for each parameter, the sparse
+        recovery problems are solved along the sequence with warm starts. For
+        the ``'penalizedl1'`` formulation, grid points that are very likely
+        inactive are also discarded with the strong rules, such that only
+        reduced problems are solved. The native solvers are always used. See
+        :meth:`~doatools.optim.l1lsq.L1RegularizedLeastSquaresProblem.solve_path`
+        for more details.
+
+        Args:
+            R (~numpy.ndarray): Covariance matrix input. The size of R must
+                match that of the array design used when creating this
+                estimator.
+            k (int): Expected number of sources.
+            ls (~numpy.ndarray): A sequence of regularization/constraint
+                parameters. See :meth:`estimate` for the meaning of these
+                parameters.
+            sigma (float): Noise variance. Required if the noise variance is
+                assumed known.
+            solver_options (dict): A dictionary of additional keyword arguments
+                to be passed to
+                :meth:`~doatools.optim.l1lsq.L1RegularizedLeastSquaresProblem.solve_path`
+                (e.g., ``screening``, ``max_iter``, and ``tol``).
+            return_spectrum (bool): Set to ``True`` to also output the spectra.
+                Default value if ``False``.
+
+        Returns:
+            list: A list of results, one for each parameter in ``ls`` and in
+            the same order. Each result is a tuple of the same form as the
+            output of :meth:`estimate`.
+        """
+        if 'refine_estimates' in kwargs:
+            raise ValueError('Grid refinement is not supported.')
+        ensure_covariance_size(R, self._array)
+        if self._noise_known:
+            if sigma is None:
+                raise ValueError('sigma must be specified when noise variance is assumed known.')
+            R = R - np.eye(self._array.size) * sigma
+        r, ls = self._get_observation(R, ls)
+        r = r.flatten()
+        solutions, _ = self._problem.solve_path(self._get_atom_matrix(), r, ls,
+                                                **solver_options)
+        if not self._noise_known:
+            solutions = [sol[:-1] for sol in solutions]
+        return [self._estimate(lambda _: sol, k, **kwargs) for sol in solutions]
+
 class GroupSparseEstimator(SpectrumBasedEstimatorBase):
     r"""Creates a group-sparsity based estimator.
 
@@ -219,6 +374,10 @@ class GroupSparseEstimator(SpectrumBasedEstimatorBase):
 
     def __init__(self, array, wavelength, search_grid, n_snapshots, **kwargs):
         super().__init__(array, wavelength, search_grid, **kwargs)
+        if self._chunk_size is not None:
+            raise ValueError('Chunked evaluation is not supported.')
+        if self._shared_cache is not None:
+            raise ValueError('Shared steering matrix cache is not supported.')
         self._n_snapshots = n_snapshots
         self._problem = L21RegularizedLeastSquaresProblem(
             array.size, search_grid.size, n_snapshots, True
@@ -240,7 +399,13 @@ class GroupSparseEstimator(SpectrumBasedEstimatorBase):
                 biases.
             solver_options (dict): A dictionary of additional keyword arguments
                 to be passed to the optimizer. For instance, you can specify the
-                solver or set the verbosity.
+                solver or set the verbosity. Use ``{'backend': 'native'}`` to
+                solve the problem with the native group-sparse solver, which
+                does not require cvxpy. Adding ``'warm_start': True`` starts
+                from the solution of the previous call, which is useful when
+                processing consecutive blocks of snapshots. See
+                :meth:`~doatools.optim.l1lsq.L21RegularizedLeastSquaresProblem.solve`
+                for more details.
             return_spectrum (bool): Set to ``True`` to also output the spectrum
                 for visualization. Default value if ``False``.
                 
@@ -272,3 +437,315 @@ class GroupSparseEstimator(SpectrumBasedEstimatorBase):
             raise ValueError('The number of columns of Y must be equal to the number of snapshots.')
         f_sp = lambda A: self._get_sparse_spectrum(A, Y, l, solver_options)
         return self._estimate(f_sp, k, **kwargs)
+
+    def estimate_path(self, Y, k, ls, solver_options={}, **kwargs):
+        """Estimates the source locations from the given measurements for a
+        sequence of regularization parameters.
+
+        Compared with calling :meth:`estimate` for each parameter, the
+        group-sparse problems are solved in decreasing order of the
+        regularization parameters with warm starts, and grid points that are
+        very likely inactive are discarded with the strong rules. The native
+        solver is always used. See
+        :meth:`~doatools.optim.l1lsq.L21RegularizedLeastSquaresProblem.solve_path`
+        for more details.
+
+        Args:
+            Y (~numpy.ndarray): The matrix of measurements, each column of which
+                represents a single snapshot.
+            k (int): Expected number of sources.
+            ls (~numpy.ndarray): A sequence of regularization parameters.
+            solver_options (dict): A dictionary of additional keyword arguments
+                to be passed to
+                :meth:`~doatools.optim.l1lsq.L21RegularizedLeastSquaresProblem.solve_path`
+                (e.g., ``screening``, ``max_iter``, and ``tol``).
+            return_spectrum (bool): Set to ``True`` to also output the spectra.
+                Default value if ``False``.
+
+        Returns:
+            list: A list of results, one for each parameter in ``ls`` and in
+            the same order. Each result is a tuple of the same form as the
+            output of :meth:`estimate`.
+        """
+        if 'refine_estimates' in kwargs:
+            raise ValueError('Grid refinement is not supported.')
+        if Y.shape[0] != self._array.size:
+            raise ValueError('The number of rows of Y must be equal to the array size.')
+        if Y.shape[1] != self._n_snapshots:
+            raise ValueError('The number of columns of Y must be equal to the number of snapshots.')
+        solutions, _ = self._problem.solve_path(self._get_atom_matrix(), Y, ls,
+                                                **solver_options)
+        return [
+            self._estimate(lambda _: np.linalg.norm(X, ord=2, axis=1), k,
+                           **kwargs)
+            for X in solutions
+        ]
+
+def _sbl(A, Rs, k, sigma, find_peaks, update='fixed_point', max_iter=200,
+         tol=1e-2, prune_threshold=1e-4):
+    """Multi-snapshot sparse Bayesian learning engine that supports a stack of
+    covariance matrices.
+
+    Args:
+        A: M x G dictionary (steering) matrix.
+        Rs: T x M x M stack of covariance matrices.
+        k: Number of sources, used in the noise variance updates.
+        sigma: Known noise variance (a scalar or a vector of length T), or
+            ``None`` if the noise variance should be estimated.
+        find_peaks: A callable that accepts a T x G matrix of source powers and
+            returns a T x k matrix of the indices of the k largest peaks.
+
+    Returns:
+        A tuple (gamma, sigma, n_iter, converged), where gamma is a T x G
+        matrix of the estimated source powers, sigma is a vector of the noise
+        variances, n_iter is the number of iterations, and converged is a
+        boolean vector of length T.
+    """
+    T, m, _ = Rs.shape
+    G = A.shape[1]
+    I = np.eye(m)
+    tr_R = np.real(np.trace(Rs, axis1=1, axis2=2))
+    # Keeps the noise variance positive so that Sigma_y remains invertible.
+    sigma_min = 1e-10 * tr_R / m
+    # Initializes the source powers with the Bartlett spectra and the noise
+    # variances with the averages of the m - k smallest eigenvalues.
+    norms = np.sum(A.real**2 + A.imag**2, axis=0)
+    gamma = np.real(np.sum(A.conj() * (Rs @ A), axis=1)) / norms**2
+    if sigma is None:
+        v = np.linalg.eigvalsh(Rs)
+        sigma2 = np.maximum(np.mean(v[:, :m-k], axis=1), sigma_min)
+    else:
+        sigma2 = np.broadcast_to(np.asarray(sigma, dtype=np.float_), (T,))
+    active = np.arange(G)
+    converged = np.zeros((T,), dtype=np.bool_)
+    n_iter = 0
+    while n_iter < max_iter and not np.all(converged):
+        n_iter += 1
+        # Only the inputs that have not converged are updated.
+        live = np.nonzero(~converged)[0]
+        R_l = Rs[live]
+        g_l = gamma[live]
+        s2_l = sigma2[live]
+        A_a = A[:, active]
+        # By the Woodbury identity, the posterior covariance of the sources
+        # Gamma - Gamma A^H Sigma_y^{-1} A Gamma only requires the inverse of
+        # the M x M covariance Sigma_y = sigma^2 I + A Gamma A^H.
+        S = s2_l[:, np.newaxis, np.newaxis] * I + \
+            (A_a * g_l[:, np.newaxis, :]) @ A_a.conj().T
+        B = np.linalg.solve(S, np.broadcast_to(A_a, (live.size,) + A_a.shape))
+        # s_i = a_i^H Sigma_y^{-1} a_i, q_i = a_i^H Sigma_y^{-1} R Sigma_y^{-1} a_i
+        s = np.real(np.sum(A_a.conj() * B, axis=1))
+        q = np.real(np.sum(B.conj() * (R_l @ B), axis=1))
+        if update == 'fixed_point':
+            g_new = g_l * (q / s)
+        else:
+            g_new = np.maximum(g_l + g_l**2 * (q - s), 0.0)
+        if sigma is None:
+            # Projects R onto the orthogonal complement of the steering
+            # vectors of the k largest peaks.
+            g_full = np.zeros((live.size, G))
+            g_full[:, active] = g_new
+            Q, _ = np.linalg.qr(np.moveaxis(A[:, find_peaks(g_full)], 1, 0))
+            p = np.real(np.sum(Q.conj() * (R_l @ Q), axis=(1, 2)))
+            sigma2[live] = np.maximum((tr_R[live] - p) / (m - k),
+                                      sigma_min[live])
+        delta = np.sum(np.abs(g_new - g_l), axis=1)
+        converged[live] = delta <= tol * np.sum(g_l, axis=1)
+        gamma[live] = g_new
+        # Prunes the grid points that are inactive for all the inputs. The
+        # multiplicative updates never revive them.
+        keep = np.any(
+            gamma > prune_threshold * np.max(gamma, axis=1, keepdims=True),
+            axis=0
+        )
+        if k <= np.count_nonzero(keep) < keep.size:
+            active = active[keep]
+            gamma = gamma[:, keep]
+    gamma_full = np.zeros((T, G))
+    gamma_full[:, active] = gamma
+    return gamma_full, sigma2, n_iter, converged
+
+class SBLEstimator(SpectrumBasedEstimatorBase):
+    r"""Creates a sparse Bayesian learning (SBL) based estimator.
+
+    Similar to :class:`GroupSparseEstimator`, the snapshots are modeled as
+    :math:`\mathbf{y}(t) = \mathbf{A} \mathbf{x}(t) + \mathbf{n}(t)`, where
+    :math:`\mathbf{A}` is the steering matrix of the search grid. SBL assumes
+    that :math:`\mathbf{x}(t) \sim \mathcal{CN}(\mathbf{0}, \mathbf{\Gamma})`,
+    where :math:`\mathbf{\Gamma} = \mathrm{diag}(\mathbf{\gamma})`, and that
+    :math:`\mathbf{n}(t) \sim \mathcal{CN}(\mathbf{0}, \sigma^2 \mathbf{I})`.
+    The hyperparameters :math:`\mathbf{\gamma}` are estimated by maximizing
+    the evidence, which only depends on the sample covariance matrix
+    :math:`\hat{\mathbf{R}}`. Maximizing the evidence naturally leads to sparse
+    :math:`\mathbf{\gamma}`, whose entries form a spectrum of the source
+    powers. Unlike :class:`SparseCovarianceMatching` and
+    :class:`GroupSparseEstimator`, no regularization parameter is required, and
+    cvxpy is not used.
+
+    Let :math:`\mathbf{\Sigma}_y = \sigma^2 \mathbf{I} + \mathbf{A}
+    \mathbf{\Gamma} \mathbf{A}^H`. Each iteration updates the hyperparameters
+    with
+
+    .. math::
+
+        \gamma_i \leftarrow \gamma_i
+        \frac{\mathbf{a}_i^H \mathbf{\Sigma}_y^{-1} \hat{\mathbf{R}}
+              \mathbf{\Sigma}_y^{-1} \mathbf{a}_i}
+             {\mathbf{a}_i^H \mathbf{\Sigma}_y^{-1} \mathbf{a}_i}
+
+    (fixed-point update), or with the expectation-maximization (EM) update
+    :math:`\gamma_i \leftarrow \gamma_i + \gamma_i^2
+    (\mathbf{a}_i^H \mathbf{\Sigma}_y^{-1} \hat{\mathbf{R}}
+    \mathbf{\Sigma}_y^{-1} \mathbf{a}_i
+    - \mathbf{a}_i^H \mathbf{\Sigma}_y^{-1} \mathbf{a}_i)`. By the Woodbury
+    identity, both updates only require solving linear systems of the
+    :math:`M \times M` matrix :math:`\mathbf{\Sigma}_y` instead of forming the
+    :math:`G \times G` posterior covariance matrix, where :math:`G` is the
+    size of the search grid. Grid points whose powers drop below
+    ``prune_threshold`` times the largest power are pruned, so the iterations
+    become cheaper as the solution becomes sparse. If the noise variance is not
+    known, it is updated with the residual power outside the subspace spanned
+    by the steering vectors of the :math:`K` largest peaks [2].
+
+    Args:
+        array (~doatools.model.arrays.ArrayDesign): Array design.
+        wavelength (float): Wavelength of the carrier wave.
+        search_grid (~doatools.estimation.grid.SearchGrid): The search grid
+            used to locate the sources.
+        update (str): ``'fixed_point'`` (default) or ``'em'``. The EM update
+            is guaranteed to increase the evidence but usually converges much
+            slower.
+        max_iter (int): Maximum number of iterations. Default value is 200.
+        tol (float): The iterations stop when the l1 norm of the change of
+            :math:`\mathbf{\gamma}` is smaller than ``tol`` times the l1 norm
+            of :math:`\mathbf{\gamma}`. Default value is 1e-2.
+        prune_threshold (float): Relative threshold for pruning grid points.
+            Set to 0 to disable pruning. Default value is 1e-4.
+        **kwargs: Other keyword arguments supported by
+            :class:`~doatools.estimation.core.SpectrumBasedEstimatorBase`.
+
+    References:
+        [1] D. P. Wipf and B. D. Rao, "An empirical Bayesian strategy for
+        solving the simultaneous sparse approximation problem," IEEE
+        Transactions on Signal Processing, vol. 55, no. 7, pp. 3704-3716,
+        Jul. 2007.
+
+        [2] P. Gerstoft, C. F. Mecklenbräuker, A. Xenaki, and S. Nannuru,
+        "Multisnapshot sparse Bayesian learning for DOA," IEEE Signal
+        Processing Letters, vol. 23, no. 10, pp. 1469-1473, Oct. 2016.
+    """
+
+    def __init__(self, array, wavelength, search_grid, update='fixed_point',
+                 max_iter=200, tol=1e-2, prune_threshold=1e-4, **kwargs):
+        super().__init__(array, wavelength, search_grid, **kwargs)
+        if self._chunk_size is not None:
+            raise ValueError('Chunked evaluation is not supported.')
+        if self._search_strategy != 'exhaustive':
+            raise ValueError('Only the exhaustive search strategy is supported.')
+        if update not in ['fixed_point', 'em']:
+            raise ValueError("Update must be either 'fixed_point' or 'em'.")
+        self._update = update
+        self._max_iter = max_iter
+        self._tol = tol
+        self._prune_threshold = prune_threshold
+
+    def _find_top_peaks_batch(self, gamma, k):
+        if isinstance(self._peak_finder, TopKPeakFinder):
+            peak_finder = self._peak_finder
+        else:
+            peak_finder = TopKPeakFinder()
+        sp = gamma.reshape((gamma.shape[0],) + self._search_grid.shape)
+        resolved, indices = peak_finder.find_top_k_batch(sp, k)
+        if not np.all(resolved):
+            # Falls back to the k largest powers.
+            indices[~resolved] = np.argsort(gamma[~resolved], axis=1)[:, -k:]
+        return indices
+
+    def _get_spectra(self, A, Rs, k, sigma):
+        gamma, _, _, converged = _sbl(
+            A, Rs, k, sigma, lambda g: self._find_top_peaks_batch(g, k),
+            self._update, self._max_iter, self._tol, self._prune_threshold
+        )
+        if not np.all(converged):
+            warnings.warn(
+                'Maximum number of iterations reached. The spectrum may be '
+                'inaccurate.'
+            )
+        return gamma
+
+    def estimate(self, R, k, sigma=None, **kwargs):
+        """Estimates the source locations from the given covariance matrix.
+
+        Args:
+            R (~numpy.ndarray): Covariance matrix input. The size of R must
+                match that of the array design used when creating this
+                estimator.
+            k (int): Expected number of sources.
+            sigma (float): Noise variance. If not specified, the noise variance
+                will be estimated along with the source powers. Default value
+                is ``None``.
+            return_spectrum (bool): Set to ``True`` to also output the spectrum
+                of the estimated source powers. Default value if ``False``.
+
+        Returns:
+            A tuple with the following elements.
+
+            * resolved (:class:`bool`): ``True`` if the desired number of
+              peaks are found in the spectrum. This flag does **not**
+              guarantee that the estimated source locations are correct.
+              If resolved is False, both ``estimates`` and ``spectrum`` will be
+              ``None``.
+            * estimates (:class:`~doatools.model.sources.SourcePlacement`):
+              A :class:`~doatools.model.sources.SourcePlacement` instance of the
+              same type as the one used in the search grid, represeting the
+              estimated source locations. Will be ``None`` if resolved is
+              ``False``.
+            * spectrum (:class:`~numpy.ndarray`): An numpy array of the same
+              shape of the specified search grid, consisting of the estimated
+              source powers at the grid points. Only present if
+              ``return_spectrum`` is ``True``.
+        """
+        if 'refine_estimates' in kwargs:
+            raise ValueError('Grid refinement is not supported.')
+        ensure_covariance_size(R, self._array)
+        ensure_n_resolvable_sources(k, self._array.size - 1)
+        f_sp = lambda A: self._get_spectra(A, R[np.newaxis], k, sigma)[0]
+        return self._estimate(f_sp, k, **kwargs)
+
+    def estimate_batch(self, Rs, k, sigma=None, **kwargs):
+        """Estimates the source locations from a stack of covariance matrices.
+
+        The SBL iterations are vectorized over the covariance matrices. The
+        grid points are pruned only when they become inactive for all the
+        covariance matrices, and the iterations stop when all the covariance
+        matrices converge.
+
+        Args:
+            Rs (~numpy.ndarray): A T x M x M stack of covariance matrices,
+                where M must match the size of the array design used when
+                creating this estimator.
+            k (int): Expected number of sources.
+            sigma: Noise variance, which can be a scalar or a vector of length
+                T. If not specified, the noise variances will be estimated.
+                Default value is ``None``.
+            return_spectrum (bool): Set to ``True`` to also output the spectra.
+                Default value if ``False``.
+
+        Returns:
+            A tuple with the following elements.
+
+            * resolved (:class:`~numpy.ndarray`): A boolean vector of length T
+              indicating whether the desired number of sources are found for
+              each covariance matrix.
+            * estimates (:class:`~numpy.ndarray`): A T x k (1D sources) or
+              T x k x d (d-dimensional sources) array of the estimated source
+              locations, measured in the same unit as the search grid. Rows
+              corresponding to unresolved inputs are filled with NaNs.
+            * spectra (:class:`~numpy.ndarray`): A T x d_1 x ... x d_n array of
+              the spectra evaluated on the search grid. Only present if
+              ``return_spectrum`` is ``True``.
+        """
+        ensure_covariance_batch_size(Rs, self._array)
+        ensure_n_resolvable_sources(k, self._array.size - 1)
+        f_sp = lambda A: self._get_spectra(A, Rs, k, sigma)
+        return self._estimate_batch(f_sp, k, **kwargs)
@@ -0,0 +1,234 @@
+import numpy as np
+
+class StreamingCovariance:
+    r"""Maintains a sample covariance matrix from a stream of snapshots.
+
+    Snapshots are consumed in blocks, and only an :math:`M \times M` matrix
+    (plus a bounded buffer in the sliding window mode) is kept, such that the
+    full snapshot history is never materialized. Two modes are supported:
+
+    * ``'exponential'`` - Exponentially weighted covariance matrix:
+
+      .. math::
+
+          \mathbf{R}(t)
+          = \frac{\sum_{i=1}^t \beta^{t-i} \mathbf{y}(i) \mathbf{y}^H(i)}
+                 {\sum_{i=1}^t \beta^{t-i}},
+
+      where :math:`\beta \in (0, 1]` is the forgetting factor. When
+      :math:`\beta = 1`, this is the usual sample covariance matrix of all the
+      snapshots received so far.
+    * ``'window'`` - Sample covariance matrix of the most recent :math:`L`
+      snapshots. The outer products of snapshots leaving the window are
+      subtracted, and the covariance matrix is periodically recomputed from the
+      buffered snapshots to prevent the accumulation of round-off errors.
+
+    Each update costs :math:`O(M^2 B)` for a block of :math:`B` snapshots.
+
+    Args:
+        m (int): Number of sensors.
+        mode (str): ``'exponential'`` (default) or ``'window'``.
+        forgetting_factor (float): Forgetting factor used in the
+            ``'exponential'`` mode. Default value is 1.0.
+        window_size (int): Number of snapshots in the sliding window. Required
+            in the ``'window'`` mode.
+    """
+
+    def __init__(self, m, mode='exponential', forgetting_factor=1.0,
+                 window_size=None):
+        if mode == 'exponential':
+            if forgetting_factor <= 0.0 or forgetting_factor > 1.0:
+                raise ValueError('The forgetting factor must be within (0, 1].')
+        elif mode == 'window':
+            if window_size is None or window_size < 1:
+                raise ValueError('The window size must be a positive integer.')
+        else:
+            raise ValueError("Mode must be either 'exponential' or 'window'.")
+        self._m = m
+        self._mode = mode
+        self._forgetting_factor = forgetting_factor
+        self._window_size = window_size
+        self.reset()
+
+    @property
+    def size(self):
+        """Retrieves the number of sensors."""
+        return self._m
+
+    @property
+    def mode(self):
+        """Retrieves the update mode."""
+        return self._mode
+
+    @property
+    def n_snapshots(self):
+        """Retrieves the total number of snapshots received since creation or
+        the last reset."""
+        return self._n_snapshots
+
+    @property
+    def effective_snapshots(self):
+        """Retrieves the effective number of snapshots contributing to the
+        covariance matrix, which is the sum of the weights."""
+        if self._mode == 'window':
+            return min(self._n_snapshots, self._window_size)
+        return self._weight
+
+    def reset(self):
+        """Discards all the received snapshots."""
+        self._R = np.zeros((self._m, self._m), dtype=np.complex_)
+        self._weight = 0.0
+        self._n_snapshots = 0
+        if self._mode == 'window':
+            self._buffer = np.zeros((self._m, self._window_size), dtype=np.complex_)
+            # Position of the oldest snapshot in the ring buffer.
+            self._head = 0
+            self._n_since_refresh = 0
+
+    def update(self, Y):
+        """Updates the covariance matrix with a block of snapshots.
+
+        Args:
+            Y (~numpy.ndarray): An M x B matrix whose columns are new snapshots
+                ordered in time. A single snapshot can also be given as a
+                vector of length M.
+        """
+        if Y.ndim == 1:
+            Y = Y[:, np.newaxis]
+        if Y.ndim != 2 or Y.shape[0] != self._m:
+            raise ValueError(
+                'Expecting an {0} x B matrix of snapshots. Got {1}.'
+                .format(self._m, Y.shape)
+            )
+        b = Y.shape[1]
+        if b == 0:
+            return
+        if self._mode == 'exponential':
+            self._update_exponential(Y)
+        else:
+            self._update_window(Y)
+        self._n_snapshots += b
+
+    def _update_exponential(self, Y):
+        b = Y.shape[1]
+        beta = self._forgetting_factor
+        if beta == 1.0:
+            self._R += Y @ Y.conj().T
+            self._weight += b
+        else:
+            # The i-th snapshot (0-based) of this block is weighted by
+            # beta^(b - 1 - i).
+            w = beta ** np.arange(b - 1, -1, -1)
+            self._R *= beta ** b
+            self._R += (Y * w) @ Y.conj().T
+            self._weight = self._weight * beta ** b + np.sum(w)
+
+    def _update_window(self, Y):
+        L = self._window_size
+        b = Y.shape[1]
+        if b >= L:
+            # The whole window is replaced.
+            self._buffer[:] = Y[:, -L:]
+            self._head = 0
+            self._R = self._buffer @ self._buffer.conj().T
+            self._n_since_refresh = 0
+            return
+        n_filled = min(self._n_snapshots, L)
+        n_leaving = max(0, n_filled + b - L)
+        # Positions in the ring buffer for the new snapshots. The last
+        # n_leaving positions are occupied by the oldest snapshots.
+        positions = (self._head + n_filled + np.arange(b)) % L
+        if n_leaving > 0:
+            leaving = self._buffer[:, positions[b-n_leaving:]]
+            self._R -= leaving @ leaving.conj().T
+            self._head = (self._head + n_leaving) % L
+        self._buffer[:, positions] = Y
+        self._R += Y @ Y.conj().T
+        self._n_since_refresh += b
+        if self._n_since_refresh >= L:
+            # Recompute from the buffered snapshots to discard the
+            # accumulated round-off errors.
+            Yw = self._buffer if n_filled + b >= L else \
+                self._buffer[:, (self._head + np.arange(n_filled + b)) % L]
+            self._R = Yw @ Yw.conj().T
+            self._n_since_refresh = 0
+
+    def get_covariance(self):
+        """Retrieves the current covariance matrix.
+
+        Returns:
+            ~numpy.ndarray: An M x M covariance matrix.
+        """
+        n = self.effective_snapshots
+        if n == 0:
+            raise RuntimeError('No snapshots have been received.')
+        R = self._R / n
+        # Enforces the Hermitian symmetry.
+        return 0.5 * (R + R.conj().T)
+
+class StreamingEstimator:
+    """Feeds a covariance-based estimator from a stream of snapshots at a fixed
+    cadence.
+
+    Args:
+        estimator: An estimator whose ``estimate`` method accepts a covariance
+            matrix and the number of sources as the first two arguments (e.g.,
+            :class:`~doatools.estimation.music.MUSIC`,
+            :class:`~doatools.estimation.beamforming.MVDRBeamformer`, or
+            :class:`~doatools.estimation.esprit.Esprit1D`).
+        k (int): Expected number of sources.
+        covariance (StreamingCovariance): The streaming covariance matrix that
+            will be updated by this estimator.
+        cadence (int): Number of snapshots between two consecutive estimates.
+        **kwargs: Other keyword arguments passed to ``estimator.estimate``.
+    """
+
+    def __init__(self, estimator, k, covariance, cadence, **kwargs):
+        if cadence < 1:
+            raise ValueError('The cadence must be a positive integer.')
+        self._estimator = estimator
+        self._k = k
+        self._covariance = covariance
+        self._cadence = cadence
+        self._kwargs = kwargs
+        self._n_pending = 0
+
+    @property
+    def covariance(self):
+        """Retrieves the underlying streaming covariance matrix."""
+        return self._covariance
+
+    def push(self, Y):
+        """Consumes a block of snapshots.
+
+        The block is split at the cadence boundaries, such that each estimate
+        is obtained from the covariance matrix right after the corresponding
+        snapshot is received.
+
+        Args:
+            Y (~numpy.ndarray): An M x B matrix whose columns are new snapshots
+                ordered in time.
+
+        Returns:
+            list: A list of ``(n, result)`` tuples, one for each estimate
+            triggered by this block, where ``n`` is the total number of
+            snapshots received when the estimate is obtained and ``result``
+            is the output of ``estimator.estimate``.
+        """
+        if Y.ndim == 1:
+            Y = Y[:, np.newaxis]
+        results = []
+        start = 0
+        while start < Y.shape[1]:
+            stop = min(Y.shape[1], start + self._cadence - self._n_pending)
+            self._covariance.update(Y[:, start:stop])
+            self._n_pending += stop - start
+            start = stop
+            if self._n_pending == self._cadence:
+                self._n_pending = 0
+                R = self._covariance.get_covariance()
+                results.append((
+                    self._covariance.n_snapshots,
+                    self._estimator.estimate(R, self._k, **self._kwargs)
+                ))
+        return results
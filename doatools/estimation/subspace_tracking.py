@@ -0,0 +1,201 @@
+from abc import ABC, abstractmethod
+import numpy as np
+
+class SubspaceTracker(ABC):
+    """Base class for signal subspace trackers.
+
+    A subspace tracker keeps an estimate of the k-dimensional signal subspace
+    of a slowly varying covariance matrix up to date as new snapshots arrive,
+    without forming or eigendecomposing the covariance matrix. The tracked
+    subspace can be passed to the ``estimate_from_subspace`` methods of
+    :class:`~doatools.estimation.music.MUSIC`,
+    :class:`~doatools.estimation.min_norm.MinNorm`, and
+    :class:`~doatools.estimation.esprit.Esprit1D`.
+
+    Args:
+        m (int): Number of sensors.
+        k (int): Dimension of the signal subspace.
+        forgetting_factor (float): Forgetting factor within (0, 1]. Smaller
+            values lead to faster tracking at the cost of increased
+            fluctuations. Default value is 0.99.
+        initial_subspace (~numpy.ndarray): An m x k matrix whose columns span
+            the initial signal subspace, which can be obtained from an initial
+            covariance matrix. If not specified, the first k columns of the
+            identity matrix will be used. Default value is ``None``.
+    """
+
+    def __init__(self, m, k, forgetting_factor=0.99, initial_subspace=None):
+        if k < 1 or k >= m:
+            raise ValueError('The dimension of the signal subspace must be within [1, {0}].'.format(m - 1))
+        if forgetting_factor <= 0.0 or forgetting_factor > 1.0:
+            raise ValueError('The forgetting factor must be within (0, 1].')
+        if initial_subspace is not None and initial_subspace.shape != (m, k):
+            raise ValueError(
+                'Expecting an {0} x {1} initial subspace. Got {2}.'
+                .format(m, k, initial_subspace.shape)
+            )
+        self._m = m
+        self._k = k
+        self._forgetting_factor = forgetting_factor
+        self._initial_subspace = initial_subspace
+        self.reset()
+
+    @property
+    def size(self):
+        """Retrieves the number of sensors."""
+        return self._m
+
+    @property
+    def k(self):
+        """Retrieves the dimension of the signal subspace."""
+        return self._k
+
+    @property
+    def n_snapshots(self):
+        """Retrieves the number of snapshots received since creation or the
+        last reset."""
+        return self._n_snapshots
+
+    @property
+    def signal_subspace(self):
+        """Retrieves an m x k matrix with orthonormal columns spanning the
+        tracked signal subspace."""
+        Q, _ = np.linalg.qr(self._W)
+        return Q
+
+    @property
+    def noise_subspace(self):
+        """Retrieves an m x (m - k) matrix with orthonormal columns spanning the
+        orthogonal complement of the tracked signal subspace.
+
+        Unlike :attr:`signal_subspace`, computing the noise subspace requires
+        :math:`O(m^2 k)` operations. Consider using the signal subspace
+        directly whenever possible.
+        """
+        Q, _ = np.linalg.qr(self._W, mode='complete')
+        return Q[:, self._k:]
+
+    def reset(self):
+        """Resets the tracker to its initial state."""
+        if self._initial_subspace is None:
+            self._W = np.eye(self._m, self._k, dtype=np.complex_)
+        else:
+            self._W = self._initial_subspace.astype(np.complex_)
+        self._n_snapshots = 0
+        self._reset_state()
+
+    def update(self, Y):
+        """Updates the tracked subspace with new snapshots.
+
+        Args:
+            Y (~numpy.ndarray): An m x B matrix whose columns are new snapshots
+                ordered in time. A single snapshot can also be given as a
+                vector of length m.
+        """
+        if Y.ndim == 1:
+            Y = Y[:, np.newaxis]
+        if Y.ndim != 2 or Y.shape[0] != self._m:
+            raise ValueError(
+                'Expecting an {0} x B matrix of snapshots. Got {1}.'
+                .format(self._m, Y.shape)
+            )
+        for i in range(Y.shape[1]):
+            self._update_snapshot(Y[:, i])
+        self._n_snapshots += Y.shape[1]
+
+    @abstractmethod
+    def _reset_state(self):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _update_snapshot(self, x):
+        raise NotImplementedError()
+
+class PASTTracker(SubspaceTracker):
+    r"""Creates a signal subspace tracker using the projection approximation
+    subspace tracking (PAST) algorithm.
+
+    PAST minimizes the exponentially weighted projection error with a
+    recursive least squares update, costing :math:`O(mk)` operations per
+    snapshot. The columns of the internal basis are not exactly orthonormal,
+    so :attr:`signal_subspace` orthonormalizes them with a QR decomposition.
+
+    Args:
+        m (int): Number of sensors.
+        k (int): Dimension of the signal subspace.
+        forgetting_factor (float): Forgetting factor within (0, 1]. Default
+            value is 0.99.
+        initial_subspace (~numpy.ndarray): An m x k matrix whose columns span
+            the initial signal subspace. Default value is ``None``.
+
+    References:
+        [1] B. Yang, "Projection approximation subspace tracking," IEEE
+        Transactions on Signal Processing, vol. 43, no. 1, pp. 95-107,
+        Jan. 1995.
+    """
+
+    def __init__(self, m, k, forgetting_factor=0.99, initial_subspace=None):
+        super().__init__(m, k, forgetting_factor, initial_subspace)
+
+    def _reset_state(self):
+        self._P = np.eye(self._k, dtype=np.complex_)
+
+    def _update_snapshot(self, x):
+        beta = self._forgetting_factor
+        y = self._W.conj().T @ x
+        h = self._P @ y
+        g = h / (beta + np.vdot(y, h).real)
+        P = (self._P - np.outer(g, h.conj())) / beta
+        # Enforces the Hermitian symmetry.
+        self._P = 0.5 * (P + P.conj().T)
+        e = x - self._W @ y
+        self._W += np.outer(e, g.conj())
+
+class PASTdTracker(SubspaceTracker):
+    r"""Creates a signal subspace tracker using the PAST algorithm with
+    deflation (PASTd).
+
+    The principal eigenvectors are updated one by one, and the signal
+    subspace of the remaining part of the snapshot is obtained by deflation.
+    In addition to the signal subspace, PASTd also tracks the k largest
+    eigenvalues of the (unnormalized) exponentially weighted covariance
+    matrix. Each snapshot costs :math:`O(mk)` operations.
+
+    Args:
+        m (int): Number of sensors.
+        k (int): Dimension of the signal subspace.
+        forgetting_factor (float): Forgetting factor within (0, 1]. Default
+            value is 0.99.
+        initial_subspace (~numpy.ndarray): An m x k matrix whose columns span
+            the initial signal subspace. Default value is ``None``.
+
+    References:
+        [1] B. Yang, "Projection approximation subspace tracking," IEEE
+        Transactions on Signal Processing, vol. 43, no. 1, pp. 95-107,
+        Jan. 1995.
+    """
+
+    def __init__(self, m, k, forgetting_factor=0.99, initial_subspace=None):
+        super().__init__(m, k, forgetting_factor, initial_subspace)
+
+    @property
+    def eigenvalues(self):
+        """Retrieves the tracked eigenvalues associated with the signal
+        subspace, normalized by the sum of the weights."""
+        beta = self._forgetting_factor
+        n = self._n_snapshots
+        weight = n if beta == 1.0 else (1.0 - beta**n) / (1.0 - beta)
+        return self._d / max(weight, 1.0)
+
+    def _reset_state(self):
+        self._d = np.ones((self._k,))
+
+    def _update_snapshot(self, x):
+        beta = self._forgetting_factor
+        x = x.copy()
+        for i in range(self._k):
+            w = self._W[:, i]
+            y = np.vdot(w, x)
+            self._d[i] = beta * self._d[i] + abs(y)**2
+            w += (x - w * y) * (y.conjugate() / self._d[i])
+            x -= w * y
@@ -3,4 +3,6 @@ from .arrays import *
 from .coarray import WeightFunction1D
 from .signals import ComplexStochasticSignal
 from .sources import FarField1DSourcePlacement, FarField2DSourcePlacement, NearField2DSourcePlacement
-from .snapshots import get_narrowband_snapshots
+from .snapshots import get_narrowband_snapshots, get_narrowband_snapshots_batch, \
+                       get_sample_covariance_batch
+from .steering_cache import SteeringMatrixCache, get_default_steering_cache
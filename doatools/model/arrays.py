@@ -162,7 +162,23 @@ class ArrayDesign:
     def actual_ndim(self):
         """Retrieves the number of dimensions of the array, considering location errors."""
         return self.actual_element_locations.shape[1]
-    
+
+    @property
+    def is_centro_symmetric(self):
+        """Checks if the nominal array is centro-symmetric with respect to the
+        element ordering, i.e., the i-th element and the (m-1-i)-th element
+        are symmetric about the centroid of the array for all i.
+
+        Centro-symmetric arrays with isotropic scalar elements (e.g., uniform
+        linear arrays and uniform rectangular arrays) admit real-valued
+        (unitary) subspace processing.
+
+        Perturbations do not affect this value.
+        """
+        x = self._locations
+        s = x + x[::-1]
+        return np.allclose(s, s[0], rtol=0.0, atol=1e-8 * max(1.0, np.max(np.abs(x))))
+
     def has_perturbation(self, ptype):
         """Checks if the array has the given type of perturbation."""
         return ptype in self._perturbations
@@ -181,6 +197,18 @@ class ArrayDesign:
         # Here we have a deep copy.
         return list(self._perturbations.values())
 
+    def _filter_perturbations(self, perturbations):
+        """Retrieves a list of perturbations according to the given filter
+        (``'all'``, ``'known'``, or ``'none'``)."""
+        if perturbations == 'all':
+            return list(self._perturbations.values())
+        elif perturbations == 'known':
+            return [v for v in self._perturbations.values() if v.is_known]
+        elif perturbations == 'none':
+            return []
+        else:
+            raise ValueError('Perturbation can only be "all", "known", or "none".')
+
     def _add_perturbation_from_list(self, perturbations, raise_on_override=True):
         """Adds perturbations from a list of perturbations.
         
@@ -391,14 +419,7 @@ class ArrayDesign:
             of arrays.
         """
         # Filter perturbations.
-        if perturbations == 'all':
-            perturb_list = self._perturbations.values()
-        elif perturbations == 'known':
-            perturb_list = [v for v in self._perturbations.values() if v.is_known]
-        elif perturbations == 'none':
-            perturb_list = []
-        else:
-            raise ValueError('Perturbation can only be "all", "known", or "none".')
+        perturb_list = self._filter_perturbations(perturbations)
         # Check array element.
         if not self._element.is_isotropic or not self._element.is_scalar:
             require_spatial_response = True
@@ -532,6 +553,87 @@ class GridBasedArrayDesign(ArrayDesign):
         """
         return self._element_indices.copy()
 
+    def steering_matrix_factors(self, sources, wavelength):
+        r"""Creates the factors of the nominal steering matrix for far-field
+        sources.
+
+        For far-field sources, the phase delay is linear in the sensor
+        location. Because the location of the :math:`(i_1, \ldots, i_d)`-th
+        element is given by :math:`\sum_j i_j \mathbf{v}_j`, the corresponding
+        row of the steering matrix can be expressed as
+
+        .. math::
+
+            \mathbf{a}_{i_1, \ldots, i_d}(\mathbf{\theta})
+            = \prod_{j=1}^d e^{j i_j \phi_j(\mathbf{\theta})},
+
+        where :math:`\phi_j(\mathbf{\theta})` is the phase delay associated with
+        the basis vector :math:`\mathbf{v}_j`. Consequently, the steering matrix
+        can be assembled from :math:`d` small factor matrices, one for each grid
+        axis. For instance, the steering matrix of a ULA is a Vandermonde
+        matrix, and the steering matrix of an :math:`m \times n` URA is the
+        Khatri-Rao (column-wise Kronecker) product of an :math:`m \times K`
+        factor and an :math:`n \times K` factor.
+
+        Perturbations and the spatial responses of the array elements are not
+        considered.
+
+        Args:
+            sources (~doatools.model.sources.SourcePlacement): Far-field
+                source placement.
+            wavelength (float): Wavelength of the carrier wave.
+
+        Returns:
+            tuple: A tuple of :math:`d` factor matrices. The :math:`l`-th row of
+            the :math:`j`-th factor matrix corresponds to the grid index
+            :math:`l + l_j` along the :math:`j`-th axis, where :math:`l_j` is
+            the smallest element index along this axis, such that
+            ``A[i] = F[0][I[i,0] - l_0] * ... * F[d-1][I[i,d-1] - l_{d-1}]``,
+            where ``I`` denotes the element indices.
+        """
+        if not sources.is_far_field:
+            raise ValueError('Expecting far-field sources.')
+        # Phase delays associated with each basis vector: d x K.
+        phases = sources.phase_delay_matrix(self._bases, wavelength)
+        lb = self._element_indices.min(axis=0)
+        ub = self._element_indices.max(axis=0)
+        return tuple(
+            np.exp(1j * np.outer(np.arange(lb[j], ub[j] + 1), phases[j]))
+            for j in range(self._bases.shape[0])
+        )
+
+    def steering_matrix(self, sources, wavelength, compute_derivatives=False,
+                        perturbations='all', flatten=True):
+        """Creates the steering matrix for the given DOAs.
+
+        See :meth:`ArrayDesign.steering_matrix` for more details.
+
+        Notes:
+            For far-field sources, isotropic scalar array elements, and no
+            sensor location errors, the steering matrix is assembled from the
+            factors given by :meth:`steering_matrix_factors` whenever this
+            requires fewer complex exponential evaluations than the generic
+            implementation (e.g., for URAs).
+        """
+        if not compute_derivatives and sources.is_far_field and \
+            self._element.is_isotropic and self._element.is_scalar:
+            perturb_list = self._filter_perturbations(perturbations)
+            lb = self._element_indices.min(axis=0)
+            ub = self._element_indices.max(axis=0)
+            if np.sum(ub - lb + 1) < self.size and \
+                not any(isinstance(p, LocationErrors) for p in perturb_list):
+                factors = self.steering_matrix_factors(sources, wavelength)
+                I = self._element_indices - lb
+                A = factors[0][I[:, 0]]
+                for j in range(1, len(factors)):
+                    A *= factors[j][I[:, j]]
+                for p in perturb_list:
+                    A, _ = p.perturb_steering_matrix(A, [])
+                return A
+        return super().steering_matrix(
+            sources, wavelength, compute_derivatives, perturbations, flatten
+        )
+
 class UniformLinearArray(GridBasedArrayDesign):
     """Creates an n-element uniform linear array (ULA).
         
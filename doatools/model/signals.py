@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 import numpy as np
 from scipy.linalg import sqrtm
-from ..utils.math import randcn
+from ..utils.math import randcn, get_rng
+
+def _get_signal_shape(dim, n, batch):
+    return (dim, n) if batch is None else (batch, dim, n)
 
 class SignalGenerator(ABC):
     """Abstrace base class for all signal generators.
@@ -16,11 +19,22 @@ class SignalGenerator(ABC):
         pass
 
     @abstractmethod
-    def emit(self, n):
+    def emit(self, n, batch=None, rng=None):
         """Emits the signal matrix.
 
         Generates a k x n matrix where k is the dimension of the signal and
         each column represents a sample.
+
+        Args:
+            n (int): Number of samples.
+            batch (int): If specified, generates a batch x k x n stack of
+                independent signal matrices in one call. Default value is
+                ``None``.
+            rng: A :class:`~numpy.random.Generator`, or anything accepted by
+                :meth:`~doatools.utils.math.get_rng` (e.g., a
+                :class:`~numpy.random.SeedSequence`). Default value is
+                ``None``, meaning that the global random state of
+                :mod:`numpy.random` is used.
         """
         pass
 
@@ -49,19 +63,16 @@ class ComplexStochasticSignal(SignalGenerator):
         if np.isscalar(C):
             # Scalar
             self._C2 = np.sqrt(C)
-            self._generator = lambda n: self._C2 * randcn((self._dim, n))
         elif C.ndim == 1:
             # Vector
             if C.size != dim:
                 raise ValueError('The size of C must be {0}.'.format(dim))
             self._C2 = np.sqrt(C).reshape((-1, 1))
-            self._generator = lambda n: self._C2 * randcn((self._dim, n))
         elif C.ndim == 2:
             # Matrix
             if C.shape[0] != dim or C.shape[1] != dim:
                 raise ValueError('The shape of C must be ({0}, {0}).'.format(dim))
             self._C2 = sqrtm(C)
-            self._generator = lambda n: self._C2 @ randcn((self._dim, n))
         else:
             raise ValueError(
                 'The covariance must be specified by a scalar, a vector of'
@@ -73,8 +84,24 @@ class ComplexStochasticSignal(SignalGenerator):
     def dim(self):
         return self._dim
 
-    def emit(self, n):
-        return self._generator(n)
+    @property
+    def covariance(self):
+        """Retrieves the full covariance matrix of the complex Gaussian
+        distribution."""
+        if np.isscalar(self._C):
+            return np.eye(self._dim) * self._C
+        if self._C.ndim == 1:
+            return np.diag(self._C)
+        return self._C.copy()
+
+    def emit(self, n, batch=None, rng=None):
+        # Note: the generator is not stored as a lambda so that the signal
+        # generator remains picklable.
+        x = randcn(_get_signal_shape(self._dim, n, batch), rng)
+        if self._C2.ndim == 2 and self._C2.shape[1] > 1:
+            return self._C2 @ x
+        x *= self._C2
+        return x
 
 class RandomPhaseSignal(SignalGenerator):
     r"""Creates a random phase signal generator.
@@ -93,7 +120,7 @@ class RandomPhaseSignal(SignalGenerator):
     def __init__(self, dim, amplitudes=1.0):
         self._dim = dim
         if np.isscalar(amplitudes):
-            self._amplitudes = np.full(amplitudes, (dim, 1))
+            self._amplitudes = np.full((dim, 1), amplitudes)
         else:
             if amplitudes.size != dim:
                 raise ValueError("The size of 'amplitudes' does not match the value of 'dim'.")
@@ -103,8 +130,13 @@ class RandomPhaseSignal(SignalGenerator):
     def dim(self):
         return self._dim
 
-    def emit(self, n):
-        phases = np.random.uniform(-np.pi, np.pi, (self._dim, n))
+    def emit(self, n, batch=None, rng=None):
+        rng = get_rng(rng)
+        shape = _get_signal_shape(self._dim, n, batch)
+        if rng is None:
+            phases = np.random.uniform(-np.pi, np.pi, shape)
+        else:
+            phases = rng.uniform(-np.pi, np.pi, shape)
         c = np.sin(phases) * 1j
         c += np.cos(phases)
         return self._amplitudes * c
@@ -1,6 +1,10 @@
+import numpy as np
+from ..utils.math import get_rng, randcn
+from .signals import ComplexStochasticSignal
+
 def get_narrowband_snapshots(array, sources, wavelength, source_signal,
                              noise_signal=None, n_snapshots=1,
-                             return_covariance=False):
+                             return_covariance=False, rng=None):
     r"""Generates snapshots based on the narrowband snapshot model (see
     Chapter 8.1 of [1]).
 
@@ -28,6 +32,12 @@ def get_narrowband_snapshots(array, sources, wavelength, source_signal,
         n_snapshots (int): Number of snapshots. Default value is 1.
         return_covariance (bool): If set to ``True``, also returns the sample
             covariance matrix. Default value is ``False``.
+        rng: A :class:`~numpy.random.Generator`, or anything accepted by
+            :meth:`~doatools.utils.math.get_rng` (e.g., a
+            :class:`~numpy.random.SeedSequence`), from which both the source
+            signals and the noise are drawn. Default value is ``None``,
+            meaning that the global random state of :mod:`numpy.random` is
+            used.
 
     Returns:
         Depending on ``return_covariance``.
@@ -43,14 +53,174 @@ def get_narrowband_snapshots(array, sources, wavelength, source_signal,
     References:
         [1] H. L. Van Trees, Optimum array processing. New York: Wiley, 2002.
     """
+    # Signal generators implemented before the introduction of the rng
+    # argument only accept the number of snapshots.
+    emit_kwargs = {}
+    rng = get_rng(rng)
+    if rng is not None:
+        emit_kwargs['rng'] = rng
     A = array.steering_matrix(sources, wavelength)
-    S = source_signal.emit(n_snapshots)
+    S = source_signal.emit(n_snapshots, **emit_kwargs)
     Y = A @ S
     if noise_signal is not None:
-        N = noise_signal.emit(n_snapshots)
+        N = noise_signal.emit(n_snapshots, **emit_kwargs)
         Y += N
     if return_covariance:
         R = (Y @ Y.conj().T) / n_snapshots
         return Y, R
     else:
         return Y
+
+def get_narrowband_snapshots_batch(array, sources, wavelength, source_signal,
+                                   noise_signal=None, n_snapshots=1, batch=1,
+                                   return_covariance=False, rng=None):
+    r"""Generates a stack of independent snapshot matrices based on the
+    narrowband snapshot model.
+
+    The steering matrix is computed only once, and the source signals and the
+    noise of all the trials are drawn in single vectorized calls.
+
+    Args:
+        array (~doatools.model.arrays.ArrayDesign): The array receiving the
+            snapshots.
+        sources (~doatools.model.sources.SourcePlacement): Source placement.
+        wavelength (float): Wavelength of the carrier wave.
+        source_signal (~doatools.model.signals.SignalGenerator):
+            Source signal generator.
+        noise_signal (~doatools.model.signals.SignalGenerator):
+            Noise signal generator. Default value is ``None``, meaning no
+            additive noise.
+        n_snapshots (int): Number of snapshots. Default value is 1.
+        batch (int): Number of snapshot matrices (trials). Default value is 1.
+        return_covariance (bool): If set to ``True``, also returns the sample
+            covariance matrices. Default value is ``False``.
+        rng: A :class:`~numpy.random.Generator`, or anything accepted by
+            :meth:`~doatools.utils.math.get_rng`. Default value is ``None``,
+            meaning that the global random state of :mod:`numpy.random` is
+            used.
+
+    Returns:
+        Depending on ``return_covariance``.
+
+        * If ``return_covariance`` is ``False``, returns a T x M x N stack of
+          snapshot matrices, where T is the batch size, M is the number of
+          sensors, and N is the number of snapshots.
+        * If ``return_covariance`` is ``True``, also returns a T x M x M stack
+          of sample covariance matrices.
+    """
+    rng = get_rng(rng)
+    A = array.steering_matrix(sources, wavelength)
+    m, k = A.shape
+    S = source_signal.emit(n_snapshots, batch=batch, rng=rng)
+    # Stacks the signal matrices horizontally such that A S is computed with a
+    # single matrix multiplication instead of a batched one.
+    AS = A @ np.swapaxes(S, 0, 1).reshape((k, -1))
+    AS = np.swapaxes(AS.reshape((m, batch, n_snapshots)), 0, 1)
+    if noise_signal is not None:
+        Y = noise_signal.emit(n_snapshots, batch=batch, rng=rng)
+        Y += AS
+    else:
+        Y = np.ascontiguousarray(AS)
+    if return_covariance:
+        # Batched matrix multiplications are much faster with contiguous
+        # operands.
+        Y_H = np.swapaxes(Y.conj(), 1, 2)
+        R = (Y @ Y_H) / n_snapshots
+        return Y, R
+    else:
+        return Y
+
+def _rand_complex_wishart(m, n, batch, rng):
+    """Draws a batch of m x m matrices from the complex Wishart distribution
+    CW(n, I) using the Bartlett decomposition, which requires n >= m."""
+    # The squared diagonal elements of the Bartlett factor follow
+    # Gamma(n - i, 1), i = 0, 1, ..., m - 1.
+    shape = np.arange(n, n - m, -1, dtype=np.float_)
+    size = (batch, m)
+    if rng is None:
+        d = np.sqrt(np.random.standard_gamma(shape, size))
+    else:
+        d = np.sqrt(rng.standard_gamma(shape, size))
+    B = np.tril(randcn((batch, m, m), rng), -1)
+    B[:, np.arange(m), np.arange(m)] = d
+    return B @ np.swapaxes(B, 1, 2).conj()
+
+def get_sample_covariance_batch(array, sources, wavelength, source_signal,
+                                noise_signal=None, n_snapshots=1, batch=1,
+                                method='snapshots', rng=None):
+    r"""Generates a stack of independent sample covariance matrices based on
+    the narrowband snapshot model.
+
+    Args:
+        array (~doatools.model.arrays.ArrayDesign): The array receiving the
+            snapshots.
+        sources (~doatools.model.sources.SourcePlacement): Source placement.
+        wavelength (float): Wavelength of the carrier wave.
+        source_signal (~doatools.model.signals.SignalGenerator):
+            Source signal generator.
+        noise_signal (~doatools.model.signals.SignalGenerator):
+            Noise signal generator. Default value is ``None``, meaning no
+            additive noise.
+        n_snapshots (int): Number of snapshots. Default value is 1.
+        batch (int): Number of sample covariance matrices (trials). Default
+            value is 1.
+        method (str): Can be one of the following:
+
+            * ``'snapshots'`` - Generates the snapshots with
+              :meth:`get_narrowband_snapshots_batch` and computes the sample
+              covariance matrices from them. Works with any signal generator.
+            * ``'wishart'`` - Draws the sample covariance matrices directly
+              from the complex Wishart distribution without forming the
+              snapshots. Let :math:`\mathbf{R} = \mathbf{A}\mathbf{P}
+              \mathbf{A}^H + \mathbf{Q}` and
+              :math:`\mathbf{R} = \mathbf{L}\mathbf{L}^H`. The sample
+              covariance matrix is given by
+              :math:`\mathbf{L}\mathbf{W}\mathbf{L}^H/N`, where
+              :math:`\mathbf{W} \sim \mathcal{CW}(N, \mathbf{I})` is
+              drawn using the Bartlett decomposition. The cost no longer
+              depends on the number of snapshots. Only applicable when both
+              ``source_signal`` and ``noise_signal`` are
+              :class:`~doatools.model.signals.ComplexStochasticSignal`.
+
+            Default value is ``'snapshots'``.
+        rng: A :class:`~numpy.random.Generator`, or anything accepted by
+            :meth:`~doatools.utils.math.get_rng`. Default value is ``None``,
+            meaning that the global random state of :mod:`numpy.random` is
+            used.
+
+    Returns:
+        ~numpy.ndarray: A T x M x M stack of sample covariance matrices, where
+        T is the batch size and M is the number of sensors.
+    """
+    rng = get_rng(rng)
+    if method == 'snapshots':
+        _, R = get_narrowband_snapshots_batch(
+            array, sources, wavelength, source_signal, noise_signal,
+            n_snapshots, batch, True, rng
+        )
+        return R
+    if method != 'wishart':
+        raise ValueError("Method must be either 'snapshots' or 'wishart'.")
+    for signal in [source_signal, noise_signal]:
+        if signal is not None and not isinstance(signal, ComplexStochasticSignal):
+            raise ValueError(
+                'The Wishart method requires complex Gaussian signals. Got {0}.'
+                .format(type(signal).__name__)
+            )
+    A = array.steering_matrix(sources, wavelength)
+    R = A @ source_signal.covariance @ A.conj().T
+    if noise_signal is not None:
+        R += noise_signal.covariance
+    # R may be singular without noise, so its square root is obtained from
+    # the eigendecomposition instead of the Cholesky decomposition.
+    v, E = np.linalg.eigh(R)
+    L = E * np.sqrt(np.maximum(v, 0.0))
+    m = R.shape[0]
+    if n_snapshots >= m:
+        W = _rand_complex_wishart(m, n_snapshots, batch, rng)
+    else:
+        # The Wishart matrix is singular and the Bartlett decomposition does
+        # not apply.
+        X = randcn((batch, m, n_snapshots), rng)
+        W = X @ np.swapaxes(X, 1, 2).conj()
+    return (L @ W @ L.conj().T) / n_snapshots
@@ -219,17 +219,38 @@ class FarField1DSourcePlacement(SourcePlacement):
             An instance of
             :class:`~doatools.model.sources.FarField1DSourcePlacement`.
         """
+        return FarField1DSourcePlacement(
+            FarField1DSourcePlacement.locations_from_z(z, wavelength, d0, unit),
+            unit
+        )
+
+    @staticmethod
+    def locations_from_z(z, wavelength, d0, unit='rad'):
+        """Converts complex roots into sorted source locations.
+
+        This is the vectorized counterpart of :meth:`from_z`.
+
+        Args:
+            z: A ndarray of complex roots. If z has more than one dimension,
+                each row along the last axis is converted separately.
+            wavelength (float): Wavelength of the carrier wave.
+            d0 (float): Inter-element spacing of the uniform linear array.
+            unit (str): Can be ``'rad'``, ``'deg'`` or ``'sin'``. Default value
+                is ``'rad'``.
+
+        Returns:
+            ~numpy.ndarray: A real array of the same shape as z, whose rows
+            along the last axis are sorted in ascending order.
+        """
         c = 2 * np.pi * d0 / wavelength
         sin_vals = np.angle(z) / c
         if unit == 'sin':
-            sin_vals.sort()
-            return FarField1DSourcePlacement(sin_vals, 'sin')
-        locations = np.arcsin(sin_vals)
-        locations.sort()        
+            return np.sort(sin_vals, axis=-1)
+        locations = np.sort(np.arcsin(sin_vals), axis=-1)
         if unit == 'rad':
-            return FarField1DSourcePlacement(locations)
+            return locations
         else:
-            return FarField1DSourcePlacement(np.rad2deg(locations), 'deg')
+            return np.rad2deg(locations)
 
     @property
     def is_far_field(self):
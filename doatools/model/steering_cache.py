@@ -0,0 +1,152 @@
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+def _hash_array(x):
+    """Computes a content hash of an ndarray, taking dtype and shape into
+    account."""
+    x = np.ascontiguousarray(x)
+    h = hashlib.sha1(x.view(np.uint8).ravel() if x.size > 0 else b'')
+    h.update(str((x.dtype.str, x.shape)).encode())
+    return h.hexdigest()
+
+def _hash_params(params):
+    """Computes a content hash of perturbation parameters, which can be an
+    ndarray or a tuple of ndarrays."""
+    if isinstance(params, (tuple, list)):
+        return tuple(_hash_params(p) for p in params)
+    if isinstance(params, np.ndarray):
+        return _hash_array(params)
+    return params
+
+class SteeringMatrixCache:
+    """Creates a least recently used (LRU) cache of steering matrices.
+
+    Steering matrices are identified by content hashes of the nominal element
+    locations, the perturbations considered, the source locations, and the
+    wavelength. Therefore estimators working on the same array design, search
+    grid, and wavelength can share one copy of the steering matrix even if
+    they do not share the same objects.
+
+    Cached steering matrices are marked read-only and should never be
+    modified.
+
+    Args:
+        max_bytes (int): Maximum number of bytes consumed by the cached
+            steering matrices. The least recently used steering matrices are
+            evicted when this budget is exceeded. Steering matrices larger than
+            this budget are never cached. Default value is 512 MiB.
+    """
+
+    def __init__(self, max_bytes=512 * 1024**2):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self):
+        """Retrieves or sets the maximum number of bytes of the cache. Setting
+        a smaller budget will evict steering matrices immediately."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def nbytes(self):
+        """Retrieves the number of bytes consumed by the cached steering
+        matrices."""
+        return self._nbytes
+
+    @property
+    def hits(self):
+        """Retrieves the number of cache hits."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Retrieves the number of cache misses."""
+        return self._misses
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Removes all the cached steering matrices and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def get(self, array, sources, wavelength, perturbations='known'):
+        """Retrieves the steering matrix from the cache, computing it if
+        necessary.
+
+        Args:
+            array (~doatools.model.arrays.ArrayDesign): Array design.
+            sources (~doatools.model.sources.SourcePlacement): Source
+                placement.
+            wavelength (float): Wavelength of the carrier wave.
+            perturbations (str): Specifies which perturbations are considered.
+                See :meth:`~doatools.model.arrays.ArrayDesign.steering_matrix`
+                for more details. Default value is ``'known'``.
+
+        Returns:
+            ~numpy.ndarray: A read-only steering matrix.
+        """
+        key = self._make_key(array, sources, wavelength, perturbations)
+        with self._lock:
+            A = self._entries.get(key)
+            if A is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return A
+            self._misses += 1
+        A = array.steering_matrix(sources, wavelength,
+                                  perturbations=perturbations)
+        A.setflags(write=False)
+        with self._lock:
+            if key not in self._entries and A.nbytes <= self._max_bytes:
+                self._entries[key] = A
+                self._nbytes += A.nbytes
+                self._evict()
+        return A
+
+    def _evict(self):
+        while self._nbytes > self._max_bytes:
+            _, A = self._entries.popitem(last=False)
+            self._nbytes -= A.nbytes
+
+    def _make_key(self, array, sources, wavelength, perturbations):
+        if perturbations == 'all':
+            perturb_list = array.perturbations
+        elif perturbations == 'known':
+            perturb_list = [p for p in array.perturbations if p.is_known]
+        elif perturbations == 'none':
+            perturb_list = []
+        else:
+            raise ValueError('Perturbation can only be "all", "known", or "none".')
+        perturb_key = tuple(sorted(
+            (type(p).__name__, _hash_params(p.params), p.is_known)
+            for p in perturb_list
+        ))
+        return (
+            type(array), _hash_array(array.element_locations), array.element,
+            perturb_key, type(sources), sources.units,
+            _hash_array(sources.locations), float(wavelength)
+        )
+
+_default_cache = SteeringMatrixCache()
+
+def get_default_steering_cache():
+    """Retrieves the process-wide steering matrix cache shared by estimators
+    created with ``shared_cache=True``."""
+    return _default_cache
@@ -1,12 +1,262 @@
+from collections import namedtuple
 import numpy as np
 import warnings
+from scipy.optimize import nnls
 try:
     import cvxpy as cvx
     cvx_available = True
 except ImportError:
-    warnings.warn('Cannot import cvxpr. Some sparse recovery based estimators will not be usable.')
+    warnings.warn('Cannot import cvxpy. Sparse recovery problems will be solved with the native solvers.')
     cvx_available = False
 
+class SolverInfo(namedtuple('SolverInfo', [
+        'backend', 'n_iterations', 'converged', 'objective'])):
+    """Summarizes the last call of ``solve`` of a sparse recovery problem.
+
+    Attributes:
+        backend (str): ``'cvxpy'`` or ``'native'``.
+        n_iterations (int): Number of iterations. May be ``None`` if not
+            reported by the solver.
+        converged (bool): Whether the solver reached the desired accuracy.
+        objective (float): Final value of the objective function.
+    """
+    __slots__ = ()
+
+def _soft_threshold(v, t, nonnegative):
+    """Evaluates the proximal operator of t||x||_1 (plus the indicator
+    function of the nonnegative orthant if ``nonnegative`` is ``True``)."""
+    if nonnegative:
+        return np.maximum(v - t, 0.0)
+    return np.sign(v) * np.maximum(np.abs(v) - t, 0.0)
+
+def _group_soft_threshold(V, t):
+    """Evaluates the proximal operator of t||X||_{2,1}, which shrinks the
+    l2 norm of each row of V by t."""
+    norms = np.sqrt(np.sum(V.real**2 + V.imag**2, axis=1, keepdims=True))
+    return V * np.maximum(1.0 - t / np.maximum(norms, np.finfo(np.float_).tiny), 0.0)
+
+def _project_simplex(v, l):
+    """Projects a nonnegative vector onto {x >= 0, sum(x) = l}."""
+    u = np.sort(v)[::-1]
+    css = np.cumsum(u) - l
+    idx = np.arange(1, v.size + 1)
+    rho = np.nonzero(u * idx > css)[0][-1]
+    return np.maximum(v - css[rho] / (rho + 1), 0.0)
+
+def _project_l1_ball(v, l, nonnegative):
+    """Projects v onto {||x||_1 <= l} (intersected with the nonnegative
+    orthant if ``nonnegative`` is ``True``)."""
+    if l <= 0:
+        return np.zeros_like(v)
+    if nonnegative:
+        v = np.maximum(v, 0.0)
+        return v if np.sum(v) <= l else _project_simplex(v, l)
+    a = np.abs(v)
+    if np.sum(a) <= l:
+        return v
+    return np.sign(v) * _project_simplex(a, l)
+
+class _DictionaryStatistics:
+    """Caches the Gram matrix and the Lipschitz constant of the gradient of
+    0.5 ||Ax - b||^2 for the last dictionary matrix."""
+
+    def __init__(self):
+        self._A = None
+
+    def update(self, A):
+        # The dictionary matrix is identified by identity, so it should not be
+        # modified in-place between calls.
+        if A is self._A:
+            return
+        m, k = A.shape
+        self._A = A
+        AH = A.conj().T
+        # Use the Gram matrix for the gradient if it is smaller than A.
+        self.G = AH @ A if k <= m else None
+        small_gram = self.G if self.G is not None else A @ AH
+        self.lipschitz = max(np.linalg.eigvalsh(small_gram)[-1], np.finfo(np.float_).tiny)
+        self._range_basis = None
+
+    def grad_ls(self, x, AHb):
+        """Evaluates the gradient of 0.5||Ax - b||^2 at x."""
+        if self.G is not None:
+            return self.G @ x - AHb
+        A = self._A
+        return A.conj().T @ (A @ x) - AHb
+
+    def min_residual(self, b, nonnegative):
+        """Evaluates min ||Ax - b||_2 (subject to x >= 0 if ``nonnegative``
+        is ``True``)."""
+        A = self._A
+        if nonnegative:
+            if np.iscomplexobj(A) or np.iscomplexobj(b):
+                A = np.vstack((A.real, A.imag))
+                b = np.concatenate((b.real, b.imag))
+            return nnls(A, b)[1]
+        if self._range_basis is None:
+            U, s, _ = np.linalg.svd(A, full_matrices=False)
+            rank = np.count_nonzero(s > s[0] * max(A.shape) * np.finfo(np.float_).eps)
+            self._range_basis = U[:, :rank]
+        Q = self._range_basis
+        return np.linalg.norm(b - Q @ (Q.conj().T @ b))
+
+def _fista(stats, prox, AHb, x0, step, max_iter, tol):
+    """Accelerated proximal gradient method with gradient-based adaptive
+    restarts for minimizing 0.5||Ax - b||^2 + g(x), where prox(v) evaluates
+    the proximal operator of step * g at v.
+
+    The iterations stop when the proximal gradient residual ||y - x_new|| / step
+    is at most tol * ||A^H b||. Because the subdifferential of the objective
+    at x_new contains an element whose norm is at most twice the residual,
+    this is a scale-aware optimality test that does not depend on the length
+    of the steps (which can be tiny when warm started on a coherent
+    dictionary).
+    """
+    x = x0
+    y = x0
+    t = 1.0
+    threshold = tol * max(np.linalg.norm(AHb), np.finfo(np.float_).tiny)
+    for i in range(max_iter):
+        x_new = prox(y - step * stats.grad_ls(y, AHb))
+        if np.linalg.norm(y - x_new) <= threshold * step:
+            return x_new, i + 1, True
+        dx = x_new - x
+        if np.real(np.vdot(y - x_new, dx)) > 0:
+            # Restarts the momentum when it points to an ascent direction.
+            t = 1.0
+        t_new = 0.5 * (1.0 + np.sqrt(1.0 + 4.0 * t * t))
+        y = x_new + ((t - 1.0) / t_new) * dx
+        x, t = x_new, t_new
+    return x, max_iter, False
+
+def _admm_constrainedl2(A, b, l, stats, nonnegative, x0, max_iter, tol,
+                        n_balance=1000, rho_range=1e4):
+    """Linearized ADMM for min ||x||_1 s.t. ||Ax - b||_2 <= l with the
+    splitting z = Ax - b.
+
+    The iterations stop when both the primal residual and the dual residual
+    are within the absolute and relative tolerances (both equal to tol)
+    described in [1]. The penalty parameter is adapted by residual balancing
+    during the first n_balance iterations only, and is kept within
+    rho_range times its initial value in either direction.
+
+    [1] S. Boyd, N. Parikh, E. Chu, B. Peleato, and J. Eckstein, "Distributed
+    optimization and statistical learning via the alternating direction method
+    of multipliers," Foundations and Trends in Machine Learning, vol. 3,
+    no. 1, pp. 1-122, 2011.
+    """
+    AH = A.conj().T
+    m, k = A.shape
+    mu = stats.lipschitz
+    norm_b = np.linalg.norm(b)
+    rho0 = 1.0 / max(norm_b, 1e-12)
+    rho = rho0
+    x = x0
+    r_x = A @ x - b
+    z = r_x.copy()
+    nz = np.linalg.norm(z)
+    if nz > l:
+        z *= l / nz
+    u = np.zeros_like(z)
+    for i in range(max_iter):
+        x_old, r_x_old, z_old = x, r_x, z
+        x = _soft_threshold(x - AH @ (r_x - z + u) / mu, 1.0 / (rho * mu),
+                            nonnegative)
+        r_x = A @ x - b
+        z = r_x + u
+        nz = np.linalg.norm(z)
+        if nz > l:
+            z *= l / nz
+        r = r_x - z
+        u += r
+        r_norm = np.linalg.norm(r)
+        # Because the x-update is linearized, the dual residual also includes
+        # the deviation from the exact x-update.
+        s_norm = rho * np.linalg.norm(
+            AH @ ((r_x - r_x_old) - (z - z_old)) - mu * (x - x_old)
+        )
+        eps_pri = np.sqrt(m) * tol + \
+            tol * max(np.linalg.norm(r_x + b), np.linalg.norm(z), norm_b)
+        eps_dual = np.sqrt(k) * tol + tol * rho * np.linalg.norm(AH @ u)
+        if r_norm <= eps_pri and s_norm <= eps_dual:
+            return x, i + 1, True
+        # Residual balancing.
+        if i < n_balance:
+            if r_norm / eps_pri > 10.0 * s_norm / eps_dual and \
+                    rho < rho0 * rho_range:
+                rho *= 2.0
+                u *= 0.5
+            elif s_norm / eps_dual > 10.0 * r_norm / eps_pri and \
+                    rho > rho0 / rho_range:
+                rho *= 0.5
+                u *= 2.0
+    return x, max_iter, False
+
+def _solve_path_screened(A, B, ls, score, run, kkt_slack=1e-4):
+    """Solves a sequence of penalized problems with decreasing regularization
+    parameters using warm starts and the sequential strong rules.
+
+    Args:
+        A: Dictionary matrix.
+        B: Observation vector or matrix.
+        ls: Decreasing regularization parameters.
+        score: A callable mapping the correlations A^H (B - AX) to the scores
+            of the atoms. The solution is zero for the atoms whose scores are
+            at most l.
+        run: A callable ``run(A_sub, l, X0, stats)`` returning the solution of
+            the reduced problem, the number of iterations, and the convergence
+            flag.
+
+    Returns:
+        list: A list of ``(X, n_iter, converged)``, one for each parameter.
+    """
+    AH = A.conj().T
+    X = np.zeros((A.shape[1],) + B.shape[1:], dtype=np.result_type(A, B))
+    R = B
+    l_prev = np.max(_atom_scores(score, AH @ R))
+    results = []
+    for l in ls:
+        if l >= l_prev and not np.any(X):
+            # The solution remains zero.
+            results.append((X.copy(), 0, True))
+            continue
+        c = _atom_scores(score, AH @ R)
+        active = (c >= 2 * l - l_prev) | _nonzero_atoms(X)
+        n_iter_total = 0
+        converged = True
+        while True:
+            # An empty active set implies that X is still zero and c is up to
+            # date.
+            if np.any(active):
+                stats = _DictionaryStatistics()
+                A_sub = A[:, active]
+                stats.update(A_sub)
+                X_sub, n_iter, converged = run(A_sub, l, X[active], stats)
+                n_iter_total += n_iter
+                X = np.zeros_like(X)
+                X[active] = X_sub
+                R = B - A_sub @ X_sub
+                c = _atom_scores(score, AH @ R)
+            violations = ~active & (c > l * (1.0 + kkt_slack))
+            if not np.any(violations):
+                break
+            active |= violations
+        results.append((X, n_iter_total, converged))
+        l_prev = l
+    return results
+
+def _atom_scores(score, C):
+    """Evaluates the scores of the atoms from the correlations, reducing the
+    rows of C by their l2 norms if C is a matrix."""
+    if C.ndim == 1:
+        return score(np.real(C))
+    return np.sqrt(np.sum(C.real**2 + C.imag**2, axis=1))
+
+def _nonzero_atoms(X):
+    if X.ndim == 1:
+        return X != 0
+    return np.any(X != 0, axis=1)
+
 class L1RegularizedLeastSquaresProblem:
     r"""Creates a reusable :math:`l_1`-regularized least squares problem.
 
@@ -40,7 +290,8 @@ class L1RegularizedLeastSquaresProblem:
         \text{s.t. }& \| \mathbf{x} \|_1 \leq l, \mathbf{x} \geq c.
         \end{aligned}
 
-    This formulation can be efficiently solved with QP.
+    This formulation can be efficiently solved with QP or projected gradient
+    methods.
 
     A less common variant, namely the ``'constrainedl2'`` formulation, is
     given by
@@ -55,7 +306,11 @@ class L1RegularizedLeastSquaresProblem:
     
     Note that the :math:`l_2` error is upper bounded by l. If l is too small
     this problem may be infeasible. This formulation can be converted to a
-    SOCP problem.
+    SOCP problem, or solved with ADMM.
+
+    The problem can be solved either with cvxpy or with the native first-order
+    solvers implemented with NumPy, which support warm starts and do not
+    require cvxpy. See :meth:`solve` for more details.
 
     Args:
         m (int): Dimension of the observation vector :math:`\mathbf{b}`.
@@ -68,8 +323,24 @@ class L1RegularizedLeastSquaresProblem:
     """
 
     def __init__(self, m, k, formulation='penalizedl1', nonnegative=False):
-        if not cvx_available:
-            raise RuntimeError('Cannot initialize when cvxpy is not available.')
+        if formulation not in ['penalizedl1', 'constrainedl1', 'constrainedl2']:
+            raise ValueError("Unknown formulation '{0}'.".format(formulation))
+        self._m = m
+        self._k = k
+        self._formulation = formulation
+        self._nonnegative = nonnegative
+        self._stats = _DictionaryStatistics()
+        self._last_info = None
+        if cvx_available:
+            self._init_cvx_problem(m, k, formulation, nonnegative)
+
+    @property
+    def last_info(self):
+        """Retrieves the :class:`SolverInfo` of the last call of
+        :meth:`solve`."""
+        return self._last_info
+
+    def _init_cvx_problem(self, m, k, formulation, nonnegative):
         # Initialize parameters and variables
         A = cvx.Parameter((m, k))
         b = cvx.Parameter((m, 1))
@@ -90,7 +361,6 @@ class L1RegularizedLeastSquaresProblem:
         if nonnegative:
             constraints.append(x >= 0)
         problem = cvx.Problem(cvx.Minimize(obj_func), constraints)
-        self._formulation = formulation
         self._A = A
         self._b = b
         self._l = l
@@ -99,23 +369,218 @@ class L1RegularizedLeastSquaresProblem:
         self._constraints = constraints
         self._problem = problem
 
-    def solve(self, A, b, l, **kwargs):
-        """Solves the problem with the specified parameters.
+    def solve(self, A, b, l, backend='auto', x0=None, **kwargs):
+        r"""Solves the problem with the specified parameters.
 
         Args:
             A (~numpy.ndarray): Dictionary matrix.
             b (~numpy.ndarray): Observation vector.
             l (float): Regularization/constraint parameter.
-            **kwargs: Other keyword arguments to be passed to the solver.
+            backend (str): Specifies the solver backend:
+
+                * ``'cvxpy'`` - Solves the problem with cvxpy.
+                * ``'native'`` - Solves the problem with first-order methods
+                  implemented with NumPy: FISTA for ``'penalizedl1'``,
+                  accelerated projected gradient for ``'constrainedl1'``, and
+                  linearized ADMM for ``'constrainedl2'``. The Gram matrix (or
+                  the matrix-vector products with ``A``) and the Lipschitz
+                  constant are computed once and reused as long as the same
+                  dictionary matrix object is passed, so ``A`` should not be
+                  modified in-place between calls.
+                * ``'auto'`` - Uses ``'cvxpy'`` if cvxpy is available and
+                  ``'native'`` otherwise. This is the default value.
+
+            x0 (~numpy.ndarray): Starting point for the ``'native'`` backend
+                (warm start), such as the solution for a nearby ``l``. Default
+                value is ``None``, in which case zeros are used.
+            **kwargs: Other keyword arguments to be passed to the solver. For
+                the ``'native'`` backend, ``max_iter`` (default 10000)
+                specifies the maximum number of iterations and ``tol``
+                (default 1e-6) specifies the relative tolerance. For
+                ``'penalizedl1'`` and ``'constrainedl1'``, the iterations stop
+                when the norm of the proximal gradient residual is at most
+                ``tol`` times :math:`\|\mathbf{A}^T\mathbf{b}\|_2`. For
+                ``'constrainedl2'``, ``tol`` is used as both the absolute and
+                the relative tolerances of the ADMM residuals, and the
+                feasibility of the problem is checked before the iterations.
+
+        Returns:
+            ~numpy.ndarray: The solution, which is a :math:`K \times 1` vector
+            if ``b`` is a column vector and a 1D vector otherwise. Zeros are
+            returned if the problem is infeasible or, for the ``'cvxpy'``
+            backend, if an optimal solution cannot be obtained. If the
+            ``'native'`` backend reaches the maximum number of iterations, the
+            last iterate is returned with a warning.
         """
+        if backend == 'auto':
+            backend = 'cvxpy' if cvx_available else 'native'
+        if backend == 'native':
+            return self._solve_native(A, b, l, x0, **kwargs)
+        if backend != 'cvxpy':
+            raise ValueError("Backend must be one of 'auto', 'cvxpy', and 'native'.")
+        if not cvx_available:
+            raise RuntimeError('Cannot use the cvxpy backend when cvxpy is not available.')
         self._A.value = A
-        self._b.value = b
+        self._b.value = b.reshape((-1, 1))
         self._l.value = l
         self._problem.solve(**kwargs)
+        self._last_info = SolverInfo(
+            'cvxpy', self._problem.solver_stats.num_iters,
+            self._problem.status == 'optimal', self._problem.value
+        )
         if self._problem.status != 'optimal':
             warnings.warn('Optimal solution cannot be obtained.')
-            return np.zeros((self._x.size,))
-        return self._x.value
+            return np.zeros((self._k, 1) if b.ndim == 2 else (self._k,))
+        return self._x.value if b.ndim == 2 else self._x.value.flatten()
+
+    def _solve_native(self, A, b, l, x0=None, max_iter=10000, tol=1e-6):
+        self._check_dictionary(A)
+        b_shape = b.shape
+        b = b.reshape((-1,))
+        x0 = np.zeros((self._k,)) if x0 is None else \
+            np.array(x0, dtype=np.float_).reshape((-1,))
+        self._stats.update(A)
+        x, n_iter, converged, obj = self._run_native(
+            A, b, l, x0, self._stats, max_iter, tol
+        )
+        self._last_info = SolverInfo('native', n_iter, converged, obj)
+        if not converged:
+            if np.isinf(obj):
+                warnings.warn('The problem is infeasible.')
+            else:
+                warnings.warn(
+                    'Maximum number of iterations reached. The solution may '
+                    'be inaccurate.'
+                )
+        return x.reshape((-1, 1)) if len(b_shape) == 2 else x
+
+    def _check_dictionary(self, A):
+        if A.shape != (self._m, self._k):
+            raise ValueError(
+                'Expecting an {0} x {1} dictionary matrix. Got {2}.'
+                .format(self._m, self._k, A.shape)
+            )
+
+    def _run_native(self, A, b, l, x0, stats, max_iter, tol):
+        """Runs the native solver on a (possibly reduced) dictionary matrix
+        whose statistics are already computed."""
+        nonnegative = self._nonnegative
+        if self._formulation == 'penalizedl1':
+            step = 1.0 / stats.lipschitz
+            prox = lambda v: _soft_threshold(v, step * l, nonnegative)
+            x, n_iter, converged = _fista(stats, prox, A.T @ b, prox(x0),
+                                          step, max_iter, tol)
+            obj = 0.5 * np.sum((A @ x - b)**2) + l * np.sum(np.abs(x))
+        elif self._formulation == 'constrainedl1':
+            # ||Ax - b||^2 has the same minimizer as 0.5||Ax - b||^2.
+            prox = lambda v: _project_l1_ball(v, l, nonnegative)
+            x, n_iter, converged = _fista(stats, prox, A.T @ b, prox(x0),
+                                          1.0 / stats.lipschitz, max_iter, tol)
+            obj = np.sum((A @ x - b)**2)
+        else:
+            # The ADMM iterations do not converge if the problem is
+            # infeasible, so the feasibility is checked first. The objective
+            # value of an infeasible problem is infinity.
+            if stats.min_residual(b, nonnegative) > l + tol * np.linalg.norm(b):
+                return np.zeros_like(x0), 0, False, np.inf
+            x, n_iter, converged = _admm_constrainedl2(
+                A, b, l, stats, nonnegative,
+                np.maximum(x0, 0.0) if nonnegative else x0, max_iter, tol
+            )
+            obj = np.sum(np.abs(x))
+        return x, n_iter, converged, obj
+
+    def solve_path(self, A, b, ls, screening=True, max_iter=10000, tol=1e-6):
+        """Solves the problem for a sequence of regularization/constraint
+        parameters with the native solvers.
+
+        For the ``'penalizedl1'`` and ``'constrainedl1'`` formulations, the
+        parameters are processed from the one leading to the sparsest solution
+        to the one leading to the densest solution (i.e., decreasing ``l`` for
+        ``'penalizedl1'`` and increasing ``l`` for ``'constrainedl1'``), and
+        each solve is warm started from the previous solution. The
+        ``'constrainedl2'`` formulation is solved independently for each
+        parameter since its ADMM iterations do not benefit from warm starts.
+
+        For the ``'penalizedl1'`` formulation, the sequential strong rules
+        are also used to discard the atoms that are very likely zero before
+        each solve, so that only a reduced problem is solved. The
+        Karush-Kuhn-Tucker (KKT) conditions are then checked for the
+        discarded atoms, and the violating atoms are added back before
+        re-solving. Therefore the screening does not change the solutions.
+
+        Args:
+            A (~numpy.ndarray): Dictionary matrix.
+            b (~numpy.ndarray): Observation vector.
+            ls (~numpy.ndarray): A sequence of regularization/constraint
+                parameters.
+            screening (bool): Whether the strong rules are used. Default
+                value is ``True``.
+            max_iter (int): Maximum number of iterations of each solve.
+                Default value is 10000.
+            tol (float): Relative tolerance. See :meth:`solve`. Default value
+                is 1e-6.
+
+        Returns:
+            tuple: A tuple containing the following elements:
+
+            * solutions (:class:`list`): A list of solutions, one for each
+              parameter in ``ls`` and in the same order. Each solution has the
+              same shape as the one returned by :meth:`solve`.
+            * infos (:class:`list`): A list of :class:`SolverInfo`, one for
+              each parameter in ``ls`` and in the same order. The number of
+              iterations include the iterations of all the re-solves.
+
+        References:
+            [1] R. Tibshirani, J. Bien, J. Friedman, T. Hastie, N. Simon,
+            J. Taylor, and R. J. Tibshirani, "Strong rules for discarding
+            predictors in lasso-type problems," Journal of the Royal
+            Statistical Society: Series B, vol. 74, no. 2, pp. 245-266, 2012.
+        """
+        self._check_dictionary(A)
+        b_shape = b.shape
+        b = b.reshape((-1,))
+        ls = np.asarray(ls, dtype=np.float_)
+        order = np.argsort(ls)
+        if self._formulation != 'constrainedl1':
+            order = order[::-1]
+        self._stats.update(A)
+        solutions = [None] * ls.size
+        infos = [None] * ls.size
+        if self._formulation == 'penalizedl1' and screening:
+            nonnegative = self._nonnegative
+            score = (lambda c: c) if nonnegative else np.abs
+            def run(A_sub, l, x0, stats):
+                x, n_iter, converged, obj = self._run_native(
+                    A_sub, b, l, x0, stats, max_iter, tol
+                )
+                return x, n_iter, converged
+            path = _solve_path_screened(A, b, ls[order], score, run)
+            for i, (x, n_iter, converged) in zip(order, path):
+                obj = 0.5 * np.sum((A @ x - b)**2) + ls[i] * np.sum(np.abs(x))
+                solutions[i] = x
+                infos[i] = SolverInfo('native', n_iter, converged, obj)
+        else:
+            x = np.zeros((self._k,))
+            for i in order:
+                if self._formulation == 'constrainedl2':
+                    # The ADMM iterations also depend on the dual variables,
+                    # which are not reusable across different constraints.
+                    # Warm starting the primal variable alone does not help.
+                    x = np.zeros((self._k,))
+                x, n_iter, converged, obj = self._run_native(
+                    A, b, ls[i], x, self._stats, max_iter, tol
+                )
+                infos[i] = SolverInfo('native', n_iter, converged, obj)
+                solutions[i] = x
+        if not all(info.converged for info in infos):
+            warnings.warn(
+                'The solver did not converge for some of the parameters.'
+            )
+        if len(b_shape) == 2:
+            solutions = [x.reshape((-1, 1)) for x in solutions]
+        self._last_info = infos[order[-1]]
+        return solutions, infos
 
 class L21RegularizedLeastSquaresProblem:
     r"""Creates an :math:`l_{2,1}`-norm regularized least squares problem.
@@ -154,8 +619,23 @@ class L21RegularizedLeastSquaresProblem:
     """
 
     def __init__(self, m, k, n, complex=False):
-        if not cvx_available:
-            raise RuntimeError('Cannot initialize when cvxpy is not available.')
+        self._m = m
+        self._k = k
+        self._n = n
+        self._complex = complex
+        self._stats = _DictionaryStatistics()
+        self._last_solution = None
+        self._last_info = None
+        if cvx_available:
+            self._init_cvx_problem(m, k, n, complex)
+
+    @property
+    def last_info(self):
+        """Retrieves the :class:`SolverInfo` of the last call of
+        :meth:`solve`."""
+        return self._last_info
+
+    def _init_cvx_problem(self, m, k, n, complex):
         # Initialize parameters and variables
         A = cvx.Parameter((m, k), complex=complex)
         B = cvx.Parameter((m, n), complex=complex)
@@ -174,20 +654,177 @@ class L21RegularizedLeastSquaresProblem:
         self._l = l
         self._X = X
 
-    def solve(self, A, B, l, **kwargs):
-        """Solves the problem with the specified parameters.
+    def solve(self, A, B, l, backend='auto', x0=None, **kwargs):
+        r"""Solves the problem with the specified parameters.
 
         Args:
             A (~numpy.ndarray): Dictionary matrix.
             B (~numpy.ndarray): Observation matrix.
             l (~numpy.ndarray): Regularization parameter.
-            **kwargs: Other keyword arguments to be passed to the solver.
+            backend (str): Specifies the solver backend:
+
+                * ``'cvxpy'`` - Solves the problem with cvxpy.
+                * ``'native'`` - Solves the problem directly on (complex)
+                  NumPy arrays with the accelerated proximal gradient method
+                  (FISTA), whose proximal step shrinks the rows of
+                  :math:`\mathbf{X}` (group soft-thresholding). The Lipschitz
+                  constant is computed once and reused as long as the same
+                  dictionary matrix object is passed, so ``A`` should not be
+                  modified in-place between calls.
+                * ``'auto'`` - Uses ``'cvxpy'`` if cvxpy is available and
+                  ``'native'`` otherwise. This is the default value.
+
+            x0 (~numpy.ndarray): Starting point for the ``'native'`` backend.
+                Default value is ``None``.
+            **kwargs: Other keyword arguments to be passed to the solver. For
+                the ``'native'`` backend, ``warm_start`` (default ``False``)
+                specifies whether the solution of the last call is used as the
+                starting point when ``x0`` is not specified, ``max_iter``
+                (default 10000) specifies the maximum number of iterations, and
+                ``tol`` (default 1e-6) specifies the tolerance of the proximal
+                gradient residual relative to
+                :math:`\|\mathbf{A}^H\mathbf{B}\|_F`.
+
+        Returns:
+            ~numpy.ndarray: The :math:`K \times L` solution. Zeros are returned
+            if an optimal solution cannot be obtained.
         """
+        if backend == 'auto':
+            backend = 'cvxpy' if cvx_available else 'native'
+        if backend == 'native':
+            return self._solve_native(A, B, l, x0, **kwargs)
+        if backend != 'cvxpy':
+            raise ValueError("Backend must be one of 'auto', 'cvxpy', and 'native'.")
+        if not cvx_available:
+            raise RuntimeError('Cannot use the cvxpy backend when cvxpy is not available.')
         self._A.value = A
         self._B.value = B
         self._l.value = l
         self._problem.solve(**kwargs)
+        self._last_info = SolverInfo(
+            'cvxpy', self._problem.solver_stats.num_iters,
+            self._problem.status == 'optimal', self._problem.value
+        )
         if self._problem.status != 'optimal':
             warnings.warn('Optimal solution cannot be obtained.')
             return np.zeros(self._X.shape)
         return self._X.value
+
+    def _solve_native(self, A, B, l, x0=None, warm_start=False, max_iter=10000,
+                      tol=1e-6):
+        if A.shape != (self._m, self._k):
+            raise ValueError(
+                'Expecting an {0} x {1} dictionary matrix. Got {2}.'
+                .format(self._m, self._k, A.shape)
+            )
+        if B.shape != (self._m, self._n):
+            raise ValueError(
+                'Expecting an {0} x {1} observation matrix. Got {2}.'
+                .format(self._m, self._n, B.shape)
+            )
+        dtype = np.complex_ if self._complex else np.float_
+        if x0 is None and warm_start:
+            x0 = self._last_solution
+        X0 = np.zeros((self._k, self._n), dtype=dtype) if x0 is None else \
+            np.array(x0, dtype=dtype).reshape((self._k, self._n))
+        self._stats.update(A)
+        X, n_iter, converged, obj = self._run_native(A, B, l, X0, self._stats,
+                                                     max_iter, tol)
+        self._last_info = SolverInfo('native', n_iter, converged, obj)
+        self._last_solution = X
+        if not converged:
+            warnings.warn(
+                'Maximum number of iterations reached. The solution may be '
+                'inaccurate.'
+            )
+        return X
+
+    def _run_native(self, A, B, l, X0, stats, max_iter, tol):
+        """Runs the native solver on a (possibly reduced) dictionary matrix
+        whose statistics are already computed."""
+        step = 1.0 / stats.lipschitz
+        prox = lambda V: _group_soft_threshold(V, step * l)
+        X, n_iter, converged = _fista(stats, prox, A.conj().T @ B, prox(X0),
+                                      step, max_iter, tol)
+        E = A @ X - B
+        obj = 0.5 * np.sum(E.real**2 + E.imag**2) + \
+            l * np.sum(np.linalg.norm(X, axis=1))
+        return X, n_iter, converged, obj
+
+    def solve_path(self, A, B, ls, screening=True, max_iter=10000, tol=1e-6):
+        r"""Solves the problem for a sequence of regularization parameters with
+        the native solver.
+
+        The regularization parameters are processed in decreasing order, and
+        each solve is warm started from the previous solution. If
+        ``screening`` is ``True``, the sequential strong rules are used to
+        discard the rows of :math:`\mathbf{X}` that are very likely zero
+        before each solve, and the discarded rows violating the KKT conditions
+        are added back before re-solving. See
+        :meth:`L1RegularizedLeastSquaresProblem.solve_path` for more details.
+
+        Args:
+            A (~numpy.ndarray): Dictionary matrix.
+            B (~numpy.ndarray): Observation matrix.
+            ls (~numpy.ndarray): A sequence of regularization parameters.
+            screening (bool): Whether the strong rules are used. Default
+                value is ``True``.
+            max_iter (int): Maximum number of iterations of each solve.
+                Default value is 10000.
+            tol (float): Relative tolerance. See :meth:`solve`. Default value
+                is 1e-6.
+
+        Returns:
+            tuple: A tuple containing the following elements:
+
+            * solutions (:class:`list`): A list of :math:`K \times L`
+              solutions, one for each parameter in ``ls`` and in the same
+              order.
+            * infos (:class:`list`): A list of :class:`SolverInfo`, one for
+              each parameter in ``ls`` and in the same order.
+        """
+        if A.shape != (self._m, self._k):
+            raise ValueError(
+                'Expecting an {0} x {1} dictionary matrix. Got {2}.'
+                .format(self._m, self._k, A.shape)
+            )
+        if B.shape != (self._m, self._n):
+            raise ValueError(
+                'Expecting an {0} x {1} observation matrix. Got {2}.'
+                .format(self._m, self._n, B.shape)
+            )
+        dtype = np.complex_ if self._complex else np.float_
+        B = B.astype(dtype, copy=False)
+        ls = np.asarray(ls, dtype=np.float_)
+        order = np.argsort(ls)[::-1]
+        self._stats.update(A)
+        solutions = [None] * ls.size
+        infos = [None] * ls.size
+        if screening:
+            def run(A_sub, l, X0, stats):
+                X, n_iter, converged, obj = self._run_native(
+                    A_sub, B, l, X0, stats, max_iter, tol
+                )
+                return X, n_iter, converged
+            path = _solve_path_screened(A, B, ls[order], None, run)
+            for i, (X, n_iter, converged) in zip(order, path):
+                E = A @ X - B
+                obj = 0.5 * np.sum(E.real**2 + E.imag**2) + \
+                    ls[i] * np.sum(np.linalg.norm(X, axis=1))
+                solutions[i] = X
+                infos[i] = SolverInfo('native', n_iter, converged, obj)
+        else:
+            X = np.zeros((self._k, self._n), dtype=dtype)
+            for i in order:
+                X, n_iter, converged, obj = self._run_native(
+                    A, B, ls[i], X, self._stats, max_iter, tol
+                )
+                solutions[i] = X
+                infos[i] = SolverInfo('native', n_iter, converged, obj)
+        if not all(info.converged for info in infos):
+            warnings.warn(
+                'The solver did not converge for some of the parameters.'
+            )
+        self._last_info = infos[order[-1]]
+        self._last_solution = solutions[order[-1]]
+        return solutions, infos
@@ -1,2 +1,3 @@
 from .crb import crb_det_farfield_1d, crb_sto_farfield_1d, crb_stouc_farfield_1d
 from .mse import ecov_music_1d, ecov_coarray_music_1d
+from .montecarlo import MonteCarloAggregate, run_monte_carlo
@@ -0,0 +1,205 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from ..model.snapshots import get_narrowband_snapshots
+
+class MonteCarloAggregate:
+    """Accumulates the results of the Monte Carlo trials of one sweep point.
+
+    Args:
+        n_sources (int): Number of sources.
+        params (dict): Parameters of the sweep point.
+    """
+
+    def __init__(self, n_sources, params):
+        self._params = params
+        self._n_trials = 0
+        self._n_resolved = 0
+        self._sum_squared_errors = np.zeros((n_sources,))
+
+    @property
+    def params(self):
+        """Retrieves the parameters of the sweep point."""
+        return self._params
+
+    @property
+    def n_trials(self):
+        """Retrieves the number of completed trials."""
+        return self._n_trials
+
+    @property
+    def n_resolved(self):
+        """Retrieves the number of trials in which the estimator resolved all
+        the sources."""
+        return self._n_resolved
+
+    @property
+    def resolution_probability(self):
+        """Retrieves the empirical probability of resolution."""
+        if self._n_trials == 0:
+            return np.nan
+        return self._n_resolved / self._n_trials
+
+    @property
+    def mse(self):
+        """Retrieves the mean-squared errors of the individual sources over the
+        resolved trials. The errors of multi-dimensional source locations are
+        summed over the dimensions."""
+        if self._n_resolved == 0:
+            return np.full(self._sum_squared_errors.shape, np.nan)
+        return self._sum_squared_errors / self._n_resolved
+
+    def _merge(self, n_trials, n_resolved, sum_squared_errors):
+        self._n_trials += n_trials
+        self._n_resolved += n_resolved
+        self._sum_squared_errors += sum_squared_errors
+
+def _get_trial_seed(entropy, point_index, trial_index):
+    """Creates the seed sequence of a trial, which only depends on the root
+    entropy and the indices."""
+    return np.random.SeedSequence(entropy, spawn_key=(point_index, trial_index))
+
+def _run_trials(settings, estimator_factory, estimate_kwargs, entropy,
+                point_index, start, stop):
+    """Runs the trials [start, stop) of a sweep point and returns the partial
+    aggregates."""
+    array = settings['array']
+    sources = settings['sources']
+    wavelength = settings['wavelength']
+    estimator = estimator_factory(array, wavelength)
+    n_resolved = 0
+    sum_squared_errors = np.zeros((sources.size,))
+    for t in range(start, stop):
+        rng = np.random.default_rng(_get_trial_seed(entropy, point_index, t))
+        _, R = get_narrowband_snapshots(
+            array, sources, wavelength, settings['source_signal'],
+            settings['noise_signal'], settings['n_snapshots'],
+            return_covariance=True, rng=rng
+        )
+        resolved, estimates = estimator.estimate(R, sources.size,
+                                                 **estimate_kwargs)
+        if not resolved:
+            continue
+        n_resolved += 1
+        if sources.locations.ndim == 1:
+            # Estimates of 1D sources are not necessarily in the same order.
+            errors = np.sort(estimates.locations) - np.sort(sources.locations)
+            sum_squared_errors += errors**2
+        else:
+            errors = estimates.locations - sources.locations
+            sum_squared_errors += np.sum(errors**2, axis=1)
+    return point_index, stop - start, n_resolved, sum_squared_errors
+
+def run_monte_carlo(array, sources, wavelength, source_signal, noise_signal,
+                    n_snapshots, estimator_factory, sweep, n_trials,
+                    estimate_kwargs=None, seed=None, n_workers=1,
+                    batch_size=100, callback=None):
+    r"""Runs Monte Carlo trials to estimate the mean-squared errors (MSEs) and
+    the probabilities of resolution of an estimator over a parameter sweep.
+
+    In each trial, snapshots are generated using
+    :meth:`~doatools.model.snapshots.get_narrowband_snapshots`, and the
+    estimator is applied to the resulting sample covariance matrix.
+
+    The trials are split into batches of ``batch_size`` trials, which are
+    distributed over a pool of ``n_workers`` processes. Each trial uses its
+    own :class:`~numpy.random.Generator` seeded by ``seed`` and the indices of
+    the sweep point and the trial, and the batches are aggregated in a fixed
+    order. Therefore the results are reproducible regardless of the number of
+    workers.
+
+    Args:
+        array (~doatools.model.arrays.ArrayDesign): Array design.
+        sources (~doatools.model.sources.SourcePlacement): Source placement.
+        wavelength (float): Wavelength of the carrier wave.
+        source_signal (~doatools.model.signals.SignalGenerator): Source signal
+            generator.
+        noise_signal (~doatools.model.signals.SignalGenerator): Noise signal
+            generator.
+        n_snapshots (int): Number of snapshots.
+        estimator_factory: A callable that accepts an array design and a
+            wavelength and returns an estimator whose ``estimate`` method
+            accepts a covariance matrix and the number of sources (e.g.,
+            ``functools.partial(MUSIC, search_grid=grid)``). The estimates must
+            be measured in the same unit as ``sources``.
+        sweep (list): A list of dictionaries, one for each sweep point. Each
+            dictionary may override any of ``'array'``, ``'sources'``,
+            ``'wavelength'``, ``'source_signal'``, ``'noise_signal'``, and
+            ``'n_snapshots'``. For instance, an SNR sweep can be specified by a
+            list of ``{'noise_signal': ComplexStochasticSignal(m, p)}`` with
+            different noise powers ``p``.
+        n_trials (int): Number of trials for each sweep point.
+        estimate_kwargs (dict): Additional keyword arguments passed to
+            ``estimate``. Default value is ``None``.
+        seed (int): Root seed of all the trials. If not specified, fresh
+            entropy is used, which can be retrieved from the returned value.
+            Default value is ``None``.
+        n_workers (int): Number of worker processes. If set to 1, the trials
+            are run in the current process. When greater than 1, the
+            arguments must be picklable (e.g., lambdas cannot be used as
+            ``estimator_factory``). Default value is 1.
+        batch_size (int): Number of trials in each batch. Default value is 100.
+        callback: A callable ``callback(point_index, aggregate)`` invoked after
+            each batch is aggregated, where ``aggregate`` is the
+            :class:`MonteCarloAggregate` of the sweep point. Can be used to
+            monitor the partial results. Default value is ``None``.
+
+    Returns:
+        A tuple with the following elements.
+
+        * aggregates (:class:`list`): A list of :class:`MonteCarloAggregate`,
+          one for each sweep point.
+        * seed (:class:`int`): The root seed, which can be used to reproduce
+          the results.
+    """
+    valid_keys = {'array', 'sources', 'wavelength', 'source_signal',
+                  'noise_signal', 'n_snapshots'}
+    base_settings = {
+        'array': array,
+        'sources': sources,
+        'wavelength': wavelength,
+        'source_signal': source_signal,
+        'noise_signal': noise_signal,
+        'n_snapshots': n_snapshots
+    }
+    settings_list = []
+    for params in sweep:
+        invalid_keys = set(params.keys()) - valid_keys
+        if len(invalid_keys) > 0:
+            raise ValueError(
+                'Unknown sweep parameters: {0}.'
+                .format(', '.join(sorted(invalid_keys)))
+            )
+        settings = base_settings.copy()
+        settings.update(params)
+        settings_list.append(settings)
+    if n_trials < 1:
+        raise ValueError('The number of trials must be a positive integer.')
+    if batch_size < 1:
+        raise ValueError('The batch size must be a positive integer.')
+    if n_workers < 1:
+        raise ValueError('The number of workers must be a positive integer.')
+    if estimate_kwargs is None:
+        estimate_kwargs = {}
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    aggregates = [MonteCarloAggregate(s['sources'].size, p)
+                  for s, p in zip(settings_list, sweep)]
+    jobs = [
+        (settings, estimator_factory, estimate_kwargs, seed, i, start,
+         min(start + batch_size, n_trials))
+        for i, settings in enumerate(settings_list)
+        for start in range(0, n_trials, batch_size)
+    ]
+    def consume(results):
+        # Results are consumed in the order of the jobs, which makes the
+        # floating point sums reproducible.
+        for point_index, n, n_resolved, sum_squared_errors in results:
+            aggregates[point_index]._merge(n, n_resolved, sum_squared_errors)
+            if callback is not None:
+                callback(point_index, aggregates[point_index])
+    if n_workers == 1:
+        consume(_run_trials(*job) for job in jobs)
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            consume(executor.map(_run_trials, *zip(*jobs)))
+    return aggregates, seed
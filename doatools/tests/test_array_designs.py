@@ -5,11 +5,12 @@ from scipy.linalg import toeplitz
 from doatools.model.array_elements import CustomNonisotropicSensor
 from doatools.model.perturbations import LocationErrors, GainErrors, \
                                          PhaseErrors, MutualCoupling
-from doatools.model.arrays import GridBasedArrayDesign
+from doatools.model.arrays import ArrayDesign, GridBasedArrayDesign
 from doatools.model.arrays import UniformLinearArray, CoPrimeArray, \
                                   NestedArray, MinimumRedundancyLinearArray, \
                                   UniformCircularArray, UniformRectangularArray
-from doatools.model.sources import FarField1DSourcePlacement
+from doatools.model.sources import FarField1DSourcePlacement, FarField2DSourcePlacement
+from doatools.utils.math import khatri_rao, cartesian
 
 class Test1DArrayDesigns(unittest.TestCase):
 
@@ -211,6 +212,35 @@ class TestSteeringMatrix(unittest.TestCase):
     def test_with_perturbations(self):
         pass
 
+    def test_factored_ura(self):
+        ura = UniformRectangularArray(4, 6, self.wavelength / 2)
+        sources = FarField2DSourcePlacement(cartesian(
+            np.linspace(-np.pi, np.pi, 12), np.linspace(0, np.pi/2, 5)
+        ))
+        F = ura.steering_matrix_factors(sources, self.wavelength)
+        self.assertEqual(F[0].shape, (4, sources.size))
+        self.assertEqual(F[1].shape, (6, sources.size))
+        A_expected = ArrayDesign.steering_matrix(ura, sources, self.wavelength)
+        npt.assert_allclose(khatri_rao(F[0], F[1]), A_expected, atol=1e-12)
+        npt.assert_allclose(ura.steering_matrix(sources, self.wavelength),
+                            A_expected, atol=1e-12)
+        # Perturbations other than location errors are applied after the
+        # steering matrix is assembled.
+        np.random.seed(0)
+        perturbations = [
+            GainErrors(np.random.uniform(-0.2, 0.2, (ura.size,)), True),
+            PhaseErrors(np.random.uniform(-0.2, 0.2, (ura.size,)), False),
+            MutualCoupling(toeplitz(0.1 ** np.arange(ura.size)), True),
+            LocationErrors(np.random.uniform(-0.05, 0.05, (ura.size, 2)), False)
+        ]
+        ura_perturbed = ura.get_perturbed_copy(perturbations)
+        for p in ['all', 'known', 'none']:
+            npt.assert_allclose(
+                ura_perturbed.steering_matrix(sources, self.wavelength, perturbations=p),
+                ArrayDesign.steering_matrix(ura_perturbed, sources, self.wavelength, perturbations=p),
+                atol=1e-12
+            )
+
     def test_custom_nonisotropic_1d(self):
         # Sine response for azimuth angles (cosine for broadside angles)
         f_sr = lambda r, az, el, pol: np.sin(az)
@@ -339,5 +369,11 @@ class TestArrayPerturbations(unittest.TestCase):
                 phase_errors
             )
 
+    def test_centro_symmetry(self):
+        self.assertTrue(UniformLinearArray(7, 0.5).is_centro_symmetric)
+        self.assertTrue(UniformRectangularArray(3, 4, 0.5).is_centro_symmetric)
+        self.assertFalse(NestedArray(2, 3, 0.5).is_centro_symmetric)
+        self.assertFalse(CoPrimeArray(2, 3, 0.5).is_centro_symmetric)
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,7 +3,8 @@ from doatools.model.arrays import UniformLinearArray
 from doatools.model.sources import FarField1DSourcePlacement, NearField2DSourcePlacement
 from doatools.model.signals import ComplexStochasticSignal
 from doatools.estimation.grid import FarField1DSearchGrid, NearField2DSearchGrid
-from doatools.estimation.beamforming import BartlettBeamformer, MVDRBeamformer
+from doatools.estimation.beamforming import BartlettBeamformer, MVDRBeamformer, \
+                                           f_mvdr
 import numpy as np
 import numpy.testing as npt
 
@@ -31,5 +32,90 @@ class TestBeamforming(unittest.TestCase):
         self.assertTrue(resolved)
         npt.assert_allclose(sources.locations, estimates.locations, rtol=1e-2)
 
+    def test_beamforming_batch(self):
+        np.random.seed(42)
+        ula = UniformLinearArray(10, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/3, np.pi/4, 3))
+        A = ula.steering_matrix(sources, self.wavelength)
+        Rs = []
+        for _ in range(5):
+            N = (np.random.randn(ula.size, 40) + 1j * np.random.randn(ula.size, 40)) * 0.3
+            S = np.random.randn(sources.size, 40) + 1j * np.random.randn(sources.size, 40)
+            Y = A @ S + N
+            Rs.append(Y @ Y.conj().T / 40)
+        Rs = np.stack(Rs)
+        grid = FarField1DSearchGrid(size=360)
+        for estimator in [MVDRBeamformer(ula, self.wavelength, grid),
+                          BartlettBeamformer(ula, self.wavelength, grid)]:
+            resolved, estimates, sps = estimator.estimate_batch(
+                Rs, sources.size, return_spectrum=True)
+            for t in range(Rs.shape[0]):
+                r, est, sp = estimator.estimate(Rs[t], sources.size,
+                                                return_spectrum=True)
+                self.assertEqual(r, resolved[t])
+                if r:
+                    npt.assert_allclose(estimates[t], est.locations)
+                    npt.assert_allclose(sps[t], sp, rtol=1e-10)
+                else:
+                    self.assertTrue(np.all(np.isnan(estimates[t])))
+
+    def test_mvdr_singular(self):
+        ula = UniformLinearArray(6, self.wavelength / 2)
+        grid = FarField1DSearchGrid(size=90)
+        A = ula.steering_matrix(grid.source_placement, self.wavelength)
+        # The last sensor receives nothing, so R is singular and the
+        # pseudo-inverse is used.
+        R = np.diag([1.0, 2.0, 1.0, 3.0, 1.0, 0.0])
+        sp_expected = 1.0 / np.real(np.sum(A.conj() * (np.linalg.pinv(R) @ A), axis=0))
+        npt.assert_allclose(f_mvdr(A, R), sp_expected)
+        Rs = np.stack([R, np.eye(ula.size)])
+        sps = f_mvdr(A, Rs)
+        npt.assert_allclose(sps[0], sp_expected)
+        npt.assert_allclose(sps[1], f_mvdr(A, np.eye(ula.size)))
+
+    def test_bartlett_fft(self):
+        ula = UniformLinearArray(10, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/3, np.pi/4, 3))
+        A = ula.steering_matrix(sources, self.wavelength)
+        R = A @ A.T.conj() + 0.1 * np.eye(ula.size)
+        for grid, mode, rtol in [
+            (FarField1DSearchGrid(size=720, unit='sin'), 'auto', 1e-10),
+            (FarField1DSearchGrid(size=720), 'interp', 1e-3)
+        ]:
+            estimator = BartlettBeamformer(ula, self.wavelength, grid, fft_spectrum=mode)
+            estimator_direct = BartlettBeamformer(ula, self.wavelength, grid, fft_spectrum='off')
+            self.assertEqual(estimator._get_fft_evaluator().is_exact, mode == 'auto')
+            resolved, estimates, sp = estimator.estimate(R, 3, return_spectrum=True)
+            _, estimates_direct, sp_direct = estimator_direct.estimate(R, 3, return_spectrum=True)
+            self.assertTrue(resolved)
+            npt.assert_allclose(estimates.locations, estimates_direct.locations)
+            npt.assert_allclose(sp, sp_direct, rtol=rtol)
+        # Not applicable to grids with the unit 'rad' unless interpolation is
+        # enabled.
+        estimator = BartlettBeamformer(ula, self.wavelength, FarField1DSearchGrid())
+        self.assertIsNone(estimator._get_fft_evaluator())
+
+    def test_beamforming_chunked(self):
+        ula = UniformLinearArray(12, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/3, np.pi/4, 3))
+        A = ula.steering_matrix(sources, self.wavelength)
+        R = A @ A.T.conj() + 0.1 * np.eye(ula.size)
+        grid = FarField1DSearchGrid(size=1000)
+        for cls in [BartlettBeamformer, MVDRBeamformer]:
+            _, estimates, sp = cls(ula, self.wavelength, grid).estimate(
+                R, 3, return_spectrum=True
+            )
+            # Only the first two blocks fit in the cache budget.
+            estimator = cls(ula, self.wavelength, grid, chunk_size=300,
+                            chunk_cache_bytes=600 * ula.size * 16)
+            for _ in range(2):
+                resolved, estimates_c, sp_c = estimator.estimate(
+                    R, 3, return_spectrum=True
+                )
+                self.assertTrue(resolved)
+                npt.assert_allclose(estimates_c.locations, estimates.locations)
+                npt.assert_allclose(sp_c, sp)
+            self.assertEqual(len(estimator._atom_blocks), 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,11 @@
 import unittest
 import numpy as np
 import numpy.testing as npt
-from doatools.model.arrays import UniformLinearArray
-from doatools.model.sources import FarField1DSourcePlacement
-from doatools.estimation.esprit import Esprit1D
+from doatools.model.arrays import UniformLinearArray, UniformRectangularArray
+from doatools.model.sources import FarField1DSourcePlacement, FarField2DSourcePlacement
+from doatools.estimation.esprit import Esprit1D, Esprit2D, get_default_row_weights
+from doatools.model.signals import ComplexStochasticSignal
+from doatools.model.snapshots import get_sample_covariance_batch
 import itertools
 
 class TestEsprit(unittest.TestCase):
@@ -37,5 +39,93 @@ class TestEsprit(unittest.TestCase):
                 npt.assert_allclose(estimates.locations, sources.locations,
                                     rtol=1e-2, atol=1e-8, err_msg=err_msg)
 
+    def test_esprit_1d_batch(self):
+        ula = UniformLinearArray(12, self.wavelength / 2.0)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 3))
+        Rs = get_sample_covariance_batch(
+            ula, sources, self.wavelength,
+            ComplexStochasticSignal(sources.size, 1.0),
+            ComplexStochasticSignal(ula.size, 0.5), 50, 8, rng=42
+        )
+        estimator = Esprit1D(self.wavelength)
+        for d, f, rw, unit in itertools.product(
+                [1, 2], ['ls', 'tls'], ['none', 'default'], ['rad', 'sin']):
+            resolved, estimates = estimator.estimate_batch(
+                Rs, sources.size, displacement=d, formulation=f,
+                row_weights=rw, unit=unit)
+            self.assertTrue(np.all(resolved))
+            self.assertEqual(estimates.shape, (Rs.shape[0], sources.size))
+            for t in range(Rs.shape[0]):
+                _, est = estimator.estimate(Rs[t], sources.size, None, d, f,
+                                            rw, unit)
+                npt.assert_allclose(estimates[t], est.locations)
+
+    def test_unitary_esprit(self):
+        ula = UniformLinearArray(11, self.wavelength / 2.0)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 3))
+        Rs = get_sample_covariance_batch(
+            ula, sources, self.wavelength,
+            ComplexStochasticSignal(sources.size, 1.0),
+            ComplexStochasticSignal(ula.size, 0.1), 100, 6, rng=42
+        )
+        # Unitary ESPRIT is equivalent to ESPRIT with forward-backward
+        # averaging.
+        P = np.eye(ula.size)[::-1]
+        Rs_fb = 0.5 * (Rs + P @ Rs.conj() @ P)
+        estimator = Esprit1D(self.wavelength)
+        for d, f, rw in itertools.product([1, 2], ['ls', 'tls'], ['none', 'default']):
+            resolved, estimates = estimator.estimate_batch(
+                Rs, sources.size, displacement=d, formulation=f,
+                row_weights=rw, unit='sin', unitary=True)
+            self.assertTrue(np.all(resolved))
+            for t in range(Rs.shape[0]):
+                _, est = estimator.estimate(Rs[t], sources.size, None, d, f,
+                                            rw, 'sin', unitary=True)
+                npt.assert_allclose(estimates[t], est.locations)
+            _, estimates_fb = estimator.estimate_batch(
+                Rs_fb, sources.size, displacement=d, formulation=f,
+                row_weights=rw, unit='sin')
+            npt.assert_allclose(estimates, estimates_fb, atol=1e-3)
+        with self.assertRaises(ValueError):
+            estimator.estimate(Rs[0], sources.size, row_weights=np.arange(10.0),
+                               unitary=True)
+
+    def test_esprit_2d(self):
+        ura = UniformRectangularArray(6, 5, (0.5, 0.4))
+        sources = FarField2DSourcePlacement(np.array([
+            [-2.0, 0.2], [0.3, 0.6], [1.5, 1.1], [2.8, 0.9]
+        ]))
+        estimator = Esprit2D(ura, self.wavelength)
+        # Use the ideal covariance matrix at SNR = 20 dB
+        A = ura.steering_matrix(sources, self.wavelength)
+        R = A @ A.conj().T + 0.01 * np.eye(ura.size)
+        for f in ['ls', 'tls']:
+            resolved, estimates = estimator.estimate(R, sources.size, f)
+            self.assertTrue(resolved)
+            npt.assert_allclose(estimates.locations, sources.locations, atol=1e-8)
+            _, estimates = estimator.estimate(R, sources.size, f, 'deg')
+            npt.assert_allclose(estimates.locations,
+                                np.rad2deg(sources.locations), atol=1e-6)
+        # Batch estimation
+        Rs = get_sample_covariance_batch(
+            ura, sources, self.wavelength,
+            ComplexStochasticSignal(sources.size, 1.0),
+            ComplexStochasticSignal(ura.size, 0.1), 100, 5, rng=0
+        )
+        resolved, estimates = estimator.estimate_batch(Rs, sources.size)
+        self.assertTrue(np.all(resolved))
+        self.assertEqual(estimates.shape, (5, sources.size, 2))
+        for t in range(Rs.shape[0]):
+            _, est = estimator.estimate(Rs[t], sources.size)
+            npt.assert_allclose(estimates[t], est.locations)
+        npt.assert_allclose(estimates, np.tile(sources.locations, (5, 1, 1)),
+                            atol=0.05)
+        with self.assertRaises(ValueError):
+            Esprit2D(UniformLinearArray(5, 0.5), self.wavelength)
+
+    def test_default_row_weights(self):
+        npt.assert_allclose(get_default_row_weights(5)**2, [1, 2, 3, 2, 1])
+        npt.assert_allclose(get_default_row_weights(4)**2, [1, 2, 2, 1])
+
 if __name__ == '__main__':
     unittest.main()
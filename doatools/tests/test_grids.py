@@ -1,7 +1,8 @@
 import unittest
 import numpy as np
 import numpy.testing as npt
-from doatools.estimation.grid import FarField1DSearchGrid, FarField2DSearchGrid
+from doatools.estimation.grid import FarField1DSearchGrid, FarField2DSearchGrid, \
+    NearField2DSearchGrid
 from doatools.utils.math import cartesian
 
 class Test1DGrids(unittest.TestCase):
@@ -63,6 +64,17 @@ class Test1DGrids(unittest.TestCase):
                 g, axes_expected[i], grid.axis_names, grid.units
             )
 
+    def test_far_field_1d_decimation(self):
+        # [0, 10, 20, 30, 40, 50, 60]
+        grid = FarField1DSearchGrid(start=0, stop=70, size=7, unit='deg')
+        decimated = grid.create_decimated_grid(3)
+        self.check_1d_grid_with_axes(decimated, np.array([0., 30., 60.]),
+                                     grid.axis_names, grid.units)
+        # Refinement with density 1 preserves the original grid points.
+        refined = grid.create_refined_grid_at((3,), density=1, span=2)
+        self.check_1d_grid_with_axes(refined, grid.axes[0][1:6],
+                                     grid.axis_names, grid.units)
+
 class Test2DGrids(unittest.TestCase):
     
     def check_2d_grid_with_axes(self, grid, axes_expected, axis_names_expected,
@@ -117,5 +129,16 @@ class Test2DGrids(unittest.TestCase):
                 g, axes_expected[i], grid.axis_names, grid.units
             )
 
+    def test_near_field_2d_refinement(self):
+        # x: [0, 1, 2, 3]
+        # y: [10, 12, 14, 16]
+        grid = NearField2DSearchGrid(start=(0, 10), stop=(4, 18), size=4)
+        refined = grid.create_refined_grid_at((1, 3), density=2, span=1)
+        axes_expected = (np.linspace(0, 2, 5), np.linspace(14, 16, 3))
+        self.check_2d_grid_with_axes(refined, axes_expected, grid.axis_names, grid.units)
+        decimated = grid.create_decimated_grid(2)
+        axes_expected = (np.array([0., 2.]), np.array([10., 14.]))
+        self.check_2d_grid_with_axes(decimated, axes_expected, grid.axis_names, grid.units)
+
 if __name__ == '__main__':
     unittest.main()
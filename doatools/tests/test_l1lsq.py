@@ -0,0 +1,344 @@
+import unittest
+import warnings
+import numpy as np
+import numpy.testing as npt
+from scipy.optimize import minimize
+from doatools.optim.l1lsq import L1RegularizedLeastSquaresProblem, \
+                                 L21RegularizedLeastSquaresProblem
+from doatools.model.arrays import UniformLinearArray, NestedArray
+from doatools.model.sources import FarField1DSourcePlacement
+from doatools.model.signals import ComplexStochasticSignal
+from doatools.model.snapshots import get_narrowband_snapshots
+from doatools.estimation.grid import FarField1DSearchGrid
+from doatools.estimation.sparse import SparseCovarianceMatching, \
+                                      GroupSparseEstimator
+
+class TestL1RegularizedLeastSquaresNative(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.m, self.k = 40, 60
+        self.A = rng.standard_normal((self.m, self.k))
+        x = np.zeros((self.k,))
+        x[[5, 20, 47]] = [1.0, -2.0, 0.5]
+        self.noise = 0.05 * rng.standard_normal((self.m,))
+        self.b = (self.A @ x + self.noise).reshape((-1, 1))
+
+    def _solve_reference(self, objective, nonnegative, constraints=()):
+        # Splits x = x+ - x- to obtain a smooth problem with bound constraints.
+        k = self.k
+        f = lambda z: objective(z if nonnegative else z[:k] - z[k:], z)
+        n = k if nonnegative else 2 * k
+        res = minimize(f, np.zeros((n,)), method='SLSQP',
+                       bounds=[(0, None)] * n, constraints=constraints,
+                       options={'ftol': 1e-12, 'maxiter': 1000})
+        return res.x if nonnegative else res.x[:k] - res.x[k:]
+
+    def test_penalizedl1(self):
+        l = 2.0
+        b = self.b[:, 0]
+        for nonnegative in [True, False]:
+            problem = L1RegularizedLeastSquaresProblem(self.m, self.k,
+                                                       'penalizedl1', nonnegative)
+            x = problem.solve(self.A, self.b, l, backend='native', tol=1e-10)
+            self.assertEqual(x.shape, (self.k, 1))
+            self.assertTrue(problem.last_info.converged)
+            x_ref = self._solve_reference(
+                lambda x, z: 0.5 * np.sum((self.A @ x - b)**2) + l * np.sum(z),
+                nonnegative
+            )
+            npt.assert_allclose(x[:, 0], x_ref, atol=1e-4)
+            if nonnegative:
+                self.assertTrue(np.all(x >= 0))
+            # Warm start from the solution.
+            n_iter = problem.last_info.n_iterations
+            problem.solve(self.A, self.b, l, backend='native', x0=x, tol=1e-10)
+            self.assertLess(problem.last_info.n_iterations, n_iter)
+
+    def test_constrainedl1(self):
+        l = 3.0
+        b = self.b[:, 0]
+        for nonnegative in [True, False]:
+            problem = L1RegularizedLeastSquaresProblem(self.m, self.k,
+                                                       'constrainedl1', nonnegative)
+            x = problem.solve(self.A, b, l, backend='native', tol=1e-10)
+            self.assertEqual(x.shape, (self.k,))
+            self.assertLessEqual(np.sum(np.abs(x)), l + 1e-8)
+            x_ref = self._solve_reference(
+                lambda x, z: np.sum((self.A @ x - b)**2), nonnegative,
+                [{'type': 'ineq', 'fun': lambda z: l - np.sum(z)}]
+            )
+            b_ref = np.sum((self.A @ x_ref - b)**2)
+            npt.assert_allclose(problem.last_info.objective, b_ref, rtol=1e-5)
+
+    def test_constrainedl2(self):
+        l = 0.5
+        # Feasible for both the nonnegative and the general cases.
+        x = np.zeros((self.k,))
+        x[[5, 20, 47]] = [1.0, 2.0, 0.5]
+        b = self.A @ x + self.noise
+        for nonnegative in [True, False]:
+            problem = L1RegularizedLeastSquaresProblem(self.m, self.k,
+                                                       'constrainedl2', nonnegative)
+            x = problem.solve(self.A, b, l, backend='native', tol=1e-8)
+            self.assertTrue(problem.last_info.converged)
+            self.assertLessEqual(np.linalg.norm(self.A @ x - b), l * (1 + 1e-3))
+            x_ref = self._solve_reference(
+                lambda x, z: np.sum(z), nonnegative,
+                [{'type': 'ineq',
+                  'fun': lambda z: l**2 - np.sum((self.A @ (z if nonnegative else z[:self.k] - z[self.k:]) - b)**2)}]
+            )
+            npt.assert_allclose(np.sum(np.abs(x)), np.sum(np.abs(x_ref)),
+                                rtol=1e-3)
+        # Infeasible
+        problem = L1RegularizedLeastSquaresProblem(self.m, self.k,
+                                                   'constrainedl2', True)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            x = problem.solve(self.A, b, 1e-6, backend='native', max_iter=200)
+        self.assertFalse(problem.last_info.converged)
+        self.assertEqual(problem.last_info.objective, np.inf)
+        self.assertIn('infeasible', str(w[-1].message))
+        npt.assert_array_equal(x, np.zeros((self.k,)))
+        # Feasible but not converged within the maximum number of iterations.
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            x = problem.solve(self.A, b, l, backend='native', max_iter=5)
+        self.assertFalse(problem.last_info.converged)
+        self.assertIn('Maximum number of iterations', str(w[-1].message))
+        self.assertTrue(np.any(x != 0))
+
+    def test_sparse_covariance_matching_constrainedl2(self):
+        wavelength = 1.0
+        ula = UniformLinearArray(8, wavelength / 2)
+        sources = FarField1DSourcePlacement([-0.5, 0.1, 0.45])
+        _, R = get_narrowband_snapshots(
+            ula, sources, wavelength, ComplexStochasticSignal(3, 1.0),
+            ComplexStochasticSignal(ula.size, 0.5), 200,
+            return_covariance=True, rng=np.random.default_rng(0))
+        grid = FarField1DSearchGrid(size=181)
+        solver_options = {'backend': 'native'}
+        for l in [2.0, 4.0]:
+            objectives = []
+            for reduction in ['none', 'hermitian', 'coarray']:
+                estimator = SparseCovarianceMatching(
+                    ula, wavelength, grid, formulation='constrainedl2',
+                    reduction=reduction)
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error')
+                    resolved, estimates = estimator.estimate(
+                        R, sources.size, l, solver_options=solver_options)
+                info = estimator._problem.last_info
+                self.assertTrue(info.converged)
+                self.assertTrue(resolved)
+                npt.assert_allclose(estimates.locations, sources.locations,
+                                    atol=0.02)
+                objectives.append(info.objective)
+            # The reductions do not change the problem.
+            npt.assert_allclose(objectives, objectives[0], rtol=1e-3)
+        # The residual cannot be smaller than that of the nonnegative least
+        # squares solution (about 1.63).
+        estimator = SparseCovarianceMatching(ula, wavelength, grid,
+                                             formulation='constrainedl2',
+                                             reduction='hermitian')
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            resolved, _ = estimator.estimate(R, sources.size, 1.0,
+                                             solver_options=solver_options)
+        self.assertFalse(resolved)
+        self.assertEqual(estimator._problem.last_info.n_iterations, 0)
+        self.assertIn('infeasible', str(w[-1].message))
+
+    def test_sparse_covariance_matching(self):
+        wavelength = 1.0
+        ula = UniformLinearArray(8, wavelength / 2)
+        grid = FarField1DSearchGrid(size=180)
+        sources = FarField1DSourcePlacement(grid.axes[0][[40, 90, 130]])
+        A = ula.steering_matrix(sources, wavelength)
+        R = A @ A.conj().T + 0.5 * np.eye(ula.size)
+        for formulation, l in [('penalizedl1', 0.5), ('constrainedl1', 3.0),
+                               ('constrainedl2', 0.1)]:
+            estimator = SparseCovarianceMatching(ula, wavelength, grid,
+                                                 formulation=formulation)
+            resolved, estimates = estimator.estimate(
+                R, 3, l, solver_options={'backend': 'native'})
+            self.assertTrue(resolved)
+            npt.assert_allclose(estimates.locations, sources.locations,
+                                err_msg=formulation)
+
+    def test_solve_path(self):
+        b = self.b[:, 0]
+        l_max = np.max(np.abs(self.A.T @ b))
+        # Unsorted on purpose.
+        ls = l_max * np.array([0.1, 1.5, 0.5, 0.02, 0.9, 0.2, 0.05])
+        for nonnegative in [True, False]:
+            problem = L1RegularizedLeastSquaresProblem(self.m, self.k,
+                                                       'penalizedl1', nonnegative)
+            xs, infos = problem.solve_path(self.A, b, ls, tol=1e-10)
+            xs_ns, _ = problem.solve_path(self.A, b, ls, screening=False,
+                                                 tol=1e-10)
+            for x, x_ns, l in zip(xs, xs_ns, ls):
+                x_ref = problem.solve(self.A, b, l, backend='native', tol=1e-10)
+                npt.assert_allclose(x, x_ref, atol=1e-6)
+                npt.assert_allclose(x_ns, x_ref, atol=1e-6)
+            npt.assert_array_equal(xs[1], np.zeros((self.k,)))
+            self.assertTrue(all(info.converged for info in infos))
+        # Constrained formulations.
+        for formulation, ls in [('constrainedl1', [3.0, 1.0, 2.0]),
+                                ('constrainedl2', [1.0, 0.6])]:
+            problem = L1RegularizedLeastSquaresProblem(self.m, self.k,
+                                                       formulation, False)
+            xs, infos = problem.solve_path(self.A, self.b, ls, tol=1e-8)
+            self.assertTrue(all(info.converged for info in infos))
+            for x, l in zip(xs, ls):
+                x_ref = problem.solve(self.A, self.b, l, backend='native',
+                                      tol=1e-8)
+                self.assertEqual(x.shape, (self.k, 1))
+                npt.assert_allclose(x, x_ref, atol=1e-5, err_msg=formulation)
+
+    def test_sparse_covariance_matching_path(self):
+        wavelength = 1.0
+        ula = UniformLinearArray(8, wavelength / 2)
+        grid = FarField1DSearchGrid(size=180)
+        sources = FarField1DSourcePlacement(grid.axes[0][[40, 90, 130]])
+        A = ula.steering_matrix(sources, wavelength)
+        R = A @ A.conj().T + 0.5 * np.eye(ula.size)
+        estimator = SparseCovarianceMatching(ula, wavelength, grid)
+        results = estimator.estimate_path(R, 3, [100.0, 0.5, 0.2])
+        self.assertEqual(len(results), 3)
+        # The solution is zero for large regularization parameters.
+        self.assertFalse(results[0][0])
+        for resolved, estimates in results[1:]:
+            self.assertTrue(resolved)
+            npt.assert_allclose(estimates.locations, sources.locations)
+
+    def test_sparse_covariance_matching_path_noisy(self):
+        # Warm started solves on a coherent covariance matching dictionary
+        # should be as accurate as tightly converged cold solves.
+        wavelength = 1.0
+        ula = UniformLinearArray(8, wavelength / 2)
+        sources = FarField1DSourcePlacement([-0.5, 0.1, 0.45])
+        _, R = get_narrowband_snapshots(
+            ula, sources, wavelength, ComplexStochasticSignal(3, 1.0),
+            ComplexStochasticSignal(ula.size, 0.5), 200,
+            return_covariance=True, rng=np.random.default_rng(0))
+        grid = FarField1DSearchGrid(size=181)
+        estimator = SparseCovarianceMatching(ula, wavelength, grid,
+                                             reduction='hermitian')
+        A = estimator._get_atom_matrix()
+        b, _ = estimator._get_observation(R, 0)
+        b = b.ravel()
+        problem = estimator._problem
+        ls = np.geomspace(5.0, 0.05, 8)
+        xs, infos = problem.solve_path(A, b, ls)
+        for l, x, info in zip(ls, xs, infos):
+            self.assertTrue(info.converged)
+            x_ref = problem.solve(A, b, l, backend='native', tol=1e-10,
+                                  max_iter=100000)
+            self.assertTrue(problem.last_info.converged)
+            # The dictionary is rank deficient so the minimizer is not unique
+            # for small l. Compare the objective values and check the
+            # optimality conditions instead.
+            obj = lambda v: 0.5 * np.sum((A @ v - b)**2) + l * np.sum(np.abs(v))
+            self.assertLessEqual(obj(x) - obj(x_ref), 1e-6 * obj(x_ref))
+            g = A.T @ (b - A @ x)
+            active = x != 0
+            self.assertTrue(np.all(np.abs(g[~active]) <= l * 1.01))
+            npt.assert_allclose(g[active], l * np.sign(x[active]), rtol=2e-3)
+
+    def test_sparse_covariance_matching_reduction(self):
+        wavelength = 1.0
+        grid = FarField1DSearchGrid(size=180)
+        sources = FarField1DSourcePlacement(grid.axes[0][[40, 90, 130]])
+        rng = np.random.default_rng(4)
+        for array in [UniformLinearArray(6, wavelength / 2),
+                      NestedArray(2, 3, wavelength / 2)]:
+            m = array.size
+            A = array.steering_matrix(sources, wavelength)
+            # A noisy Hermitian covariance matrix whose entries are not exactly
+            # redundant.
+            N = 0.1 * (rng.standard_normal((m, m)) + 1j * rng.standard_normal((m, m)))
+            R = A @ A.conj().T + 0.5 * np.eye(m) + N @ N.conj().T
+            for formulation, l in [('penalizedl1', 0.5), ('constrainedl1', 3.0)]:
+                spectra = []
+                for reduction in ['none', 'hermitian', 'coarray']:
+                    estimator = SparseCovarianceMatching(
+                        array, wavelength, grid, formulation=formulation,
+                        reduction=reduction
+                    )
+                    _, _, sp = estimator.estimate(
+                        R, 3, l, solver_options={'backend': 'native', 'tol': 1e-10},
+                        return_spectrum=True
+                    )
+                    spectra.append(sp)
+                n_rows = estimator._get_atom_matrix().shape[0]
+                # Unique nonnegative lags: 6 for the ULA and 9 for the nested
+                # array.
+                self.assertEqual(n_rows, 11 if m == 6 else 17)
+                npt.assert_allclose(spectra[1], spectra[0], atol=1e-6)
+                npt.assert_allclose(spectra[2], spectra[0], atol=1e-6)
+        estimator = SparseCovarianceMatching(array, wavelength, grid,
+                                             reduction='hermitian')
+        self.assertEqual(estimator._get_atom_matrix().shape, (m**2, grid.size + 1))
+        with self.assertRaises(ValueError):
+            SparseCovarianceMatching(array, wavelength, grid, reduction='lags')
+
+class TestL21RegularizedLeastSquaresNative(unittest.TestCase):
+
+    def test_optimality(self):
+        rng = np.random.default_rng(1)
+        m, k, n = 12, 80, 5
+        A = rng.standard_normal((m, k)) + 1j * rng.standard_normal((m, k))
+        X = np.zeros((k, n), dtype=np.complex_)
+        X[[3, 30, 61], :] = rng.standard_normal((3, n)) + 1j * rng.standard_normal((3, n))
+        B = A @ X + 0.05 * (rng.standard_normal((m, n)) + 1j * rng.standard_normal((m, n)))
+        l = 1.0
+        problem = L21RegularizedLeastSquaresProblem(m, k, n, True)
+        X_est = problem.solve(A, B, l, backend='native', tol=1e-10)
+        self.assertTrue(problem.last_info.converged)
+        # Optimality conditions of the group lasso.
+        G = A.conj().T @ (A @ X_est - B)
+        norms = np.linalg.norm(X_est, axis=1)
+        active = norms > 0
+        self.assertTrue(np.all(active[[3, 30, 61]]))
+        npt.assert_allclose(G[active], -l * X_est[active] / norms[active, np.newaxis],
+                            atol=1e-6)
+        self.assertTrue(np.all(np.linalg.norm(G[~active], axis=1) <= l + 1e-6))
+        # Warm starts from the last solution.
+        n_iter = problem.last_info.n_iterations
+        problem.solve(A, B, l, backend='native', tol=1e-10, warm_start=True)
+        self.assertLess(problem.last_info.n_iterations, n_iter)
+
+    def test_solve_path(self):
+        rng = np.random.default_rng(3)
+        m, k, n = 12, 80, 4
+        A = rng.standard_normal((m, k)) + 1j * rng.standard_normal((m, k))
+        X = np.zeros((k, n), dtype=np.complex_)
+        X[[7, 40], :] = rng.standard_normal((2, n)) + 1j * rng.standard_normal((2, n))
+        B = A @ X + 0.05 * (rng.standard_normal((m, n)) + 1j * rng.standard_normal((m, n)))
+        l_max = np.max(np.linalg.norm(A.conj().T @ B, axis=1))
+        ls = l_max * np.array([0.05, 0.5, 1.2, 0.2])
+        problem = L21RegularizedLeastSquaresProblem(m, k, n, True)
+        Xs, infos = problem.solve_path(A, B, ls, tol=1e-10)
+        self.assertTrue(all(info.converged for info in infos))
+        npt.assert_array_equal(Xs[2], np.zeros((k, n)))
+        for X_path, l in zip(Xs, ls):
+            X_ref = problem.solve(A, B, l, backend='native', tol=1e-10)
+            npt.assert_allclose(X_path, X_ref, atol=1e-6)
+
+    def test_group_sparse_estimator(self):
+        wavelength = 1.0
+        ula = UniformLinearArray(10, wavelength / 2)
+        grid = FarField1DSearchGrid(size=360)
+        sources = FarField1DSourcePlacement(grid.axes[0][[100, 180, 260]])
+        rng = np.random.default_rng(2)
+        S = rng.standard_normal((3, 10)) + 1j * rng.standard_normal((3, 10))
+        Y = ula.steering_matrix(sources, wavelength) @ S
+        estimator = GroupSparseEstimator(ula, wavelength, grid, 10)
+        resolved, estimates = estimator.estimate(
+            Y, 3, 1.0, solver_options={'backend': 'native'})
+        self.assertTrue(resolved)
+        npt.assert_allclose(estimates.locations, sources.locations)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from doatools.model.arrays import UniformLinearArray, NestedArray
+from doatools.model.sources import FarField1DSourcePlacement
+from doatools.estimation.ml import AMLEstimator, CMLEstimator, WSFEstimator
+from doatools.utils.math import projm
+
+class TestMLEstimators(unittest.TestCase):
+
+    def setUp(self):
+        self.wavelength = 1.0
+        self.ula = UniformLinearArray(10, self.wavelength / 2.0)
+        self.sources = FarField1DSourcePlacement(np.array([-0.4, 0.1, 0.5]))
+        A = self.ula.steering_matrix(self.sources, self.wavelength)
+        # Ideal covariance matrix at SNR = 0 dB with correlated sources.
+        P = np.array([[1.0, 0.3, 0.0], [0.3, 1.0, 0.2], [0.0, 0.2, 1.0]])
+        self.R = A @ P @ A.conj().T + np.eye(self.ula.size)
+        self.sources0 = FarField1DSourcePlacement(np.array([-0.35, 0.12, 0.46]))
+
+    def test_gradients(self):
+        k = self.sources0.size
+        h = 1e-6
+        for unit in ['rad', 'deg', 'sin']:
+            sources0 = FarField1DSourcePlacement(
+                np.rad2deg(self.sources0.locations) if unit == 'deg' else
+                np.sin(self.sources0.locations) if unit == 'sin' else
+                self.sources0.locations,
+                unit
+            )
+            for cls in [AMLEstimator, CMLEstimator, WSFEstimator]:
+                estimator = cls(self.ula, self.wavelength)
+                estimator._estimates = sources0[:]
+                estimator._prepare_opt_prob(sources0, self.R)
+                self.assertTrue(estimator._supports_gradient(sources0))
+                x = sources0.locations.copy()
+                f, g = estimator._eval_nll_and_grad(x, self.R, k)
+                g_fd = np.array([
+                    (estimator._eval_nll(x + d, self.R, k) -
+                     estimator._eval_nll(x - d, self.R, k)) / (2 * h)
+                    for d in np.eye(k) * h
+                ])
+                err_msg = '{0}, unit={1}'.format(cls.__name__, unit)
+                npt.assert_allclose(f, estimator._eval_nll(x, self.R, k),
+                                    err_msg=err_msg)
+                npt.assert_allclose(g, g_fd, rtol=1e-5, atol=1e-5,
+                                    err_msg=err_msg)
+
+    def test_objectives(self):
+        # Compares against the direct evaluations using projection matrices,
+        # including a rank deficient steering matrix.
+        m, k = self.ula.size, self.sources0.size
+        for x in [self.sources0.locations, np.array([0.1, 0.1, 0.3])]:
+            A = self.ula.steering_matrix(FarField1DSourcePlacement(x),
+                                         self.wavelength)
+            PA = projm(A, True)
+            PPA = np.eye(m) - PA
+            H = PA @ self.R @ PA + np.trace(PPA @ self.R) / (m - k) * PPA
+            for cls in [AMLEstimator, CMLEstimator, WSFEstimator]:
+                estimator = cls(self.ula, self.wavelength)
+                estimator._estimates = self.sources0[:]
+                estimator._prepare_opt_prob(self.sources0, self.R)
+                if cls is AMLEstimator:
+                    expected = np.linalg.slogdet(H)[1]
+                elif cls is CMLEstimator:
+                    expected = np.real(np.trace(PPA @ self.R))
+                else:
+                    expected = np.real(np.trace(PPA @ estimator._M))
+                npt.assert_allclose(estimator._eval_nll(x, self.R, k), expected,
+                                    rtol=1e-10, err_msg=cls.__name__)
+                npt.assert_allclose(
+                    estimator._eval_nll_and_grad(x, self.R, k)[0], expected,
+                    rtol=1e-10, err_msg=cls.__name__
+                )
+
+    def test_estimate(self):
+        for cls in [AMLEstimator, CMLEstimator, WSFEstimator]:
+            estimator = cls(self.ula, self.wavelength)
+            for use_gradient in [True, False]:
+                resolved, estimates = estimator.estimate(
+                    self.R, self.sources0, use_gradient=use_gradient)
+                self.assertTrue(resolved)
+                npt.assert_allclose(estimates.locations, self.sources.locations,
+                                    atol=1e-4)
+
+    def test_wsf_scoring(self):
+        estimator = WSFEstimator(self.ula, self.wavelength)
+        resolved, estimates = estimator.estimate(self.R, self.sources0,
+                                                 method='scoring')
+        self.assertTrue(resolved)
+        npt.assert_allclose(estimates.locations, self.sources.locations,
+                            atol=1e-8)
+        with self.assertRaises(ValueError):
+            estimator.estimate(self.R, self.sources0, method='newton')
+
+    def test_ap_and_mode(self):
+        # The initial locations are not used by these solvers.
+        sources0 = FarField1DSourcePlacement(np.zeros((3,)))
+        for cls in [CMLEstimator, WSFEstimator]:
+            estimator = cls(self.ula, self.wavelength)
+            for method in ['ap', 'mode']:
+                resolved, estimates = estimator.estimate(self.R, sources0,
+                                                         method=method)
+                self.assertTrue(resolved)
+                npt.assert_allclose(estimates.locations, self.sources.locations,
+                                    atol=1e-6, err_msg=method)
+        # Degrees
+        sources0 = FarField1DSourcePlacement(np.zeros((3,)), 'deg')
+        _, estimates = estimator.estimate(self.R, sources0, method='ap')
+        npt.assert_allclose(estimates.locations,
+                            np.rad2deg(self.sources.locations), atol=1e-4)
+        # MODE requires a ULA.
+        nested = NestedArray(3, 4, self.wavelength / 2.0)
+        with self.assertRaises(ValueError):
+            CMLEstimator(nested, self.wavelength).estimate(
+                np.eye(nested.size), sources0, method='mode')
+
+    def test_multistart(self):
+        # A poor initial guess that traps the local solver.
+        sources0 = FarField1DSourcePlacement(np.zeros((3,)))
+        estimator = CMLEstimator(self.ula, self.wavelength)
+        _, estimates = estimator.estimate(self.R, sources0)
+        self.assertGreater(np.max(np.abs(estimates.locations - self.sources.locations)), 1e-2)
+        resolved, estimates, report = estimator.estimate_multistart(
+            self.R, sources0, starts='music', n_starts=4, rng=0)
+        self.assertTrue(resolved)
+        npt.assert_allclose(estimates.locations, self.sources.locations,
+                            atol=1e-4)
+        self.assertEqual(len(report), 5)
+        self.assertIs(report[0].start, sources0)
+        best = min(r.objective for r in report if r.success)
+        npt.assert_allclose(estimator._eval_nll(estimates.locations, self.R, 3),
+                            best)
+        for r in report:
+            self.assertGreater(r.n_evaluations, 0)
+            self.assertGreaterEqual(r.elapsed, 0.0)
+        # Concurrent runs give identical results.
+        for starts in ['grid', 'random']:
+            results = [
+                estimator.estimate_multistart(self.R, sources0, starts=starts,
+                                              n_starts=3, n_workers=n_workers,
+                                              pool=pool, rng=1)
+                for n_workers, pool in [(1, 'thread'), (2, 'thread'), (2, 'process')]
+            ]
+            for r in results[1:]:
+                npt.assert_array_equal(r[1].locations, results[0][1].locations)
+                self.assertEqual([x.objective for x in r[2]],
+                                 [x.objective for x in results[0][2]])
+        # User specified starts.
+        _, estimates, report = estimator.estimate_multistart(
+            self.R, sources0, starts=[self.sources0])
+        self.assertEqual(len(report), 2)
+        npt.assert_allclose(estimates.locations, self.sources.locations,
+                            atol=1e-4)
+        with self.assertRaises(ValueError):
+            estimator.estimate_multistart(self.R, sources0, starts='beam')
+
+if __name__ == '__main__':
+    unittest.main()
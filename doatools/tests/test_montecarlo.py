@@ -0,0 +1,61 @@
+import unittest
+from functools import partial
+import numpy as np
+import numpy.testing as npt
+from doatools.model.arrays import UniformLinearArray
+from doatools.model.sources import FarField1DSourcePlacement
+from doatools.model.signals import ComplexStochasticSignal
+from doatools.estimation.grid import FarField1DSearchGrid
+from doatools.estimation.music import MUSIC
+from doatools.performance.montecarlo import run_monte_carlo
+
+class TestMonteCarlo(unittest.TestCase):
+
+    def setUp(self):
+        self.wavelength = 1.0
+        self.ula = UniformLinearArray(8, self.wavelength / 2)
+        self.sources = FarField1DSourcePlacement(np.array([-0.3, 0.4]))
+        self.source_signal = ComplexStochasticSignal(self.sources.size, 1.0)
+        self.noise_signal = ComplexStochasticSignal(self.ula.size, 1.0)
+        self.factory = partial(MUSIC, search_grid=FarField1DSearchGrid(size=1800))
+        self.sweep = [
+            {'noise_signal': ComplexStochasticSignal(self.ula.size, 10**(-snr/10))}
+            for snr in [-5, 10]
+        ]
+
+    def run_sweep(self, **kwargs):
+        return run_monte_carlo(
+            self.ula, self.sources, self.wavelength, self.source_signal,
+            self.noise_signal, 50, self.factory, self.sweep, 20, **kwargs
+        )
+
+    def test_reproducibility(self):
+        state = np.random.get_state()
+        aggregates1, seed = self.run_sweep(batch_size=7)
+        # The global random state is not affected.
+        npt.assert_array_equal(np.random.get_state()[1], state[1])
+        aggregates2, _ = self.run_sweep(seed=seed, batch_size=7, n_workers=2)
+        for a1, a2 in zip(aggregates1, aggregates2):
+            self.assertEqual(a1.n_trials, 20)
+            self.assertEqual(a1.n_resolved, a2.n_resolved)
+            npt.assert_array_equal(a1.mse, a2.mse)
+        # MSEs decrease as the SNR increases.
+        self.assertTrue(np.all(aggregates1[1].mse < aggregates1[0].mse))
+        self.assertEqual(aggregates1[1].resolution_probability, 1.0)
+
+    def test_callback(self):
+        history = []
+        def callback(i, aggregate):
+            history.append((i, aggregate.n_trials))
+        self.run_sweep(seed=0, batch_size=8, callback=callback)
+        self.assertEqual(history, [(0, 8), (0, 16), (0, 20), (1, 8), (1, 16), (1, 20)])
+
+    def test_invalid_sweep(self):
+        with self.assertRaises(ValueError):
+            run_monte_carlo(
+                self.ula, self.sources, self.wavelength, self.source_signal,
+                self.noise_signal, 50, self.factory, [{'snr': 10}], 20
+            )
+
+if __name__ == '__main__':
+    unittest.main()
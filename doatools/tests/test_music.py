@@ -1,9 +1,11 @@
 import unittest
-from doatools.model.arrays import UniformLinearArray
-from doatools.model.sources import FarField1DSourcePlacement
+from doatools.model.arrays import UniformLinearArray, UniformRectangularArray, NestedArray
+from doatools.model.sources import FarField1DSourcePlacement, FarField2DSourcePlacement
 from doatools.model.signals import ComplexStochasticSignal
-from doatools.estimation.grid import FarField1DSearchGrid
+from doatools.estimation.grid import FarField1DSearchGrid, FarField2DSearchGrid
 from doatools.estimation.music import MUSIC, RootMUSIC1D
+from doatools.estimation.min_norm import MinNorm
+from doatools.model.snapshots import get_narrowband_snapshots
 import numpy as np
 import numpy.testing as npt
 
@@ -38,5 +40,198 @@ class TestMUSIC(unittest.TestCase):
         self.assertTrue(resolved)
         npt.assert_allclose(estimates.locations, sources.locations, rtol=1e-6, atol=1e-8)
 
+    def test_music_batch(self):
+        np.random.seed(42)
+        ula = UniformLinearArray(8, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 3))
+        source_signal = ComplexStochasticSignal(sources.size, 1.0)
+        noise_signal = ComplexStochasticSignal(ula.size, 0.5)
+        Rs = np.stack([
+            get_narrowband_snapshots(ula, sources, self.wavelength,
+                                     source_signal, noise_signal, 50, True)[1]
+            for _ in range(6)
+        ])
+        grid = FarField1DSearchGrid(size=720)
+        for estimator in [MUSIC(ula, self.wavelength, grid),
+                          MinNorm(ula, self.wavelength, grid)]:
+            resolved, estimates, spectra = estimator.estimate_batch(
+                Rs, sources.size, return_spectrum=True)
+            self.assertEqual(resolved.shape, (Rs.shape[0],))
+            self.assertEqual(estimates.shape, (Rs.shape[0], sources.size))
+            for t in range(Rs.shape[0]):
+                r, est, sp = estimator.estimate(Rs[t], sources.size,
+                                                return_spectrum=True)
+                self.assertEqual(r, resolved[t])
+                npt.assert_allclose(spectra[t], sp)
+                if r:
+                    npt.assert_allclose(estimates[t], est.locations)
+
+    def test_root_music_batch(self):
+        np.random.seed(42)
+        ula = UniformLinearArray(12, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 4))
+        source_signal = ComplexStochasticSignal(sources.size, 1.0)
+        noise_signal = ComplexStochasticSignal(ula.size, 0.5)
+        Rs = np.stack([
+            get_narrowband_snapshots(ula, sources, self.wavelength,
+                                     source_signal, noise_signal, 50, True)[1]
+            for _ in range(6)
+        ])
+        rmusic = RootMUSIC1D(self.wavelength)
+        for unit in ['rad', 'deg', 'sin']:
+            resolved, estimates = rmusic.estimate_batch(Rs, sources.size, unit=unit)
+            self.assertTrue(np.all(resolved))
+            self.assertEqual(estimates.shape, (Rs.shape[0], sources.size))
+            for t in range(Rs.shape[0]):
+                r, est = rmusic.estimate(Rs[t], sources.size, unit=unit)
+                self.assertTrue(r)
+                npt.assert_allclose(estimates[t], est.locations)
+            npt.assert_allclose(
+                np.mean(estimates, axis=0), sources.as_unit(unit).locations,
+                atol=0.02 if unit != 'deg' else 1.0
+            )
+
+    def test_real_valued(self):
+        np.random.seed(42)
+        for array, sources, grid in [
+                (UniformLinearArray(9, self.wavelength / 2),
+                 FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 3)),
+                 FarField1DSearchGrid(size=720)),
+                (UniformRectangularArray(4, 5, self.wavelength / 2),
+                 FarField2DSourcePlacement(np.array([[0.2, 0.5], [-0.6, 0.3]])),
+                 FarField2DSearchGrid(size=(180, 45)))]:
+            source_signal = ComplexStochasticSignal(sources.size, 1.0)
+            noise_signal = ComplexStochasticSignal(array.size, 0.5)
+            Rs = np.stack([
+                get_narrowband_snapshots(array, sources, self.wavelength,
+                                         source_signal, noise_signal, 50, True)[1]
+                for _ in range(3)
+            ])
+            P = np.eye(array.size)[::-1]
+            Rs_fb = 0.5 * (Rs + P @ Rs.conj() @ P)
+            music_real = MUSIC(array, self.wavelength, grid,
+                               real_valued='auto', fft_spectrum='off')
+            music_complex = MUSIC(array, self.wavelength, grid,
+                                  fft_spectrum='off')
+            self.assertTrue(music_real.is_real_valued)
+            self.assertFalse(music_complex.is_real_valued)
+            # Real-valued MUSIC is equivalent to MUSIC with forward-backward
+            # averaging.
+            _, _, sp_batch = music_real.estimate_batch(Rs, sources.size,
+                                                       return_spectrum=True)
+            for t in range(Rs.shape[0]):
+                _, _, sp_real = music_real.estimate(Rs[t], sources.size,
+                                                    return_spectrum=True)
+                _, _, sp_fb = music_complex.estimate(Rs_fb[t], sources.size,
+                                                     return_spectrum=True)
+                npt.assert_allclose(sp_real, sp_fb, rtol=1e-8)
+                npt.assert_allclose(sp_batch[t], sp_fb, rtol=1e-8)
+        # Unitary root-MUSIC
+        ula = UniformLinearArray(10, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 3))
+        A = ula.steering_matrix(sources, self.wavelength)
+        R = A @ A.conj().T + 0.1 * np.eye(ula.size)
+        rmusic = RootMUSIC1D(self.wavelength)
+        resolved, estimates = rmusic.estimate(R, sources.size, unitary=True)
+        self.assertTrue(resolved)
+        npt.assert_allclose(estimates.locations, sources.locations, atol=1e-8)
+        resolved, estimates = rmusic.estimate_batch(R[np.newaxis], sources.size, unitary=True)
+        npt.assert_allclose(estimates[0], sources.locations, atol=1e-8)
+        # Arrays that are not centro-symmetric
+        nested = NestedArray(2, 3, self.wavelength / 2)
+        self.assertFalse(MUSIC(nested, self.wavelength, FarField1DSearchGrid(),
+                               real_valued='auto').is_real_valued)
+        with self.assertRaises(ValueError):
+            MUSIC(nested, self.wavelength, FarField1DSearchGrid(), real_valued=True)
+
+    def test_classical_music(self):
+        # The default (real_valued=False) reproduces the classical MUSIC
+        # spectrum computed from the eigendecomposition of the complex
+        # covariance matrix.
+        np.random.seed(7)
+        ula = UniformLinearArray(8, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 3))
+        source_signal = ComplexStochasticSignal(sources.size, 1.0)
+        noise_signal = ComplexStochasticSignal(ula.size, 0.5)
+        _, R = get_narrowband_snapshots(ula, sources, self.wavelength,
+                                        source_signal, noise_signal, 30, True)
+        grid = FarField1DSearchGrid(size=720)
+        A = ula.steering_matrix(grid.source_placement, self.wavelength)
+        _, E = np.linalg.eigh(R)
+        En = E[:, :-sources.size]
+        sp_expected = 1.0 / np.sum(np.abs(En.conj().T @ A)**2, axis=0)
+        for fft_spectrum in ['off', 'auto']:
+            music = MUSIC(ula, self.wavelength, grid, fft_spectrum=fft_spectrum)
+            self.assertFalse(music.is_real_valued)
+            _, _, sp = music.estimate(R, sources.size, return_spectrum=True)
+            npt.assert_allclose(sp, sp_expected, rtol=1e-8)
+
+    def test_music_fft(self):
+        ula = UniformLinearArray(12, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-0.7013, 0.5029, 4), 'sin')
+        A = ula.steering_matrix(sources, self.wavelength)
+        R = A @ A.conj().T + 0.01 * np.eye(ula.size)
+        Rs = np.stack((R, R + 0.1 * np.eye(ula.size)))
+        grid = FarField1DSearchGrid(size=1000, unit='sin')
+        estimator = MUSIC(ula, self.wavelength, grid)
+        estimator_direct = MUSIC(ula, self.wavelength, grid, fft_spectrum='off')
+        self.assertIsNotNone(estimator._get_fft_evaluator())
+        resolved, estimates, sp = estimator.estimate(R, 4, return_spectrum=True)
+        _, estimates_direct, sp_direct = estimator_direct.estimate(R, 4, return_spectrum=True)
+        self.assertTrue(resolved)
+        npt.assert_allclose(estimates.locations, estimates_direct.locations)
+        npt.assert_allclose(sp, sp_direct, rtol=1e-8)
+        _, estimates, sp = estimator.estimate_batch(Rs, 4, return_spectrum=True)
+        _, estimates_direct, sp_direct = estimator_direct.estimate_batch(Rs, 4, return_spectrum=True)
+        npt.assert_allclose(estimates, estimates_direct)
+        npt.assert_allclose(sp, sp_direct, rtol=1e-8)
+        # Noiseless covariance matrix with sources on the grid, where the
+        # spectrum is evaluated from the noise eigenvectors directly.
+        sources = FarField1DSourcePlacement(grid.axes[0][[100, 300, 650]], 'sin')
+        A = ula.steering_matrix(sources, self.wavelength)
+        resolved, estimates = estimator.estimate(A @ A.conj().T, 3)
+        self.assertTrue(resolved)
+        npt.assert_allclose(estimates.locations, sources.locations)
+
+    def test_music_hierarchical(self):
+        ura = UniformRectangularArray(6, 6, self.wavelength / 2)
+        sources = FarField2DSourcePlacement(
+            np.array([[-1.1, 0.3], [0.5, 0.8], [2.0, 1.1]])
+        )
+        A = ura.steering_matrix(sources, self.wavelength)
+        R = A @ A.conj().T + 0.1 * np.eye(ura.size)
+        grid = FarField2DSearchGrid(size=(360, 90))
+        estimator = MUSIC(ura, self.wavelength, grid)
+        estimator_h = MUSIC(ura, self.wavelength, grid,
+                            search_strategy='hierarchical')
+        resolved, estimates = estimator.estimate(R, 3)
+        resolved_h, estimates_h, sp = estimator_h.estimate(R, 3, return_spectrum=True)
+        self.assertTrue(resolved)
+        self.assertTrue(resolved_h)
+        npt.assert_allclose(estimates_h.locations, estimates.locations)
+        # Only a small portion of the spectrum should be evaluated.
+        self.assertEqual(sp.shape, grid.shape)
+        self.assertLess(np.mean(~np.isnan(sp)), 0.1)
+
+    def test_music_hierarchical_fallback(self):
+        # The peak of the full resolution spectrum near the coarse peak lies
+        # on the border of the evaluated region, so the exhaustive search is
+        # used instead.
+        ura = UniformRectangularArray(2, 6, self.wavelength / 2)
+        sources = FarField2DSourcePlacement(np.array([[-0.3, 0.2]]))
+        A = ura.steering_matrix(sources, self.wavelength)
+        R = A @ A.conj().T + 0.1 * np.eye(ura.size)
+        grid = FarField2DSearchGrid(size=(120, 30))
+        estimator = MUSIC(ura, self.wavelength, grid)
+        estimator_h = MUSIC(ura, self.wavelength, grid,
+                            search_strategy='hierarchical')
+        resolved, estimates, sp = estimator.estimate(R, 1, return_spectrum=True)
+        resolved_h, estimates_h, sp_h = estimator_h.estimate(
+            R, 1, return_spectrum=True)
+        self.assertTrue(resolved)
+        self.assertTrue(resolved_h)
+        npt.assert_allclose(estimates_h.locations, estimates.locations)
+        npt.assert_allclose(sp_h, sp)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
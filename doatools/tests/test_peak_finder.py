@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from doatools.model.arrays import UniformRectangularArray
+from doatools.model.sources import FarField2DSourcePlacement
+from doatools.estimation.grid import FarField2DSearchGrid
+from doatools.estimation.core import TopKPeakFinder, find_peaks_simple
+from doatools.estimation.music import MUSIC
+
+class TestTopKPeakFinder(unittest.TestCase):
+
+    def test_plateau_1d(self):
+        x = np.array([0., 1., 3., 3., 3., 1., 2., 0., 4., 4.])
+        npt.assert_array_equal(TopKPeakFinder('first')(x)[0], [2, 6])
+        npt.assert_array_equal(TopKPeakFinder('all')(x)[0], [2, 3, 4, 6])
+        npt.assert_array_equal(TopKPeakFinder('none')(x)[0], [6])
+
+    def test_plateau_2d(self):
+        x = np.zeros((4, 5))
+        x[1, 1] = x[1, 2] = 2.
+        x[3, 4] = 1.
+        npt.assert_array_equal(np.stack(TopKPeakFinder('first')(x)), [[1, 3], [1, 4]])
+        npt.assert_array_equal(np.stack(TopKPeakFinder('none')(x)), [[3], [4]])
+
+    def test_consistency(self):
+        np.random.seed(0)
+        X = np.random.randint(0, 4, size=(10, 8, 9)).astype(np.float_)
+        finder = TopKPeakFinder('all')
+        for x in X:
+            expected = find_peaks_simple(x)
+            actual = finder(x)
+            for a, b in zip(expected, actual):
+                npt.assert_array_equal(a, b)
+
+    def test_top_k_batch(self):
+        np.random.seed(1)
+        X = np.random.randn(6, 40)
+        finder = TopKPeakFinder()
+        resolved, indices = finder.find_top_k_batch(X, 3)
+        self.assertTrue(np.all(resolved))
+        for x, idx in zip(X, indices):
+            peaks = finder(x)[0]
+            expected = np.sort(peaks[np.argsort(x[peaks])[-3:]])
+            npt.assert_array_equal(idx, expected)
+        resolved, _ = finder.find_top_k_batch(X, 40)
+        self.assertFalse(np.any(resolved))
+
+    def test_estimator_2d(self):
+        wavelength = 1.0
+        ura = UniformRectangularArray(6, 6, wavelength / 2)
+        sources = FarField2DSourcePlacement(
+            np.array([[-0.5, 0.4], [0.6, 0.9]])
+        )
+        A = ura.steering_matrix(sources, wavelength)
+        R = A @ A.conj().T + 0.1 * np.eye(ura.size)
+        grid = FarField2DSearchGrid(size=(180, 45))
+        est_default = MUSIC(ura, wavelength, grid)
+        est_topk = MUSIC(ura, wavelength, grid, peak_finder=TopKPeakFinder())
+        resolved1, estimates1 = est_default.estimate(R, 2)
+        resolved2, estimates2 = est_topk.estimate(R, 2)
+        self.assertTrue(resolved1)
+        self.assertTrue(resolved2)
+        npt.assert_allclose(estimates1.locations, estimates2.locations)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import warnings
+from doatools.model.arrays import UniformLinearArray, NestedArray
+from doatools.model.sources import FarField1DSourcePlacement
+from doatools.estimation.grid import FarField1DSearchGrid
+from doatools.estimation.sparse import SBLEstimator
+import numpy as np
+import numpy.testing as npt
+
+class TestSBL(unittest.TestCase):
+
+    def setUp(self):
+        self.wavelength = 1.
+
+    def test_sbl_1d(self):
+        grid = FarField1DSearchGrid(size=361)
+        # On-grid sources at SNR = 0 dB with the ideal covariance matrix.
+        sources = FarField1DSourcePlacement(grid.axes[0][[60, 150, 170, 290]])
+        for array in [UniformLinearArray(12, self.wavelength / 2),
+                      NestedArray(3, 4, self.wavelength / 2)]:
+            A = array.steering_matrix(sources, self.wavelength)
+            R = A @ A.conj().T + np.eye(array.size)
+            for update in ['fixed_point', 'em']:
+                sbl = SBLEstimator(array, self.wavelength, grid, update=update,
+                                   max_iter=2000, tol=1e-4)
+                for sigma in [None, 1.0]:
+                    with warnings.catch_warnings():
+                        # The EM updates converge slowly.
+                        warnings.simplefilter('ignore')
+                        resolved, estimates, sp = sbl.estimate(
+                            R, sources.size, sigma=sigma, return_spectrum=True)
+                    self.assertTrue(resolved)
+                    npt.assert_allclose(estimates.locations, sources.locations)
+                    # The spectrum consists of the source powers.
+                    npt.assert_allclose(np.sum(sp), sources.size, rtol=0.1)
+
+    def test_sbl_batch(self):
+        rng = np.random.default_rng(42)
+        ula = UniformLinearArray(10, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/3, np.pi/4, 3))
+        A = ula.steering_matrix(sources, self.wavelength)
+        Rs = []
+        for _ in range(5):
+            N = (rng.standard_normal((ula.size, 40)) + 1j * rng.standard_normal((ula.size, 40))) * 0.3
+            S = rng.standard_normal((sources.size, 40)) + 1j * rng.standard_normal((sources.size, 40))
+            Y = A @ S + N
+            Rs.append(Y @ Y.conj().T / 40)
+        Rs = np.stack(Rs)
+        grid = FarField1DSearchGrid(size=360)
+        sbl = SBLEstimator(ula, self.wavelength, grid)
+        resolved, estimates, sps = sbl.estimate_batch(Rs, sources.size,
+                                                      return_spectrum=True)
+        for t in range(Rs.shape[0]):
+            r, est, sp = sbl.estimate(Rs[t], sources.size, return_spectrum=True)
+            self.assertEqual(r, resolved[t])
+            self.assertTrue(r)
+            npt.assert_allclose(estimates[t], est.locations)
+            # Grid points are pruned only when they are inactive for all the
+            # inputs, so tiny powers may differ.
+            npt.assert_allclose(sps[t], sp, atol=0.02 * np.max(sp))
+            npt.assert_allclose(est.locations, sources.locations, atol=0.02)
+
+    def test_sbl_invalid(self):
+        ula = UniformLinearArray(6, self.wavelength / 2)
+        grid = FarField1DSearchGrid(size=90)
+        with self.assertRaises(ValueError):
+            SBLEstimator(ula, self.wavelength, grid, update='newton')
+        with self.assertRaises(ValueError):
+            SBLEstimator(ula, self.wavelength, grid, chunk_size=10)
+        sbl = SBLEstimator(ula, self.wavelength, grid)
+        with self.assertRaises(ValueError):
+            sbl.estimate(np.eye(ula.size), 6)
+        with self.assertRaises(ValueError):
+            sbl.estimate(np.eye(ula.size), 2, refine_estimates=True)
+
+if __name__ == '__main__':
+    unittest.main()
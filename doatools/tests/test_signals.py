@@ -23,5 +23,43 @@ class TestSignals(unittest.TestCase):
         S = (S @ S.T.conj()) / n_snapshots
         self.assertLessEqual(np.linalg.norm(S - np.diag(amps**2), 'fro'), 1e-1)
 
+    def test_scalar_amplitude(self):
+        np.random.seed(42)
+        signal = RandomPhaseSignal(3, 2.0)
+        S = signal.emit(5)
+        npt.assert_allclose(np.abs(S), np.full((3, 5), 2.0))
+
+    def test_rng(self):
+        p = np.array([1., 2., 3.])
+        C = np.array([[2., 1., 0.], [1., 2., 1.], [0., 1., 2.]])
+        for signal in [ComplexStochasticSignal(3, 2.0),
+                       ComplexStochasticSignal(3, p),
+                       ComplexStochasticSignal(3, C),
+                       RandomPhaseSignal(3, p)]:
+            # Identical seeds lead to identical samples.
+            S1 = signal.emit(10, rng=np.random.default_rng(1))
+            S2 = signal.emit(10, rng=np.random.SeedSequence(1))
+            npt.assert_array_equal(S1, S2)
+            self.assertEqual(S1.shape, (3, 10))
+            # The global random state is not used.
+            state = np.random.get_state()
+            signal.emit(10, rng=2)
+            npt.assert_array_equal(np.random.get_state()[1], state[1])
+
+    def test_batch(self):
+        rng = np.random.default_rng(42)
+        C = np.array([[2., 1., 0.], [1., 2., 1.], [0., 1., 2.]])
+        n_snapshots = 500
+        for signal, C_expected in [
+                (ComplexStochasticSignal(3, C), C),
+                (ComplexStochasticSignal(3, np.array([1., 2., 3.])), np.diag([1., 2., 3.])),
+                (RandomPhaseSignal(3, np.array([1., 2., 3.])), np.diag([1., 4., 9.]))]:
+            S = signal.emit(n_snapshots, batch=20, rng=rng)
+            self.assertEqual(S.shape, (20, 3, n_snapshots))
+            # The samples of different batches are independent.
+            self.assertFalse(np.allclose(S[0], S[1]))
+            R = np.mean(S @ np.swapaxes(S, 1, 2).conj(), axis=0) / n_snapshots
+            self.assertLessEqual(np.linalg.norm(R - C_expected, 'fro'), 1e-1)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from doatools.model.arrays import UniformLinearArray
+from doatools.model.sources import FarField1DSourcePlacement
+from doatools.model.signals import ComplexStochasticSignal, RandomPhaseSignal
+from doatools.model.snapshots import get_narrowband_snapshots, \
+                                     get_narrowband_snapshots_batch, \
+                                     get_sample_covariance_batch
+
+class TestSnapshots(unittest.TestCase):
+
+    def setUp(self):
+        self.wavelength = 1.0
+        self.ula = UniformLinearArray(6, self.wavelength / 2)
+        self.sources = FarField1DSourcePlacement(np.array([-0.4, 0.1, 0.6]))
+        self.source_signal = ComplexStochasticSignal(
+            self.sources.size, np.array([1.0, 2.0, 0.5]))
+        self.noise_signal = ComplexStochasticSignal(self.ula.size, 0.3)
+        A = self.ula.steering_matrix(self.sources, self.wavelength)
+        self.R = A @ np.diag([1.0, 2.0, 0.5]) @ A.conj().T + 0.3 * np.eye(self.ula.size)
+
+    def test_batch_snapshots(self):
+        Y, R = get_narrowband_snapshots_batch(
+            self.ula, self.sources, self.wavelength, self.source_signal,
+            self.noise_signal, 20, 8, return_covariance=True, rng=0
+        )
+        self.assertEqual(Y.shape, (8, 6, 20))
+        self.assertEqual(R.shape, (8, 6, 6))
+        for t in range(8):
+            npt.assert_allclose(R[t], Y[t] @ Y[t].conj().T / 20)
+        # Also works with non-Gaussian signals.
+        Y = get_narrowband_snapshots_batch(
+            self.ula, self.sources, self.wavelength,
+            RandomPhaseSignal(self.sources.size), None, 20, 8
+        )
+        self.assertEqual(Y.shape, (8, 6, 20))
+        # A batch of one trial draws the same random numbers as a single
+        # trial generated with the same seed.
+        Y1 = get_narrowband_snapshots(
+            self.ula, self.sources, self.wavelength, self.source_signal,
+            self.noise_signal, 20, rng=np.random.default_rng(0)
+        )
+        Y = get_narrowband_snapshots_batch(
+            self.ula, self.sources, self.wavelength, self.source_signal,
+            self.noise_signal, 20, 1, rng=np.random.default_rng(0)
+        )
+        self.assertEqual(Y1.shape, (6, 20))
+        npt.assert_array_equal(Y[0], Y1)
+
+    def test_covariance_statistics(self):
+        n_snapshots = 10
+        batch = 20000
+        for method in ['snapshots', 'wishart']:
+            Rs = get_sample_covariance_batch(
+                self.ula, self.sources, self.wavelength, self.source_signal,
+                self.noise_signal, n_snapshots, batch, method=method, rng=42
+            )
+            self.assertEqual(Rs.shape, (batch, 6, 6))
+            npt.assert_allclose(Rs, np.swapaxes(Rs, 1, 2).conj(), atol=1e-12)
+            # E[R_hat] = R
+            npt.assert_allclose(np.mean(Rs, axis=0), self.R, atol=0.1)
+            # Var[R_hat_ij] = R_ii R_jj / N
+            var_expected = np.outer(np.diag(self.R), np.diag(self.R)).real / n_snapshots
+            npt.assert_allclose(np.var(Rs, axis=0), var_expected, rtol=0.1)
+
+    def test_wishart_singular(self):
+        # Fewer snapshots than sensors.
+        Rs = get_sample_covariance_batch(
+            self.ula, self.sources, self.wavelength, self.source_signal,
+            self.noise_signal, 3, 5, method='wishart', rng=0
+        )
+        self.assertTrue(np.all(np.linalg.matrix_rank(Rs, hermitian=True) == 3))
+        with self.assertRaises(ValueError):
+            get_sample_covariance_batch(
+                self.ula, self.sources, self.wavelength,
+                RandomPhaseSignal(self.sources.size), self.noise_signal, 10,
+                method='wishart'
+            )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from doatools.model.arrays import UniformLinearArray
+from doatools.model.perturbations import GainErrors
+from doatools.model.sources import FarField1DSourcePlacement
+from doatools.model.steering_cache import SteeringMatrixCache
+from doatools.estimation.grid import FarField1DSearchGrid
+from doatools.estimation.music import MUSIC
+from doatools.estimation.beamforming import MVDRBeamformer
+
+class TestSteeringMatrixCache(unittest.TestCase):
+
+    def setUp(self):
+        self.wavelength = 1.
+
+    def test_hits_and_misses(self):
+        cache = SteeringMatrixCache()
+        ula = UniformLinearArray(8, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-1, 1, 20))
+        A1 = cache.get(ula, sources, self.wavelength)
+        # Equal content but different objects.
+        A2 = cache.get(UniformLinearArray(8, self.wavelength / 2),
+                       FarField1DSourcePlacement(np.linspace(-1, 1, 20)),
+                       self.wavelength)
+        self.assertIs(A1, A2)
+        self.assertFalse(A1.flags.writeable)
+        npt.assert_allclose(A1, ula.steering_matrix(sources, self.wavelength))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # Different wavelength, units, and known perturbations.
+        cache.get(ula, sources, 2 * self.wavelength)
+        cache.get(ula, FarField1DSourcePlacement(np.linspace(-1, 1, 20), 'sin'),
+                  self.wavelength)
+        ula_p = UniformLinearArray(8, self.wavelength / 2,
+                                   perturbations=[GainErrors(np.full(8, 0.1), True)])
+        A3 = cache.get(ula_p, sources, self.wavelength)
+        npt.assert_allclose(A3, ula_p.steering_matrix(sources, self.wavelength))
+        # Unknown perturbations are ignored with perturbations='known'.
+        ula_u = UniformLinearArray(8, self.wavelength / 2,
+                                   perturbations=[GainErrors(np.full(8, 0.1))])
+        self.assertIs(cache.get(ula_u, sources, self.wavelength), A1)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+        self.assertEqual(len(cache), 4)
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes, cache.hits), (0, 0, 0))
+
+    def test_eviction(self):
+        ula = UniformLinearArray(8, self.wavelength / 2)
+        placements = [FarField1DSourcePlacement(np.linspace(-1, 1, 10) + 0.01 * i)
+                      for i in range(3)]
+        nbytes = 8 * 10 * 16
+        cache = SteeringMatrixCache(2 * nbytes)
+        cache.get(ula, placements[0], self.wavelength)
+        cache.get(ula, placements[1], self.wavelength)
+        # Access the first one so that the second one becomes the least
+        # recently used.
+        cache.get(ula, placements[0], self.wavelength)
+        cache.get(ula, placements[2], self.wavelength)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.nbytes, 2 * nbytes)
+        cache.get(ula, placements[0], self.wavelength)
+        self.assertEqual(cache.hits, 2)
+        cache.get(ula, placements[1], self.wavelength)
+        self.assertEqual(cache.misses, 4)
+        cache.max_bytes = nbytes
+        self.assertEqual(len(cache), 1)
+
+    def test_shared_by_estimators(self):
+        cache = SteeringMatrixCache()
+        ula = UniformLinearArray(8, self.wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-0.8, 0.6, 3))
+        A = ula.steering_matrix(sources, self.wavelength)
+        R = A @ A.conj().T + 0.1 * np.eye(ula.size)
+        grid = FarField1DSearchGrid()
+        music = MUSIC(ula, self.wavelength, grid, shared_cache=cache)
+        mvdr = MVDRBeamformer(ula, self.wavelength, grid, shared_cache=cache)
+        _, estimates_music = music.estimate(R, 3)
+        _, estimates_mvdr = mvdr.estimate(R, 3)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 1)
+        _, estimates = MUSIC(ula, self.wavelength, grid).estimate(R, 3)
+        npt.assert_allclose(estimates_music.locations, estimates.locations)
+        _, estimates = MVDRBeamformer(ula, self.wavelength, grid).estimate(R, 3)
+        npt.assert_allclose(estimates_mvdr.locations, estimates.locations)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from doatools.model.arrays import UniformLinearArray
+from doatools.model.sources import FarField1DSourcePlacement
+from doatools.model.signals import ComplexStochasticSignal
+from doatools.model.snapshots import get_narrowband_snapshots
+from doatools.estimation.grid import FarField1DSearchGrid
+from doatools.estimation.music import MUSIC
+from doatools.estimation.esprit import Esprit1D
+from doatools.estimation.streaming import StreamingCovariance, StreamingEstimator
+
+class TestStreamingCovariance(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        self.m = 5
+        self.Y = np.random.randn(self.m, 300) + 1j * np.random.randn(self.m, 300)
+
+    def feed(self, sc, callback):
+        n = 0
+        while n < self.Y.shape[1]:
+            b = np.random.randint(0, 40)
+            Yb = self.Y[:, n:n+b]
+            sc.update(Yb)
+            n += Yb.shape[1]
+            if n > 0:
+                callback(n, sc.get_covariance())
+
+    def test_exponential(self):
+        for beta in [1.0, 0.95]:
+            sc = StreamingCovariance(self.m, forgetting_factor=beta)
+            def check(n, R):
+                w = beta ** np.arange(n - 1, -1, -1)
+                R_expected = (self.Y[:, :n] * w) @ self.Y[:, :n].conj().T / np.sum(w)
+                npt.assert_allclose(R, R_expected)
+            self.feed(sc, check)
+            self.assertEqual(sc.n_snapshots, self.Y.shape[1])
+
+    def test_window(self):
+        for window_size in [1, 16, 50]:
+            sc = StreamingCovariance(self.m, 'window', window_size=window_size)
+            def check(n, R):
+                Y = self.Y[:, max(0, n - window_size):n]
+                npt.assert_allclose(R, Y @ Y.conj().T / Y.shape[1])
+            self.feed(sc, check)
+            self.assertEqual(sc.effective_snapshots, window_size)
+
+    def test_invalid(self):
+        sc = StreamingCovariance(self.m)
+        with self.assertRaises(RuntimeError):
+            sc.get_covariance()
+        with self.assertRaises(ValueError):
+            sc.update(np.zeros((self.m + 1, 2)))
+        with self.assertRaises(ValueError):
+            StreamingCovariance(self.m, 'window')
+
+class TestStreamingEstimator(unittest.TestCase):
+
+    def test_cadence(self):
+        np.random.seed(42)
+        wavelength = 1.0
+        ula = UniformLinearArray(8, wavelength / 2)
+        sources = FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 2))
+        source_signal = ComplexStochasticSignal(sources.size, 1.0)
+        noise_signal = ComplexStochasticSignal(ula.size, 0.1)
+        Y = get_narrowband_snapshots(ula, sources, wavelength, source_signal,
+                                     noise_signal, 250)
+        for estimator in [MUSIC(ula, wavelength, FarField1DSearchGrid()),
+                          Esprit1D(wavelength)]:
+            sc = StreamingCovariance(ula.size, 'window', window_size=100)
+            se = StreamingEstimator(estimator, 2, sc, 60)
+            results = []
+            for start in range(0, 250, 35):
+                results += se.push(Y[:, start:start+35])
+            self.assertEqual([n for n, _ in results], [60, 120, 180, 240])
+            for n, (resolved, estimates) in results:
+                Yw = Y[:, max(0, n - 100):n]
+                R = Yw @ Yw.conj().T / Yw.shape[1]
+                resolved_expected, estimates_expected = estimator.estimate(R, 2)
+                self.assertEqual(resolved, resolved_expected)
+                npt.assert_allclose(estimates.locations, estimates_expected.locations)
+
+if __name__ == '__main__':
+    unittest.main()
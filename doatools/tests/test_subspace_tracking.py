@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from doatools.model.arrays import UniformLinearArray
+from doatools.model.sources import FarField1DSourcePlacement
+from doatools.model.signals import ComplexStochasticSignal
+from doatools.model.snapshots import get_narrowband_snapshots
+from doatools.estimation.grid import FarField1DSearchGrid
+from doatools.estimation.music import MUSIC
+from doatools.estimation.min_norm import MinNorm
+from doatools.estimation.esprit import Esprit1D
+from doatools.estimation.subspace_tracking import PASTTracker, PASTdTracker
+
+def subspace_distance(E1, E2):
+    return np.linalg.norm(E1 @ E1.conj().T - E2 @ E2.conj().T, 2)
+
+class TestSubspaceTracking(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(42)
+        self.wavelength = 1.0
+        self.ula = UniformLinearArray(10, self.wavelength / 2)
+        self.sources = FarField1DSourcePlacement(np.linspace(-np.pi/4, np.pi/5, 3))
+        source_signal = ComplexStochasticSignal(self.sources.size, 1.0)
+        noise_signal = ComplexStochasticSignal(self.ula.size, 0.1)
+        self.Y = get_narrowband_snapshots(
+            self.ula, self.sources, self.wavelength, source_signal,
+            noise_signal, 2000
+        )
+        A = self.ula.steering_matrix(self.sources, self.wavelength)
+        self.Es_true, _ = np.linalg.qr(A)
+
+    def test_convergence(self):
+        for tracker in [PASTTracker(self.ula.size, 3, 0.995),
+                        PASTdTracker(self.ula.size, 3, 0.995)]:
+            tracker.update(self.Y[:, :1000])
+            for i in range(1000, 2000, 100):
+                tracker.update(self.Y[:, i:i+100])
+            self.assertEqual(tracker.n_snapshots, 2000)
+            Es = tracker.signal_subspace
+            npt.assert_allclose(Es.conj().T @ Es, np.eye(3), atol=1e-10)
+            self.assertLess(subspace_distance(Es, self.Es_true), 0.1)
+            En = tracker.noise_subspace
+            npt.assert_allclose(Es.conj().T @ En, np.zeros((3, 7)), atol=1e-10)
+        # PASTd also tracks the eigenvalues.
+        self.assertTrue(np.all(tracker.eigenvalues > 1.0))
+
+    def test_estimators(self):
+        tracker = PASTTracker(self.ula.size, 3, 0.995)
+        tracker.update(self.Y)
+        Es = tracker.signal_subspace
+        grid = FarField1DSearchGrid(size=3600)
+        for estimator in [MUSIC(self.ula, self.wavelength, grid, fft_spectrum='interp'),
+                          MUSIC(self.ula, self.wavelength, grid, fft_spectrum='off'),
+                          MinNorm(self.ula, self.wavelength, grid),
+                          Esprit1D(self.wavelength)]:
+            resolved, estimates = estimator.estimate_from_subspace(Es)
+            self.assertTrue(resolved)
+            npt.assert_allclose(np.sort(estimates.locations),
+                                self.sources.locations, atol=0.02)
+        # With the exact signal subspace, the results should be identical to
+        # those obtained from the covariance matrix.
+        R = self.Y @ self.Y.conj().T / self.Y.shape[1]
+        _, E = np.linalg.eigh(R)
+        for estimator in [MUSIC(self.ula, self.wavelength, grid, fft_spectrum='off'),
+                          MinNorm(self.ula, self.wavelength, grid),
+                          Esprit1D(self.wavelength)]:
+            _, estimates = estimator.estimate_from_subspace(E[:, -3:])
+            _, estimates_expected = estimator.estimate(R, 3)
+            npt.assert_allclose(estimates.locations, estimates_expected.locations)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            PASTTracker(4, 4)
+        with self.assertRaises(ValueError):
+            PASTdTracker(4, 2, forgetting_factor=1.5)
+        with self.assertRaises(ValueError):
+            PASTTracker(4, 2).update(np.zeros((3, 2)))
+
+if __name__ == '__main__':
+    unittest.main()
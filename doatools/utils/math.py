@@ -71,18 +71,44 @@ def cartesian(*xi):
     yi = np.meshgrid(*xi, indexing='ij')
     return np.vstack([y.flatten() for y in yi]).T
 
-def randcn(shape):
+def get_rng(rng):
+    """Converts the input into a random number generator.
+
+    Args:
+        rng: A :class:`~numpy.random.Generator`, a
+            :class:`~numpy.random.SeedSequence`, an integer seed, or ``None``.
+
+    Returns:
+        A :class:`~numpy.random.Generator`, or ``None`` if ``rng`` is ``None``,
+        in which case the global random state of :mod:`numpy.random` should
+        be used.
+    """
+    if rng is None or isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+def randcn(shape, rng=None):
     """Samples from complex circularly-symmetric normal distribution.
 
     Args:
         shape (tuple): Shape of the output.
+        rng: A :class:`~numpy.random.Generator` (or anything accepted by
+            :meth:`get_rng`) used to draw the samples. Default value is
+            ``None``, meaning that the global random state of
+            :mod:`numpy.random` is used.
     
     Returns:
         ~numpy.ndarray: A complex :class:`~numpy.ndarray` containing the
         samples.
     """
-    x = 1j * np.random.randn(*shape)
-    x += np.random.randn(*shape)
+    rng = get_rng(rng)
+    if rng is None:
+        x = 1j * np.random.randn(*shape)
+        x += np.random.randn(*shape)
+    else:
+        # Draws the real and imaginary parts as adjacent floats, which avoids
+        # allocating temporary arrays.
+        x = rng.standard_normal(tuple(shape) + (2,)).view(np.complex_)[..., 0]
     x *= np.sqrt(0.5)
     return x
 
@@ -28,11 +28,13 @@ setup(
     packages=find_packages(exclude=('docs',)),
     python_requires='>=3.5',
     install_requires=[
-        'numpy>=1.14.0',
+        'numpy>=1.17',
         'scipy>=1.1.0',
-        'matplotlib>=2.1.0',
-        'cvxpy>=1.0.8'
+        'matplotlib>=2.1.0'
     ],
+    extras_require={
+        'cvxpy': ['cvxpy>=1.0.8']
+    },
     zip_safe=False,
     classifiers=[
         'Development Status :: 3 - Alpha',